@@ -0,0 +1,22 @@
+"""Benchmarks for the GutenTAG generation pipeline.
+
+The benchmarks are not part of the distributed package. Run them from the repository root, e.g.:
+
+    python -m benchmarks.convolution
+
+The ``benchmarks.suite`` module runs all generation steps and stores their wall time and peak memory as JSON (in
+``benchmarks/results`` by default) to compare releases.
+"""
+
+import time
+from typing import Callable
+
+
+def best_of(func: Callable[[], object], repeat: int = 5) -> float:
+    """Returns the best wall-clock time (in seconds) of ``repeat`` executions of ``func``."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
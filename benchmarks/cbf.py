@@ -0,0 +1,63 @@
+"""Compares the throughput of the vectorized and the legacy (loop-based) cylinder-bell-funnel generator.
+
+Short patterns are the worst case for the legacy implementation, because it draws and writes one pattern per loop
+iteration.
+
+    python -m benchmarks.cbf [--length 1000000]
+"""
+
+import argparse
+from typing import List, Dict
+
+import numpy as np
+
+from benchmarks import best_of
+from gutenTAG.base_oscillations.cylinder_bell_funnel import cylinder_bell_funnel
+
+PATTERN_LENGTHS = [5, 10, 50, 100, 1000]
+
+
+def run(length: int = 1000000, repeat: int = 3) -> List[Dict]:
+    results = []
+    for avg_pattern_length in PATTERN_LENGTHS:
+        timings = {}
+        for method in ["legacy", "vectorized"]:
+            timings[method] = best_of(
+                lambda: cylinder_bell_funnel(
+                    np.random.default_rng(42),
+                    length=length,
+                    avg_pattern_length=avg_pattern_length,
+                    method=method,
+                ),
+                repeat,
+            )
+        results.append(
+            {
+                "length": length,
+                "avg_pattern_length": avg_pattern_length,
+                **timings,
+            }
+        )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--length", type=int, default=1000000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"length={args.length}")
+    print(
+        f"{'pattern length':>15} {'legacy [ms]':>12} {'vectorized [ms]':>16} {'legacy [Mpts/s]':>16} "
+        f"{'vectorized [Mpts/s]':>20}"
+    )
+    for r in run(args.length, args.repeat):
+        print(
+            f"{r['avg_pattern_length']:>15} {r['legacy'] * 1000:>12.1f} {r['vectorized'] * 1000:>16.1f} "
+            f"{r['length'] / r['legacy'] / 1e6:>16.2f} {r['length'] / r['vectorized'] / 1e6:>20.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Measures the time and the peak memory of consolidating a wide dataset for both memory orders of the output buffer.
+
+python -m benchmarks.consolidator [--length 100000] [--channels 64]
+"""
+
+import argparse
+import tracemalloc
+from typing import Dict, List
+
+from benchmarks import best_of
+from gutenTAG.config import ConfigParser
+from gutenTAG.consolidator import Consolidator
+from gutenTAG.utils.types import GenerationContext
+
+
+def _config(length: int, channels: int) -> Dict:
+    return {
+        "timeseries": [
+            {
+                "name": "wide",
+                "length": length,
+                "base-oscillations": [
+                    {"kind": "random-walk", "variance": 0.05, "offset": 1.0}
+                ]
+                * channels,
+                "anomalies": [
+                    {
+                        "length": 100,
+                        "channel": c,
+                        "kinds": [{"kind": "platform", "value": 0}],
+                    }
+                    for c in range(channels)
+                ],
+            }
+        ]
+    }
+
+
+def run(length: int = 100000, channels: int = 64, repeat: int = 3) -> List[Dict]:
+    ((bos, anomalies, _, _),) = ConfigParser().parse(_config(length, channels))
+    results = []
+    for order in Consolidator.MEMORY_ORDERS:
+
+        def consolidate() -> None:
+            Consolidator(bos, anomalies, order=order).generate(
+                GenerationContext(GenerationContext.re_seed(42))
+            )
+
+        time = best_of(consolidate, repeat)
+        tracemalloc.start()
+        consolidate()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        results.append({"order": order, "time": time, "peak_memory": peak})
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--length", type=int, default=100000)
+    parser.add_argument("--channels", type=int, default=64)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    size = args.length * args.channels * 8 / 2**20
+    print(f"length={args.length}, channels={args.channels}, output={size:.1f} MiB")
+    print(f"{'order':>5} {'time [ms]':>10} {'peak [MiB]':>11}")
+    for r in run(args.length, args.channels, args.repeat):
+        print(
+            f"{r['order']:>5} {r['time'] * 1000:>10.1f} {r['peak_memory'] / 2**20:>11.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Compares the direct and the FFT-based convolution used to smooth random walks and MLS signals.
+
+The table shows the runtime of both methods for increasing filter sizes. The crossover point (where the FFT-based
+convolution becomes faster) is used as ``FFT_FILTER_SIZE_THRESHOLD`` for the automatic method selection.
+
+    python -m benchmarks.convolution [--length 100000]
+"""
+
+import argparse
+from typing import List, Dict
+
+import numpy as np
+from scipy.stats import norm
+
+from benchmarks import best_of
+from gutenTAG.base_oscillations.utils.convolution import (
+    convolve_valid,
+    FFT_FILTER_SIZE_THRESHOLD,
+)
+
+FILTER_SIZES = [8, 16, 32, 64, 128, 256, 512, 1024, 4096, 10000]
+
+
+def run(length: int = 100000, repeat: int = 3) -> List[Dict]:
+    rng = np.random.default_rng(42)
+    results = []
+    for filter_size in FILTER_SIZES:
+        data = rng.choice([-1.0, 0.0, 1.0], size=length + filter_size - 1).cumsum()
+        gaussian = norm.pdf(np.linspace(-1.5, 1.5, filter_size))
+        kernel = gaussian / gaussian.sum()
+        direct = best_of(lambda: convolve_valid(data, kernel, "direct"), repeat)
+        fft = best_of(lambda: convolve_valid(data, kernel, "fft"), repeat)
+        max_error = np.abs(
+            convolve_valid(data, kernel, "direct") - convolve_valid(data, kernel, "fft")
+        ).max()
+        results.append(
+            {
+                "length": length,
+                "filter_size": filter_size,
+                "direct": direct,
+                "fft": fft,
+                "max_abs_error": float(max_error),
+            }
+        )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--length", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"length={args.length}, auto threshold={FFT_FILTER_SIZE_THRESHOLD} taps")
+    print(
+        f"{'filter size':>12} {'direct [ms]':>12} {'fft [ms]':>12} {'max abs error':>14}"
+    )
+    for r in run(args.length, args.repeat):
+        print(
+            f"{r['filter_size']:>12} {r['direct'] * 1000:>12.2f} {r['fft'] * 1000:>12.2f} "
+            f"{r['max_abs_error']:>14.2e}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Compares the neurokit2 simulation with the beat-template engine of the ECG base oscillation.
+
+python -m benchmarks.ecg [--length 20000] [--methods simple ecgsyn]
+"""
+
+import argparse
+import time
+from typing import Dict, List, Sequence
+
+import numpy as np
+
+from benchmarks import best_of
+from gutenTAG.base_oscillations.ecg import ecg, _beat_template, ECG_ENGINES
+
+
+def run(
+    length: int = 20000,
+    methods: Sequence[str] = ("simple", "ecgsyn"),
+    repeat: int = 3,
+) -> List[Dict]:
+    results = []
+    for method in methods:
+        for engine in ECG_ENGINES:
+
+            def generate() -> None:
+                ecg(np.random.default_rng(42), length, 1.2, 1.0, method, engine=engine)
+
+            # the first call includes the simulation of the beat template (template engine only)
+            _beat_template.cache_clear()
+            start = time.perf_counter()
+            generate()
+            cold = time.perf_counter() - start
+            results.append(
+                {
+                    "method": method,
+                    "engine": engine,
+                    "cold": cold,
+                    "warm": best_of(generate, repeat),
+                }
+            )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--length", type=int, default=20000)
+    parser.add_argument("--methods", nargs="+", default=["simple", "ecgsyn"])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"length={args.length}")
+    print(f"{'method':>7} {'engine':>9} {'first call [ms]':>16} {'warm [ms]':>10}")
+    for r in run(args.length, args.methods, args.repeat):
+        print(
+            f"{r['method']:>7} {r['engine']:>9} {r['cold'] * 1000:>16.1f} {r['warm'] * 1000:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
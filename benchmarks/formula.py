@@ -0,0 +1,93 @@
+"""Compares a naive recursive evaluation of the formula with the compiled formula plan on long channels.
+
+python -m benchmarks.formula [--length 10000000]
+"""
+
+import argparse
+from typing import Dict, List
+
+import numpy as np
+
+from benchmarks import best_of
+from gutenTAG.base_oscillations.formula import (  # type: ignore
+    AggregationType,
+    FormulaPlan,
+    OperationType,
+)
+
+
+# (c0 - mean(c0)) / std(c0) * (c1 - mean(c1)) / std(c1) + (c0 - mean(c0)) / std(c0); mean(c) = sum(c) / length
+def _standardize(channel: int, length: int) -> Dict:
+    return {
+        "base": {
+            "base": channel,
+            "operation": {
+                "kind": "-",
+                "operand": {
+                    "base": {"base": channel, "aggregation": {"kind": "sum"}},
+                    "operation": {"kind": "/", "operand": float(length)},
+                },
+            },
+        },
+        "operation": {
+            "kind": "/",
+            "operand": {"base": channel, "aggregation": {"kind": "std"}},
+        },
+    }
+
+
+def _formula(length: int) -> Dict:
+    return {
+        "base": {
+            "base": _standardize(0, length),
+            "operation": {"kind": "*", "operand": _standardize(1, length)},
+        },
+        "operation": {"kind": "+", "operand": _standardize(0, length)},
+    }
+
+
+def _evaluate(formula: Dict, channels: List[np.ndarray]) -> np.ndarray:
+    # reference: evaluates every node separately and materializes every intermediate result
+    base = formula["base"]
+    if isinstance(base, dict):
+        values = _evaluate(base, channels)
+    else:
+        values = channels[base]
+    if "operation" in formula:
+        operand = formula["operation"]["operand"]
+        if isinstance(operand, dict):
+            operand = _evaluate(operand, channels)
+        return OperationType(formula["operation"]["kind"])(values, np.array(operand))
+    if "aggregation" in formula:
+        aggregation = formula["aggregation"]
+        return AggregationType(aggregation["kind"])(values, aggregation.get("axis"))
+    return values
+
+
+def run(length: int = 10000000, repeat: int = 5) -> List[Dict]:
+    rng = np.random.default_rng(42)
+    channels = [rng.normal(size=length), rng.normal(size=length)]
+    formula = _formula(length)
+    plan = FormulaPlan.compile(formula)
+    tree = best_of(lambda: _evaluate(formula, channels), repeat)
+    compiled = best_of(lambda: plan.execute(channels), repeat)
+    return [
+        {"method": "tree", "time": tree},
+        {"method": "plan", "time": compiled, "steps": len(plan.steps)},
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--length", type=int, default=10000000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"length={args.length}")
+    print(f"{'method':>6} {'time [ms]':>10}")
+    for r in run(args.length, args.repeat):
+        print(f"{r['method']:>6} {r['time'] * 1000:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
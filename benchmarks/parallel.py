@@ -0,0 +1,97 @@
+"""Measures the parallel generation (process pool) and the size of the task payloads sent to the workers.
+
+Each task ships the raw time series configuration instead of the built generator objects; the workers write their
+outputs themselves and send back only the overview configuration and add-on data.
+
+    python -m benchmarks.parallel [--datasets 32] [--length 100000] [--jobs 1 2 4]
+"""
+
+import argparse
+import pickle
+import tempfile
+from dataclasses import replace
+from pathlib import Path
+from typing import Dict, List
+
+from benchmarks import best_of
+from gutenTAG import GutenTAG
+from gutenTAG.addons import import_addons
+from gutenTAG.gutenTAG import _GenerationContext
+
+
+def _config(datasets: int, length: int) -> Dict:
+    return {
+        "timeseries": [
+            {
+                "name": f"ts-{i}",
+                "length": length,
+                "semi-supervised": True,
+                "supervised": True,
+                "base-oscillations": [
+                    {"kind": "random-walk", "variance": 0.05},
+                    {"kind": "sine", "variance": 0.05},
+                ],
+                "anomalies": [
+                    {
+                        "length": 100,
+                        "channel": 0,
+                        "kinds": [{"kind": "platform", "value": 0}],
+                    }
+                ],
+            }
+            for i in range(datasets)
+        ]
+    }
+
+
+def payload_sizes(config: Dict) -> Dict[str, int]:
+    """Pickled size (in bytes) of a single task: generator objects vs. raw configuration."""
+    gt = GutenTAG.from_dict(config)
+    ctx = _GenerationContext(
+        addons=[addon() for addon in import_addons(["TimeEvalAddOn"])]
+    )
+    ts, raw_config = gt._timeseries[0], gt._overview.datasets[0]
+    objects = pickle.dumps((ctx, ts, raw_config))
+    worker_ctx = replace(ctx, addons=(), addon_names=("TimeEvalAddOn",))
+    configs = pickle.dumps((worker_ctx, ts.dataset_name, raw_config))
+    return {"objects": len(objects), "config": len(configs)}
+
+
+def run(
+    datasets: int = 32,
+    length: int = 100000,
+    jobs: List[int] = (1, 2, 4),
+    repeat: int = 1,
+) -> List[Dict]:
+    config = _config(datasets, length)
+    results = []
+    for n_jobs in jobs:
+
+        def generate() -> None:
+            with tempfile.TemporaryDirectory() as folder:
+                GutenTAG.from_dict(
+                    config, n_jobs=n_jobs, seed=42, addons=["TimeEvalAddOn"]
+                ).generate(output_folder=Path(folder), output_format="npy")
+
+        results.append({"n_jobs": n_jobs, "time": best_of(generate, repeat)})
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--datasets", type=int, default=32)
+    parser.add_argument("--length", type=int, default=100000)
+    parser.add_argument("--jobs", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--repeat", type=int, default=1)
+    args = parser.parse_args()
+
+    sizes = payload_sizes(_config(1, args.length))
+    print(f"task payload: objects={sizes['objects']} B, config={sizes['config']} B")
+    print(f"datasets={args.datasets}, length={args.length}")
+    print(f"{'n_jobs':>7} {'time [s]':>9}")
+    for r in run(args.datasets, args.length, args.jobs, args.repeat):
+        print(f"{r['n_jobs']:>7} {r['time']:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
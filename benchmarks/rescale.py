@@ -0,0 +1,73 @@
+"""Compares scikit-learn's MinMaxScaler with the NumPy rescale kernel used by the random walk, MLS, and anomalies.
+
+Small signals correspond to single anomalies (where the per-call overhead dominates), large signals to base
+oscillations.
+
+    python -m benchmarks.rescale [--repeat 5]
+"""
+
+import argparse
+from typing import List, Dict
+
+import numpy as np
+
+from benchmarks import best_of
+from gutenTAG.base_oscillations.utils.rescale import min_max_rescale
+
+LENGTHS = [100, 1000, 10000, 100000, 1000000]
+
+
+def run(repeat: int = 5) -> List[Dict]:
+    from sklearn.preprocessing import MinMaxScaler
+
+    rng = np.random.default_rng(42)
+    feature_range = (-1.0, 1.0)
+    results = []
+    for length in LENGTHS:
+        data = rng.normal(size=length).cumsum()
+        buffer = np.empty_like(data)
+        sklearn = best_of(
+            lambda: MinMaxScaler(feature_range=feature_range)
+            .fit_transform(data.reshape(-1, 1))
+            .reshape(-1),
+            repeat,
+        )
+        copy = best_of(lambda: min_max_rescale(data, feature_range), repeat)
+        inplace = best_of(
+            lambda: min_max_rescale(data, feature_range, out=buffer), repeat
+        )
+        identical = np.array_equal(
+            MinMaxScaler(feature_range=feature_range)
+            .fit_transform(data.reshape(-1, 1))
+            .reshape(-1),
+            min_max_rescale(data, feature_range),
+        )
+        results.append(
+            {
+                "length": length,
+                "sklearn": sklearn,
+                "numpy": copy,
+                "numpy_out": inplace,
+                "identical": bool(identical),
+            }
+        )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(
+        f"{'length':>10} {'sklearn [us]':>13} {'numpy [us]':>11} {'numpy out= [us]':>16} {'identical':>10}"
+    )
+    for r in run(args.repeat):
+        print(
+            f"{r['length']:>10} {r['sklearn'] * 1e6:>13.1f} {r['numpy'] * 1e6:>11.1f} "
+            f"{r['numpy_out'] * 1e6:>16.1f} {str(r['identical']):>10}"
+        )
+
+
+if __name__ == "__main__":
+    main()
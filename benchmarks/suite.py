@@ -0,0 +1,388 @@
+"""Benchmark suite measuring the wall time and the peak memory of all generation steps and storing the results as JSON.
+
+Suites:
+
+- ``base-oscillations``: every registered base oscillation kind for lengths from 1e3 to 1e7 points
+- ``anomalies``: every anomaly kind injected into a fitting base oscillation
+- ``channels``: multichannel scaling of a single time series
+- ``n-jobs``: parallel generation of many time series with different numbers of worker processes
+- ``corpus``: full generation of ``generation_configs/benchmark-datasets.yaml`` with CSV output
+
+The peak memory is the maximum of the memory traced by ``tracemalloc`` in the main process (the worker processes of
+the ``n-jobs`` suite are not included). Compare two result files to spot regressions between releases:
+
+    python -m benchmarks.suite [--suites base-oscillations anomalies] [--max-length 100000] [--output results.json]
+    python -m benchmarks.suite --compare baseline.json results.json
+"""
+
+import argparse
+import json
+import platform
+import sys
+import tempfile
+import tracemalloc
+from dataclasses import dataclass, field
+from functools import partial
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from benchmarks import best_of
+from gutenTAG import GutenTAG, __version__
+from gutenTAG.anomalies import AnomalyKind
+from gutenTAG.base_oscillations import BaseOscillation
+from gutenTAG.config import ConfigParser
+from gutenTAG.generator import TimeSeries
+from gutenTAG.utils.types import GenerationContext
+
+SUITES = ("base-oscillations", "anomalies", "channels", "n-jobs", "corpus")
+LENGTHS = (1000, 10000, 100000, 1000000, 10000000)
+CORPUS_CONFIG = Path("generation_configs/benchmark-datasets.yaml")
+RESULTS_FOLDER = Path("benchmarks/results")
+
+# parameters of the base oscillations that have required parameters
+BO_PARAMETERS: Dict[str, Dict[str, Any]] = {
+    "formula": {"formula": {"base": 0, "operation": {"kind": "*", "operand": 2.0}}},
+    "custom-input": {"use-column-test": "value"},
+}
+# anomaly kind parameters and the base oscillation they are injected into
+ANOMALY_PARAMETERS: Dict[str, Dict[str, Any]] = {
+    "extremum": {"min": False, "local": True, "context_window": 50},
+    "frequency": {"frequency_factor": 2.0},
+    "mean": {"offset": 1.5},
+    "pattern": {"sinusoid_k": 10.0},
+    "pattern-shift": {"shift_by": 5, "transition_window": 10},
+    "platform": {"value": 0.0},
+    "variance": {"variance": 0.5},
+    "amplitude": {"amplitude_factor": 2.0},
+    "trend": {"oscillation": {"kind": "sine", "frequency": 0.5}},
+    "mode-correlation": {},
+}
+ANOMALY_BASE_OSCILLATIONS: Dict[str, Dict[str, Any]] = {
+    "mode-correlation": {"kind": "random-mode-jump", "frequency": 5},
+}
+DEFAULT_ANOMALY_BASE_OSCILLATION = {"kind": "sine", "frequency": 2.0, "variance": 0.05}
+ANOMALY_LENGTHS = {"extremum": 1}
+
+
+@dataclass
+class Case:
+    suite: str
+    name: str
+    # returns the function to measure (the setup itself is not measured)
+    setup: Callable[[], Callable[[], object]]
+    params: Dict[str, Any] = field(default_factory=dict)
+    repeat: Optional[int] = None
+
+
+def _timeseries_config(
+    name: str, length: int, bos: List[Dict], anomalies: List[Dict]
+) -> Dict:
+    return {
+        "timeseries": [
+            {
+                "name": name,
+                "length": length,
+                "semi-supervised": True,
+                "supervised": True,
+                "base-oscillations": bos,
+                "anomalies": anomalies,
+            }
+        ]
+    }
+
+
+def _generate_timeseries(config: Dict) -> Callable[[], object]:
+    ((bos, anomalies, options, _),) = ConfigParser().parse(config)
+
+    def generate() -> object:
+        return TimeSeries(bos, anomalies, **options.to_dict()).generate(random_seed=42)
+
+    return generate
+
+
+def _base_oscillation_cases(lengths: Sequence[int], tmp: Path) -> Iterator[Case]:
+    for kind in sorted(BaseOscillation.key_mapping):
+        for length in lengths:
+
+            def setup(kind: str = kind, length: int = length) -> Callable[[], object]:
+                params = dict(BO_PARAMETERS.get(kind, {}))
+                previous_channels = []
+                if kind == "formula":
+                    previous_channels = [np.random.default_rng(1).normal(size=length)]
+                elif kind == "custom-input":
+                    path = tmp / f"custom-input-{length}.csv"
+                    if not path.exists():
+                        values = np.random.default_rng(1).normal(size=length)
+                        pd.DataFrame({"value": values}).to_csv(path, index=False)
+                    params["input-timeseries-path-test"] = str(path)
+                bo = BaseOscillation.from_key(kind, length=length, **params)
+
+                def generate() -> object:
+                    ctx = GenerationContext(GenerationContext.re_seed(42))
+                    channel = len(previous_channels)
+                    return bo.generate_timeseries_and_variations(
+                        ctx.to_bo(channel, previous_channels)
+                    )
+
+                return generate
+
+            yield Case("base-oscillations", kind, setup, {"length": length})
+
+
+def _anomaly_cases(length: int = 100000, anomaly_length: int = 1000) -> Iterator[Case]:
+    for kind in AnomalyKind:
+        bo = ANOMALY_BASE_OSCILLATIONS.get(kind.value, DEFAULT_ANOMALY_BASE_OSCILLATION)
+        kind_length = ANOMALY_LENGTHS.get(kind.value, anomaly_length)
+        anomaly = {
+            "position": "middle",
+            "length": kind_length,
+            "channel": 0,
+            "kinds": [{"kind": kind.value, **ANOMALY_PARAMETERS[kind.value]}],
+        }
+        config = _timeseries_config(kind.value, length, [bo], [anomaly])
+        yield Case(
+            "anomalies",
+            kind.value,
+            partial(_generate_timeseries, config),
+            {"length": length, "anomaly_length": kind_length},
+        )
+
+
+def _channel_cases(
+    length: int = 100000,
+    channels: Sequence[int] = (1, 2, 4, 8, 16, 32),
+    wide_length: int = 1000,
+    wide_channels: Sequence[int] = (100, 1000, 5000),
+) -> Iterator[Case]:
+    bos = [
+        {"kind": "random-walk", "variance": 0.05},
+        {"kind": "sine", "frequency": 2.0, "variance": 0.05},
+    ]
+    anomaly = {"length": 100, "channel": 0, "kinds": [{"kind": "platform", "value": 0}]}
+    for n in channels:
+        config = _timeseries_config(
+            "channels", length, [bos[c % 2] for c in range(n)], [anomaly]
+        )
+        yield Case(
+            "channels",
+            f"channels-{n}",
+            partial(_generate_timeseries, config),
+            {"length": length, "channels": n},
+        )
+    # wide data: the channels of a `base-oscillation` template are generated as one matrix
+    for n in wide_channels:
+        config = _timeseries_config("template-channels", wide_length, [], [anomaly])
+        ts = config["timeseries"][0]
+        del ts["base-oscillations"]
+        ts.update({"base-oscillation": bos[1], "channels": n})
+        yield Case(
+            "channels",
+            f"template-channels-{n}",
+            partial(_generate_timeseries, config),
+            {"length": wide_length, "channels": n},
+        )
+
+
+def _n_jobs_cases(
+    tmp: Path, datasets: int = 16, length: int = 100000, jobs: Sequence[int] = (1, 2, 4)
+) -> Iterator[Case]:
+    config = {
+        "timeseries": [
+            {
+                "name": f"ts-{i}",
+                "length": length,
+                "semi-supervised": True,
+                "base-oscillations": [{"kind": "random-walk", "variance": 0.05}],
+                "anomalies": [
+                    {"length": 100, "kinds": [{"kind": "platform", "value": 0}]}
+                ],
+            }
+            for i in range(datasets)
+        ]
+    }
+    for n_jobs in jobs:
+
+        def setup(n_jobs: int = n_jobs) -> Callable[[], object]:
+            gt = GutenTAG.from_dict(config, n_jobs=n_jobs, seed=42)
+            return lambda: gt.generate(output_folder=tmp / f"n-jobs-{n_jobs}")
+
+        yield Case(
+            "n-jobs",
+            f"n-jobs-{n_jobs}",
+            setup,
+            {"datasets": datasets, "length": length, "n_jobs": n_jobs},
+            repeat=1,
+        )
+
+
+def _corpus_cases(tmp: Path) -> Iterator[Case]:
+    def setup() -> Callable[[], object]:
+        gt = GutenTAG.from_yaml(CORPUS_CONFIG, seed=42)
+        return lambda: gt.generate(output_folder=tmp / "corpus", output_format="csv")
+
+    yield Case("corpus", CORPUS_CONFIG.stem, setup, {"format": "csv"}, repeat=1)
+
+
+def collect_cases(
+    suites: Sequence[str], lengths: Sequence[int], tmp: Path
+) -> List[Case]:
+    factories: Dict[str, Callable[[], Iterator[Case]]] = {
+        "base-oscillations": lambda: _base_oscillation_cases(lengths, tmp),
+        "anomalies": _anomaly_cases,
+        "channels": _channel_cases,
+        "n-jobs": lambda: _n_jobs_cases(tmp),
+        "corpus": lambda: _corpus_cases(tmp),
+    }
+    return [case for suite in suites for case in factories[suite]()]
+
+
+def measure(case: Case, repeat: int = 3, memory: bool = True) -> Dict[str, Any]:
+    func = case.setup()
+    if case.repeat is None:
+        # warm-up run excluding lazy imports and one-time initializations from the measurements
+        func()
+    result: Dict[str, Any] = {
+        "suite": case.suite,
+        "name": case.name,
+        "params": case.params,
+        "time": best_of(func, case.repeat or repeat),
+        "peak_memory": None,
+    }
+    if memory:
+        # separate run, because tracing the allocations slows down the execution
+        tracemalloc.start()
+        func()
+        _, result["peak_memory"] = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return result
+
+
+def run(
+    suites: Sequence[str] = SUITES,
+    lengths: Sequence[int] = LENGTHS,
+    repeat: int = 3,
+    memory: bool = True,
+    log: Callable[[Dict[str, Any]], None] = lambda _: None,
+) -> Dict[str, Any]:
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for case in collect_cases(suites, lengths, Path(tmp)):
+            result = measure(case, repeat, memory)
+            log(result)
+            results.append(result)
+    return {
+        "meta": {
+            "gutentag_version": __version__,
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "processor": platform.processor(),
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+def _case_key(result: Dict[str, Any]) -> str:
+    params = ",".join(f"{k}={v}" for k, v in sorted(result["params"].items()))
+    return f"{result['suite']}/{result['name']}[{params}]"
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float) -> int:
+    """Prints the time and memory ratios of all cases in both result sets and returns the number of regressions."""
+    base_results = {_case_key(r): r for r in baseline["results"]}
+    print(
+        f"baseline: {baseline['meta']['gutentag_version']} ({baseline['meta']['timestamp']}), "
+        f"current: {current['meta']['gutentag_version']} ({current['meta']['timestamp']})"
+    )
+    print(f"{'case':<70} {'time':>8} {'memory':>8}")
+    regressions = 0
+    for result in current["results"]:
+        key = _case_key(result)
+        if key not in base_results:
+            continue
+        base = base_results[key]
+        time_ratio = result["time"] / base["time"]
+        memory_ratio = (
+            result["peak_memory"] / base["peak_memory"]
+            if result["peak_memory"] and base["peak_memory"]
+            else float("nan")
+        )
+        regression = time_ratio > threshold or memory_ratio > threshold
+        regressions += regression
+        print(
+            f"{key:<70} {time_ratio:>7.2f}x {memory_ratio:>7.2f}x"
+            + ("  <-- regression" if regression else "")
+        )
+    return regressions
+
+
+def _print_result(result: Dict[str, Any]) -> None:
+    memory = (
+        f"{result['peak_memory'] / 2**20:>10.1f}"
+        if result["peak_memory"] is not None
+        else f"{'-':>10}"
+    )
+    print(
+        f"{_case_key(result):<70} {result['time'] * 1000:>12.1f} {memory}", flush=True
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--suites", nargs="+", choices=SUITES, default=list(SUITES))
+    parser.add_argument(
+        "--max-length",
+        type=int,
+        default=max(LENGTHS),
+        help="Largest time series length of the base oscillation suite.",
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--no-memory", action="store_true", help="Skip the peak memory measurements."
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=None,
+        help=f"Result file (default: {RESULTS_FOLDER}/<version>-<timestamp>.json).",
+    )
+    parser.add_argument(
+        "--compare",
+        nargs=2,
+        type=Path,
+        metavar=("BASELINE", "CURRENT"),
+        help="Compare two result files instead of running the benchmarks.",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=1.2,
+        help="Ratio above which a case is reported as regression.",
+    )
+    args = parser.parse_args()
+
+    if args.compare is not None:
+        baseline, current = (json.loads(p.read_text()) for p in args.compare)
+        sys.exit(1 if compare(baseline, current, args.threshold) > 0 else 0)
+
+    print(f"{'case':<70} {'time [ms]':>12} {'peak [MiB]':>10}")
+    lengths = [length for length in LENGTHS if length <= args.max_length]
+    results = run(args.suites, lengths, args.repeat, not args.no_memory, _print_result)
+
+    output = args.output
+    if output is None:
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        output = RESULTS_FOLDER / f"{__version__}-{stamp}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(results, indent=2))
+    print(f"Results written to {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""Measures the validation of a configuration with a freshly loaded schema (first call in a process) and with the
+cached compiled schema.
+
+    python -m benchmarks.validator [--config tests/configs/example-config-multi.yaml]
+"""
+
+import argparse
+import time
+from pathlib import Path
+from typing import Dict, List
+
+import yaml
+
+from benchmarks import best_of
+from gutenTAG.config import ConfigValidator
+from gutenTAG.config.validator import _compiled_schema
+
+
+def run(config_path: Path, repeat: int = 20) -> List[Dict]:
+    with config_path.open("r") as f:
+        config = yaml.safe_load(f)
+
+    _compiled_schema.cache_clear()
+    start = time.perf_counter()
+    ConfigValidator().validate(config)
+    cold = time.perf_counter() - start
+    warm = best_of(lambda: ConfigValidator().validate(config), repeat)
+    return [{"schema": "loaded", "time": cold}, {"schema": "cached", "time": warm}]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument(
+        "--config", type=Path, default=Path("tests/configs/example-config-multi.yaml")
+    )
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"config={args.config}")
+    print(f"{'schema':>7} {'time [ms]':>10}")
+    for r in run(args.config, args.repeat):
+        print(f"{r['schema']:>7} {r['time'] * 1000:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Measures the generation time of the dataset variants (test, semi-supervised, supervised) with and without sharing
+the deterministic base oscillations between them.
+
+    python -m benchmarks.variants [--length 1000000] [--channels 4]
+"""
+
+import argparse
+from typing import Dict, List
+
+from benchmarks import best_of
+from gutenTAG.config import ConfigParser
+from gutenTAG.generator import TimeSeries
+from gutenTAG.timeseries import TrainingType
+
+
+def _config(length: int, channels: int) -> Dict:
+    return {
+        "timeseries": [
+            {
+                "name": "variants",
+                "length": length,
+                "semi-supervised": True,
+                "supervised": True,
+                "base-oscillations": [
+                    {
+                        "kind": "sine",
+                        "frequency": 2.0,
+                        "freq-mod": 0.1,
+                        "variance": 0.05,
+                        "trend": {"kind": "polynomial", "polynomial": [0.5, 1]},
+                    }
+                ]
+                * channels,
+                "anomalies": [
+                    {
+                        "position": "middle",
+                        "length": 100,
+                        "channel": 0,
+                        "kinds": [{"kind": "amplitude", "amplitude_factor": 1.5}],
+                    }
+                ],
+            }
+        ]
+    }
+
+
+def run(length: int = 1000000, channels: int = 4, repeat: int = 3) -> List[Dict]:
+    config = _config(length, channels)
+    results = []
+    for share in [False, True]:
+        timings: Dict[TrainingType, float] = {}
+
+        def generate() -> None:
+            ((bos, anomalies, options, _),) = ConfigParser().parse(config)
+            ts = TimeSeries(
+                bos, anomalies, **options.to_dict(), share_deterministic_bases=share
+            ).generate(random_seed=42)
+            for variant, t in ts.variant_timings.items():
+                timings[variant] = min(t, timings.get(variant, t))
+
+        total = best_of(generate, repeat)
+        results.append(
+            {
+                "share_deterministic_bases": share,
+                "total": total,
+                **{variant.value: t for variant, t in timings.items()},
+            }
+        )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--length", type=int, default=1000000)
+    parser.add_argument("--channels", type=int, default=4)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    variants = [t.value for t in TrainingType]
+    print(f"length={args.length}, channels={args.channels}")
+    print(
+        f"{'shared':>7} "
+        + " ".join(f"{v + ' [ms]':>22}" for v in variants)
+        + f" {'total [ms]':>11}"
+    )
+    for r in run(args.length, args.channels, args.repeat):
+        print(
+            f"{str(r['share_deterministic_bases']):>7} "
+            + " ".join(f"{r[v] * 1000:>22.1f}" for v in variants)
+            + f" {r['total'] * 1000:>11.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,9 @@
 from ._version import __version__
 from .gutenTAG import GutenTAG
-from .timeseries import TimeSeries, TrainingType, LABEL_COLUMN_NAME, INDEX_COLUMN_NAME
+from .timeseries import (
+    TimeSeries,
+    TrainingType,
+    OutputFormat,
+    LABEL_COLUMN_NAME,
+    INDEX_COLUMN_NAME,
+)
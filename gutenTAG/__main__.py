@@ -1,10 +1,15 @@
 import argparse
+import logging
 import sys
 from pathlib import Path
 from typing import List
 
 from ._version import __version__
 from .gutenTAG import GutenTAG
+from .sharding import SHARD_STRATEGIES, parse_shard, merge_shards
+from .timeseries import OutputFormat
+from .utils.diagnostics import LOGGER_NAME
+from .utils.types import DTYPES
 
 
 def parse_args(args: List[str]) -> argparse.Namespace:
@@ -24,6 +29,20 @@ def parse_args(args: List[str]) -> argparse.Namespace:
         default=Path("./generated-timeseries"),
         help="Path to output directory",
     )
+    parser.add_argument(
+        "--format",
+        type=str,
+        choices=[f.value for f in OutputFormat],
+        default=OutputFormat.CSV.value,
+        help="File format of the generated time series (parquet and feather require pyarrow).",
+    )
+    parser.add_argument(
+        "--dtype",
+        type=str,
+        choices=DTYPES,
+        default="float64",
+        help="Floating point precision of the generated time series (float32 halves memory and file sizes).",
+    )
     parser.add_argument(
         "--plot", action="store_true", help="Plot every generated time series."
     )
@@ -46,10 +65,96 @@ def parse_args(args: List[str]) -> argparse.Namespace:
         default=1,
         help="Number of time series to generate in parallel.",
     )
+    parser.add_argument(
+        "--n_threads",
+        "--n-threads",
+        type=int,
+        default=1,
+        help="Number of threads to generate the channels of a large time series with.",
+    )
     parser.add_argument(
         "--only", type=str, help="Process only timeseries with the defined name."
     )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Reuse unchanged datasets from the output directory instead of generating them again (requires --seed).",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=None,
+        help="Additional directory to look up and store generated datasets (implies --cache).",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Journal the completed datasets and continue an interrupted run that was started with --resume: keep "
+        "the completed datasets in the output directory (requires --seed).",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Record the durations of the generation stages and write them to timings.csv and timings.json.",
+    )
+    parser.add_argument(
+        "--overview-diagnostics",
+        action="store_true",
+        help="Write the aggregated warnings of the generation to the overview.yaml.",
+    )
+    parser.add_argument(
+        "--shard",
+        type=parse_shard,
+        default=None,
+        metavar="i/N",
+        help="Generate only the i-th of N disjoint subsets of the time series (1 <= i <= N). Combine the outputs of "
+        "all shards with `gutenTAG merge`.",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Expand the parameter grids lazily and write the overview.yaml incrementally instead of holding all "
+        "time series in memory (cannot be combined with --shard, --cache, --cache-dir, or --resume).",
+    )
+    parser.add_argument(
+        "--shard-strategy",
+        type=str,
+        choices=SHARD_STRATEGIES,
+        default="hash",
+        help="Assign the time series to the shards by the hash of their name or balance their estimated cost.",
+    )
 
+    parsed = parser.parse_args(args)
+    if parsed.resume and (parsed.seed is None or parsed.no_save):
+        parser.error("--resume requires --seed and an output directory")
+    if parsed.stream and (
+        parsed.shard is not None or parsed.cache or parsed.cache_dir or parsed.resume
+    ):
+        parser.error(
+            "--stream cannot be combined with --shard, --cache, --cache-dir, or --resume"
+        )
+    return parsed
+
+
+def parse_merge_args(args: List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="gutenTAG merge",
+        description="Combine the outputs of all shards of a sharded GutenTAG run.",
+    )
+    parser.add_argument(
+        "shard_dirs", type=Path, nargs="+", help="Output directories of the shards"
+    )
+    parser.add_argument(
+        "--output-dir",
+        type=Path,
+        required=True,
+        help="Path to the output directory of the merged corpus",
+    )
+    parser.add_argument(
+        "--move",
+        action="store_true",
+        help="Move the dataset folders instead of copying them.",
+    )
     return parser.parse_args(args)
 
 
@@ -77,7 +182,13 @@ def main(sys_args: List[str]) -> None:
     if "--version" in sys_args:
         return
 
+    if sys_args[:1] == ["merge"]:
+        merge_args = parse_merge_args(sys_args[1:])
+        merge_shards(merge_args.shard_dirs, merge_args.output_dir, merge_args.move)
+        return
+
     args = parse_args(sys_args)
+    _configure_logging()
     if args.no_save:
         output = None
     else:
@@ -89,9 +200,33 @@ def main(sys_args: List[str]) -> None:
         seed=args.seed,
         addons=args.addons,
         only=args.only,
+        dtype=args.dtype,
+        n_threads=args.n_threads,
+        stream=args.stream,
     )
+    if args.shard is not None:
+        index, count = args.shard
+        gutentag.shard(index, count, strategy=args.shard_strategy)
+
+    gutentag.generate(
+        return_timeseries=False,
+        output_folder=output,
+        plot=args.plot,
+        output_format=args.format,
+        cache=args.cache,
+        cache_dir=args.cache_dir,
+        resume=args.resume,
+        profile=args.profile,
+        overview_diagnostics=args.overview_diagnostics,
+    )
+
 
-    gutentag.generate(return_timeseries=False, output_folder=output, plot=args.plot)
+def _configure_logging() -> None:
+    # print the warnings and the summaries (e.g., of the --profile timings) of GutenTAG
+    logger = logging.getLogger(LOGGER_NAME)
+    logger.setLevel(logging.INFO)
+    if not logger.handlers:
+        logger.addHandler(logging.StreamHandler())
 
 
 def cli() -> None:
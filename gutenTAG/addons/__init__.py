@@ -6,6 +6,7 @@ from dataclasses import dataclass, field
 from typing import List, Type, Optional, Any, Dict
 
 from ..generator import Overview, TimeSeries
+from ..timeseries import OutputFormat
 
 
 @dataclass
@@ -14,6 +15,7 @@ class AddOnProcessContext:
     config: Dict
     plot: bool = False
     output_folder: Optional[os.PathLike] = None
+    output_format: OutputFormat = OutputFormat.CSV
 
     _data_store: Dict[str, Any] = field(default_factory=lambda: {})
 
@@ -29,6 +31,7 @@ class AddOnProcessContext:
             config=config or self.config,
             plot=self.plot,
             output_folder=self.output_folder,
+            output_format=self.output_format,
         )
 
     def store_data(self, key: str, data: Any) -> AddOnProcessContext:
@@ -55,10 +58,14 @@ class AddOnFinalizeContext:
     def fill_store(self, stores: List[Dict[str, Any]]) -> None:
         """**Don't use!** Internal API."""
         for dd in stores:
-            for key in dd:
-                if key not in self._data_store:
-                    self._data_store[key] = []
-                self._data_store[key].append(dd[key])
+            self.add_to_store(dd)
+
+    def add_to_store(self, store: Dict[str, Any]) -> None:
+        """**Don't use!** Internal API."""
+        for key in store:
+            if key not in self._data_store:
+                self._data_store[key] = []
+            self._data_store[key].append(store[key])
 
 
 class BaseAddOn:
@@ -8,6 +8,8 @@ import pandas as pd
 from gutenTAG.addons import BaseAddOn, AddOnProcessContext, AddOnFinalizeContext
 from gutenTAG.base_oscillations.utils.math_func_support import calc_period_length
 from gutenTAG.generator import TimeSeries
+from gutenTAG.timeseries import OutputFormat
+from gutenTAG.utils.atomic import atomic_path
 from gutenTAG.utils.default_values import default_values
 from gutenTAG.utils.global_variables import (
     SUPERVISED_FILENAME,
@@ -68,14 +70,17 @@ class TimeEvalAddOn(BaseAddOn):
     def process(self, ctx: AddOnProcessContext) -> AddOnProcessContext:
         ts = ctx.timeseries
         config = ctx.config
-        datasets = [self._process_timeseries(config, ts, LearningType.Unsupervised)]
+        fmt = ctx.output_format
+        datasets = [
+            self._process_timeseries(config, ts, LearningType.Unsupervised, fmt)
+        ]
         if ts.supervised:
             datasets.append(
-                self._process_timeseries(config, ts, LearningType.Supervised)
+                self._process_timeseries(config, ts, LearningType.Supervised, fmt)
             )
         if ts.semi_supervised:
             datasets.append(
-                self._process_timeseries(config, ts, LearningType.SemiSupervised)
+                self._process_timeseries(config, ts, LearningType.SemiSupervised, fmt)
             )
         return ctx.store_data(self.key, {"name": ts.dataset_name, "datasets": datasets})
 
@@ -89,23 +94,30 @@ class TimeEvalAddOn(BaseAddOn):
         self.df = df
         if ctx.should_save and ctx.output_folder is not None:
             filename = os.path.join(ctx.output_folder, "datasets.csv")
-            df.to_csv(filename, index=False)
+            with atomic_path(filename) as tmp:
+                df.to_csv(tmp, index=False)
 
     def _process_timeseries(
-        self, config: Dict, generator: TimeSeries, tpe: LearningType
+        self,
+        config: Dict,
+        generator: TimeSeries,
+        tpe: LearningType,
+        output_format: OutputFormat = OutputFormat.CSV,
     ) -> Dict[str, Any]:
         dataset: Dict[str, Any] = dict()
 
         dataset_name = generator.dataset_name
         filename = tpe.get_filename()
         if filename is not None:
-            dataset["train_path"] = f"{dataset_name}/{filename}"
+            dataset["train_path"] = f"{dataset_name}/{output_format.filename(filename)}"
 
         ts = generator.timeseries
         assert ts is not None, "Timeseries should not be None!"
 
         dataset["dataset_name"] = f"{dataset_name}.{tpe.value}"
-        dataset["test_path"] = f"{dataset_name}/{UNSUPERVISED_FILENAME}"
+        dataset["test_path"] = (
+            f"{dataset_name}/{output_format.filename(UNSUPERVISED_FILENAME)}"
+        )
         dataset["input_type"] = "univariate" if ts.shape[1] == 1 else "multivariate"
         dataset["length"] = config.get(PARAMETERS.LENGTH, 10000)
         dataset["dimensions"] = ts.shape[1]
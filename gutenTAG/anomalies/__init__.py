@@ -1,9 +1,11 @@
 from __future__ import annotations
 
-import numpy as np
-
+from bisect import bisect_left, bisect_right
 from enum import Enum
-from typing import List, Optional, Tuple
+from itertools import accumulate
+from typing import List, Optional, Tuple, Iterable, Iterator
+
+import numpy as np
 
 from .types import AnomalyProtocol, BaseAnomaly, LabelRange
 from .types.kind import AnomalyKind
@@ -57,10 +59,15 @@ class Anomaly:
         return self
 
     def generate(self, ctx: AnomalyGenerationContext) -> AnomalyProtocol:
-        if self.exact_position is None:
-            start, end = self._find_position(ctx)
-        else:
-            start, end = self.exact_position, self.exact_position + self.anomaly_length
+        timings = ctx.timings.bind(channel=self.channel)
+        with timings.measure("anomaly-placement"):
+            if self.exact_position is None:
+                start, end = self._find_position(ctx)
+            else:
+                start, end = (
+                    self.exact_position,
+                    self.exact_position + self.anomaly_length,
+                )
 
         length = end - start
         label_range = LabelRange(start, length)
@@ -74,27 +81,41 @@ class Anomaly:
         )
 
         for anomaly in self.anomaly_kinds:
-            protocol = anomaly.generate(protocol)
+            with timings.measure("anomaly-kind", detail=type(anomaly).__name__):
+                protocol = anomaly.generate(protocol)
 
         return protocol
 
     def _find_position(
         self, ctx: AnomalyGenerationContext, max_tries: int = 50
     ) -> Tuple[int, int]:
-        n_tries = max_tries
-        while n_tries > 0:
-            pos = self._get_random_position(ctx)
-            n_tries -= 1
-            if pos[1] < ctx.base_oscillation.length and not self._has_collision(
-                pos, ctx.previous_anomaly_positions
-            ):
-                return pos
-        raise ValueError(
-            f"Giving up on finding a position for {self.anomaly_length}-point anomaly at {self.position} "
-            f"in channel {self.channel}! Maximum number of retries ({max_tries}) exceeded!"
+        first, step, count = self._get_candidate_positions(ctx)
+        positions = ctx.previous_anomaly_positions
+        length = ctx.base_oscillation.length
+
+        # Drawing from all candidates first reproduces the positions of previous versions for the same seed. Falling
+        # back to sampling from the free candidates keeps the distribution uniform and never fails while space is left.
+        for _ in range(max_tries if count > 0 else 0):
+            start = first + step * int(ctx.rng.integers(0, count))
+            end = start + self.anomaly_length
+            if end < length and positions.is_free(start, end):
+                return start, end
+
+        start = positions.sample(
+            ctx.rng, first, step, count, self.anomaly_length, length
         )
-
-    def _get_random_position(self, ctx: AnomalyGenerationContext) -> Tuple[int, int]:
+        if start is None:
+            raise ValueError(
+                f"No free position left for {self.anomaly_length}-point anomaly at {self.position} "
+                f"in channel {self.channel}!"
+            )
+        return start, start + self.anomaly_length
+
+    def _get_candidate_positions(
+        self, ctx: AnomalyGenerationContext
+    ) -> Tuple[int, int, int]:
+        """Returns the candidate start positions ``first + step * k`` for ``k`` in ``[0, count)`` as
+        ``(first, step, count)``."""
         timeseries_periods = ctx.timeseries_periods
         period_size = ctx.timeseries_period_size
         if (
@@ -104,41 +125,94 @@ class Anomaly:
             or period_size is None
             or period_size <= 2
         ):
-            return self._get_random_position_no_periodicity(ctx)
+            # anywhere in the section
+            section_size = ctx.base_oscillation.length // 3
+            return self.position.id * section_size, 1, section_size
 
-        start_period = 0
+        # at the beginning of one of the periods in the section
         periods_per_section = timeseries_periods // 3
-        if periods_per_section > 1:
-            start_period = ctx.rng.choice(list(range(periods_per_section)))
-
-        position = self.position.id
-        start = period_size * (position * periods_per_section + start_period)
-        end = start + self.anomaly_length
-        return start, end
-
-    def _get_random_position_no_periodicity(
-        self, ctx: AnomalyGenerationContext
-    ) -> Tuple[int, int]:
-        timeseries_length = ctx.base_oscillation.length
-        section_size = timeseries_length // 3
-        position_in_section = ctx.rng.choice(np.arange(section_size))
-
-        position = self.position.id
-        start = (position * section_size) + position_in_section
-        end = start + self.anomaly_length
-        return start, end
-
-    @staticmethod
-    def _has_collision(
-        current_pos: Tuple[int, int], other_pos: List[Tuple[int, int]]
-    ) -> bool:
-        if len(other_pos) == 0:
-            return False
-        others = np.array(other_pos)
-        start_collision = (others[:, 0] <= current_pos[0]) & (
-            current_pos[0] <= others[:, 1]
-        )
-        end_colllision = (others[:, 0] <= current_pos[1]) & (
-            current_pos[1] <= others[:, 1]
-        )
-        return bool(np.any(start_collision | end_colllision))
+        first = period_size * self.position.id * periods_per_section
+        return first, period_size, max(1, periods_per_section)
+
+
+class AnomalyPositionIndex:
+    """Sorted set of the (merged) intervals ``[start, end]`` that are already occupied by anomalies.
+
+    It samples start positions for new anomalies directly from the free positions instead of drawing random positions
+    until one does not collide with the previous anomalies. The occupied intervals are located with binary search.
+    """
+
+    def __init__(self, positions: Iterable[Tuple[int, int]] = ()) -> None:
+        self._starts: List[int] = []
+        self._ends: List[int] = []
+        for start, end in positions:
+            self.add(start, end)
+
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        return zip(self._starts, self._ends)
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def add(self, start: int, end: int) -> None:
+        """Marks the positions ``[start, end]`` as occupied (merging it with overlapping intervals)."""
+        start, end = int(start), int(end)
+        i = bisect_left(self._ends, start)
+        j = bisect_right(self._starts, end)
+        if i < j:
+            start = min(start, self._starts[i])
+            end = max(end, self._ends[j - 1])
+        self._starts[i:j] = [start]
+        self._ends[i:j] = [end]
+
+    def is_free(self, start: int, end: int) -> bool:
+        """Checks if the positions ``[start, end]`` do not overlap any occupied interval."""
+        i = bisect_left(self._ends, start)
+        return i == len(self._ends) or self._starts[i] > end
+
+    def sample(
+        self,
+        rng: np.random.Generator,
+        first: int,
+        step: int,
+        count: int,
+        length: int,
+        limit: int,
+    ) -> Optional[int]:
+        """Draws a start position uniformly from the candidates ``first + step * k`` for ``k`` in ``[0, count)``.
+
+        Only candidates, for which the anomaly ``[start, start + length]`` does not overlap any occupied interval and
+        ends before ``limit``, are considered. If all candidates are free, the random draw is the same as
+        ``rng.choice(count)``.
+
+        Returns
+        -------
+        start : Optional[int]
+            start position of the anomaly or ``None`` if there is no free candidate left
+        """
+        max_k = min(count - 1, (limit - length - 1 - first) // step)
+        if max_k < 0:
+            return None
+        last = first + step * max_k
+
+        # collect the runs of free candidates (k-ranges) between the occupied intervals
+        runs: List[Tuple[int, int]] = []
+        k = 0
+        i = bisect_left(self._ends, first)
+        while i < len(self._starts) and self._starts[i] - length <= last:
+            # anomalies starting in [start - length, end] would overlap the occupied interval
+            blocked_from = -((first - self._starts[i] + length) // step)
+            if blocked_from > k:
+                runs.append((k, min(blocked_from, max_k + 1)))
+            k = max(k, (self._ends[i] - first) // step + 1)
+            i += 1
+        if k <= max_k:
+            runs.append((k, max_k + 1))
+
+        run_ends = list(accumulate(end - start for start, end in runs))
+        if len(run_ends) == 0 or run_ends[-1] == 0:
+            return None
+        r = int(rng.integers(0, run_ends[-1]))
+        j = bisect_right(run_ends, r)
+        offset = r - (run_ends[j - 1] if j > 0 else 0)
+        return first + step * (runs[j][0] + offset)
@@ -4,7 +4,7 @@ from typing import List, Optional
 
 import numpy as np
 
-from ...utils.logger import GutenTagLogger
+from ...utils.diagnostics import Diagnostics
 from ...utils.types import AnomalyGenerationContext
 
 
@@ -28,6 +28,10 @@ class AnomalyProtocol:
     def rng(self) -> np.random.Generator:
         return self.ctx.rng
 
+    @property
+    def diagnostics(self) -> Diagnostics:
+        return self.ctx.diagnostics
+
     @property
     def base_oscillation(self) -> "BaseOscillationInterface":  # type: ignore # noqa: F821 # otherwise we have a circular import
         return self.ctx.base_oscillation
@@ -46,9 +50,6 @@ class AnomalyProtocol:
 
 
 class BaseAnomaly(ABC):
-    def __init__(self):
-        self.logger = GutenTagLogger()
-
     @abstractmethod
     def generate(self, anomaly_protocol: AnomalyProtocol) -> AnomalyProtocol:
         return anomaly_protocol
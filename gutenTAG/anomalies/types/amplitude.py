@@ -2,11 +2,10 @@ from dataclasses import dataclass
 from typing import Type
 
 import numpy as np
-from scipy.stats import norm
-from sklearn.preprocessing import MinMaxScaler
 
 from . import BaseAnomaly, AnomalyProtocol
 from ...base_oscillations import Polynomial, Formula, RandomModeJump
+from ...base_oscillations.utils.rescale import min_max_rescale
 
 
 @dataclass
@@ -20,12 +19,14 @@ class AnomalyAmplitude(BaseAnomaly):
         self.amplitude_factor = parameters.amplitude_factor
 
     def generate(self, anomaly_protocol: AnomalyProtocol) -> AnomalyProtocol:
+        from scipy.stats import norm
+
         if anomaly_protocol.base_oscillation_kind in [
             Polynomial.KIND,
             Formula.KIND,
             RandomModeJump.KIND,
         ]:
-            self.logger.warn_false_combination(
+            anomaly_protocol.diagnostics.warn_false_combination(
                 self.__class__.__name__, anomaly_protocol.base_oscillation_kind
             )
             return anomaly_protocol
@@ -60,17 +61,15 @@ class AnomalyAmplitude(BaseAnomaly):
                 [creeping, end_transition / end_transition.max()]
             )
         if self.amplitude_factor < 1.0:
-            amplitude_bell = (
-                MinMaxScaler(feature_range=(1.0, 2.0 - self.amplitude_factor))
-                .fit_transform(amplitude_bell.reshape(-1, 1))
-                .reshape(-1)
+            min_max_rescale(
+                amplitude_bell,
+                (1.0, 2.0 - self.amplitude_factor),
+                out=amplitude_bell,
             )
-            amplitude_bell = amplitude_bell * -1 + 2
+            np.subtract(2, amplitude_bell, out=amplitude_bell)
         else:
-            amplitude_bell = (
-                MinMaxScaler(feature_range=(1.0, self.amplitude_factor))
-                .fit_transform(amplitude_bell.reshape(-1, 1))
-                .reshape(-1)
+            min_max_rescale(
+                amplitude_bell, (1.0, self.amplitude_factor), out=amplitude_bell
             )
 
         subsequence = (
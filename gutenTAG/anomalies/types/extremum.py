@@ -6,6 +6,7 @@ import numpy as np
 from . import BaseAnomaly
 from .. import AnomalyProtocol
 from ...base_oscillations import RandomModeJump
+from ...utils.diagnostics import Diagnostics
 
 
 @dataclass
@@ -24,15 +25,16 @@ class AnomalyExtremum(BaseAnomaly):
 
     def generate(self, anomaly_protocol: AnomalyProtocol) -> AnomalyProtocol:
         if anomaly_protocol.base_oscillation_kind == RandomModeJump.KIND:
-            self.logger.warn_false_combination(
+            anomaly_protocol.diagnostics.warn_false_combination(
                 self.__class__.__name__, anomaly_protocol.base_oscillation_kind
             )
             return anomaly_protocol
 
         length = anomaly_protocol.end - anomaly_protocol.start
         if length != 1:
-            self.logger.logger.warn(
-                f"Extremum anomaly can only have a length of 1 (was set to {length})! Ignoring."
+            anomaly_protocol.diagnostics.report(
+                Diagnostics.INVALID_PARAMETER,
+                f"Extremum anomaly can only have a length of 1 (was set to {length})! Ignoring.",
             )
             anomaly_protocol.end = anomaly_protocol.start + 1
             anomaly_protocol.labels.length = 1
@@ -18,10 +18,12 @@ class AnomalyFrequency(BaseAnomaly):
     def generate(self, anomaly_protocol: AnomalyProtocol) -> AnomalyProtocol:
         if anomaly_protocol.base_oscillation_kind == ECG.KIND:
             ecg = anomaly_protocol.base_oscillation
-            subsequence = ecg.generate_only_base(
+            subsequence = ecg.generate_window(
                 anomaly_protocol.ctx.to_bo(),
+                anomaly_protocol.start,
+                anomaly_protocol.end,
                 frequency=ecg.frequency * self.frequency_factor,
-            )[anomaly_protocol.start : anomaly_protocol.end]
+            )
             anomaly_protocol.subsequences.append(subsequence)
 
         elif anomaly_protocol.base_oscillation.is_periodic():
@@ -36,7 +38,7 @@ class AnomalyFrequency(BaseAnomaly):
             anomaly_protocol.subsequences.append(subsequence)
 
         else:
-            self.logger.warn_false_combination(
+            anomaly_protocol.diagnostics.warn_false_combination(
                 self.__class__.__name__, anomaly_protocol.base_oscillation_kind
             )
 
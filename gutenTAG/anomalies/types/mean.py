@@ -20,7 +20,7 @@ class AnomalyMean(BaseAnomaly):
 
     def generate(self, anomaly_protocol: AnomalyProtocol) -> AnomalyProtocol:
         if anomaly_protocol.base_oscillation_kind == RandomModeJump.KIND:
-            self.logger.warn_false_combination(
+            anomaly_protocol.diagnostics.warn_false_combination(
                 self.__class__.__name__, anomaly_protocol.base_oscillation_kind
             )
             return anomaly_protocol
@@ -21,12 +21,9 @@ class AnomalyModeCorrelation(BaseAnomaly):
             subsequence = timeseries[anomaly_protocol.start : anomaly_protocol.end] * -1
             anomaly_protocol.subsequences.append(subsequence)
         else:
-            self.logger.warn_false_combination(
+            anomaly_protocol.diagnostics.warn_false_combination(
                 self.__class__.__name__, anomaly_protocol.base_oscillation_kind
             )
-            self.logger.warning(
-                "A `mode_correlation` anomaly can be injected in only a `random_mode_jump` base oscillation!"
-            )
         return anomaly_protocol
 
     @property
@@ -2,11 +2,11 @@ from dataclasses import dataclass
 from typing import Type
 
 import numpy as np
-from sklearn.preprocessing import MinMaxScaler
 
 from . import BaseAnomaly
 from .. import AnomalyProtocol
 from ...base_oscillations import CylinderBellFunnel, ECG, Square, Sawtooth, MLS
+from ...base_oscillations.utils.rescale import min_max_rescale
 
 
 @dataclass
@@ -28,11 +28,13 @@ class AnomalyPattern(BaseAnomaly):
     def generate(self, anomaly_protocol: AnomalyProtocol) -> AnomalyProtocol:
         if anomaly_protocol.base_oscillation_kind == CylinderBellFunnel.KIND:
             cbf = anomaly_protocol.base_oscillation
-            subsequence = cbf.generate_only_base(
+            subsequence = cbf.generate_window(
                 anomaly_protocol.ctx.to_bo(),
+                anomaly_protocol.start,
+                anomaly_protocol.end,
                 variance_pattern_length=cbf.variance_pattern_length
                 * self.cbf_pattern_factor,
-            )[anomaly_protocol.start : anomaly_protocol.end]
+            )
             anomaly_protocol.subsequences.append(subsequence)
 
         elif anomaly_protocol.base_oscillation_kind == ECG.KIND:
@@ -54,15 +56,21 @@ class AnomalyPattern(BaseAnomaly):
             anomaly_protocol.subsequences.append(subsequence)
 
         elif anomaly_protocol.base_oscillation_kind == Sawtooth.KIND:
-            subsequence = anomaly_protocol.base_oscillation.generate_only_base(
-                anomaly_protocol.ctx.to_bo(), width=self.sawtooth_width
-            )[anomaly_protocol.start : anomaly_protocol.end]
+            subsequence = anomaly_protocol.base_oscillation.generate_window(
+                anomaly_protocol.ctx.to_bo(),
+                anomaly_protocol.start,
+                anomaly_protocol.end,
+                width=self.sawtooth_width,
+            )
             anomaly_protocol.subsequences.append(subsequence)
 
         elif anomaly_protocol.base_oscillation_kind == Square.KIND:
-            subsequence = anomaly_protocol.base_oscillation.generate_only_base(
-                anomaly_protocol.ctx.to_bo(), duty=self.square_duty
-            )[anomaly_protocol.start : anomaly_protocol.end]
+            subsequence = anomaly_protocol.base_oscillation.generate_window(
+                anomaly_protocol.ctx.to_bo(),
+                anomaly_protocol.start,
+                anomaly_protocol.end,
+                duty=self.square_duty,
+            )
             anomaly_protocol.subsequences.append(subsequence)
 
         elif anomaly_protocol.base_oscillation_kind == MLS.KIND:
@@ -99,12 +107,7 @@ class AnomalyPattern(BaseAnomaly):
                 t: np.ndarray, k: float, a_min: float, a_max: float
             ) -> np.ndarray:
                 pattern = np.arctan(k * t) / np.arctan(k)
-                scaled = (
-                    MinMaxScaler(feature_range=(a_min, a_max))
-                    .fit_transform(pattern.reshape(-1, 1))
-                    .reshape(-1)
-                )
-                return scaled
+                return min_max_rescale(pattern, (a_min, a_max), out=pattern)
 
             bo = anomaly_protocol.base_oscillation
             snippet = bo.timeseries[anomaly_protocol.start : anomaly_protocol.end]
@@ -114,7 +117,7 @@ class AnomalyPattern(BaseAnomaly):
             anomaly_protocol.subsequences.append(subsequence)
 
         else:
-            self.logger.warn_false_combination(
+            anomaly_protocol.diagnostics.warn_false_combination(
                 self.__class__.__name__, anomaly_protocol.base_oscillation_kind
             )
         return anomaly_protocol
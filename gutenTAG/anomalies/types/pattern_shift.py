@@ -48,7 +48,7 @@ class AnomalyPatternShift(BaseAnomaly):
 
             anomaly_protocol.subsequences.append(subsequence)
         else:
-            self.logger.warn_false_combination(
+            anomaly_protocol.diagnostics.warn_false_combination(
                 self.__class__.__name__, anomaly_protocol.base_oscillation_kind
             )
         return anomaly_protocol
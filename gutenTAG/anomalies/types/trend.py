@@ -2,11 +2,10 @@ from dataclasses import dataclass
 from typing import Type
 
 import numpy as np
-from scipy.stats import norm
-from sklearn.preprocessing import MinMaxScaler
 
 from . import BaseAnomaly, AnomalyProtocol
 from ...base_oscillations import RandomModeJump
+from ...base_oscillations.utils.rescale import min_max_rescale
 
 
 @dataclass
@@ -20,8 +19,10 @@ class AnomalyTrend(BaseAnomaly):
         self.trend = parameters.trend
 
     def generate(self, anomaly_protocol: AnomalyProtocol) -> AnomalyProtocol:
+        from scipy.stats import norm
+
         if anomaly_protocol.base_oscillation_kind == RandomModeJump.KIND:
-            self.logger.warn_false_combination(
+            anomaly_protocol.diagnostics.warn_false_combination(
                 self.__class__.__name__, anomaly_protocol.base_oscillation_kind
             )
             return anomaly_protocol
@@ -33,17 +34,11 @@ class AnomalyTrend(BaseAnomaly):
         amplitude_bell = np.concatenate(
             [start_transition / start_transition.max(), np.ones(plateau_length)]
         )
-        amplitude_bell = (
-            MinMaxScaler(feature_range=(0, 1))
-            .fit_transform(amplitude_bell.reshape(-1, 1))
-            .reshape(-1)
-        )
+        min_max_rescale(amplitude_bell, (0, 1), out=amplitude_bell)
 
         self.trend.length = length
         self.trend.generate_timeseries_and_variations(anomaly_protocol.ctx.to_bo())
-        timeseries = self.trend.timeseries
-
-        timeseries *= amplitude_bell
+        timeseries = self.trend.timeseries * amplitude_bell
         end_point = timeseries[-1]
 
         anomaly_protocol.base_oscillation.trend_series[
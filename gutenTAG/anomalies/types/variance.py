@@ -19,14 +19,17 @@ class AnomalyVariance(BaseAnomaly):
     def generate(self, anomaly_protocol: AnomalyProtocol) -> AnomalyProtocol:
         base = anomaly_protocol.base_oscillation
         if anomaly_protocol.base_oscillation_kind == RandomModeJump.KIND:
-            self.logger.warn_false_combination(
+            anomaly_protocol.diagnostics.warn_false_combination(
                 self.__class__.__name__, anomaly_protocol.base_oscillation_kind
             )
 
         elif anomaly_protocol.base_oscillation_kind == CylinderBellFunnel.KIND:
-            subsequence = base.generate_only_base(
-                anomaly_protocol.ctx.to_bo(), variance=self.variance
-            )[anomaly_protocol.start : anomaly_protocol.end]
+            subsequence = base.generate_window(
+                anomaly_protocol.ctx.to_bo(),
+                anomaly_protocol.start,
+                anomaly_protocol.end,
+                variance=self.variance,
+            )
             anomaly_protocol.subsequences.append(subsequence)
 
         else:
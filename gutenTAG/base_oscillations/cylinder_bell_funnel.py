@@ -1,4 +1,4 @@
-from typing import Optional, Sequence, Callable
+from typing import Optional, Sequence, Callable, Tuple
 
 import numpy as np
 
@@ -12,6 +12,8 @@ from ..utils.global_variables import (
 )
 from ..utils.types import BOGenerationContext
 
+CBF_METHODS = ("vectorized", "legacy")
+
 
 class CylinderBellFunnel(BaseOscillationInterface):
     KIND = BASE_OSCILLATION_NAMES.CYLINDER_BELL_FUNNEL
@@ -53,12 +55,24 @@ class CylinderBellFunnel(BaseOscillationInterface):
             default_variance=variance,
             variance_pattern_length=variance_pattern_length,
             variance_amplitude=self.variance_amplitude,
+            method=self.cbf_method,
         )
 
+    def generate_window(
+        self, ctx: BOGenerationContext, start: int, end: int, **kwargs
+    ) -> np.ndarray:
+        """CylinderBellFunnel has no phase: the window is generated as a new signal of the window's length.
+
+        This draws fewer random numbers than slicing a new full-length signal, so the anomalies that use it differ
+        from GutenTAG versions before the windowed generation for the same seed (see the changelog).
+        """
+        kwargs.pop("length", None)
+        return self.generate_only_base(ctx, length=end - start, **kwargs)
+
     def generate_timeseries_and_variations(
-        self, ctx: BOGenerationContext, **kwargs
+        self, ctx: BOGenerationContext, out: Optional[np.ndarray] = None, **kwargs
     ) -> BaseOscillationInterface:
-        super().generate_timeseries_and_variations(ctx)
+        super().generate_timeseries_and_variations(ctx, out=out)
         if self.timeseries is not None and self.noise is not None:
             self.timeseries -= self.noise
         else:
@@ -71,7 +85,6 @@ class CylinderBellFunnel(BaseOscillationInterface):
 BaseOscillation.register(CylinderBellFunnel.KIND, CylinderBellFunnel)
 
 
-# Taken from https://github.com/KDD-OpenSource/data-generation/blob/master/generation/cbf.py
 # cylinder bell funnel based on "Learning comprehensible descriptions of multivariate time series"
 def cylinder_bell_funnel(
     rng: np.random.Generator = np.random.default_rng(),
@@ -88,7 +101,114 @@ def cylinder_bell_funnel(
         PARAMETERS.VARIANCE_AMPLITUDE
     ],
     include_negatives: bool = True,
+    method: str = default_values[BASE_OSCILLATIONS][PARAMETERS.CBF_METHOD],
 ) -> np.ndarray:
+    if method not in CBF_METHODS:
+        raise ValueError(
+            f"Unknown cylinder-bell-funnel method '{method}'! Use one of {', '.join(CBF_METHODS)}."
+        )
+    if method == "legacy":
+        return _cylinder_bell_funnel_legacy(
+            rng,
+            length,
+            avg_pattern_length,
+            avg_amplitude,
+            default_variance,
+            variance_pattern_length,
+            variance_amplitude,
+            include_negatives,
+        )
+
+    data = rng.normal(0, default_variance, length)
+    starts, lengths = _draw_pattern_positions(
+        rng, length, avg_pattern_length, variance_pattern_length
+    )
+    n_patterns = starts.shape[0]
+    if n_patterns == 0:
+        return data
+
+    kinds = rng.integers(0, 3, size=n_patterns)
+    amplitudes = rng.normal(avg_amplitude, variance_amplitude, n_patterns)
+    if include_negatives:
+        signs = np.where(rng.random(n_patterns) > 0.5, -1.0, 1.0)
+    else:
+        signs = np.ones(n_patterns)
+
+    # every pattern is a line: offset * slope + intercept
+    # 0: bell (a * i / n), 1: funnel (a * (n - 1 - i) / n), 2: cylinder (a)
+    amplitudes *= signs
+    slopes = np.select([kinds == 0, kinds == 1], [1.0, -1.0], 0.0) * (
+        amplitudes / lengths
+    )
+    intercepts = np.select(
+        [kinds == 0, kinds == 1],
+        [0.0, amplitudes * (lengths - 1) / lengths],
+        amplitudes,
+    )
+
+    # position within its pattern for every point covered by a pattern
+    total_length = int(lengths.sum())
+    offsets = np.arange(total_length) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+    # the noise is symmetric, so we do not have to flip its sign for negative patterns
+    patterns = rng.normal(0, default_variance, total_length)
+    patterns += offsets * np.repeat(slopes, lengths)
+    patterns += np.repeat(intercepts, lengths)
+
+    data[offsets + np.repeat(starts, lengths)] = patterns
+    return data
+
+
+def _draw_pattern_positions(
+    rng: np.random.Generator,
+    length: int,
+    avg_pattern_length: int,
+    variance_pattern_length: float,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Draws the starts and lengths of consecutive, non-overlapping patterns that fit into the time series.
+
+    Patterns are separated by gaps drawn uniformly from ``[0, avg_pattern_length)``. The positions are drawn in batches
+    of the expected number of patterns until the time series is covered.
+    """
+    mean_step = avg_pattern_length + (avg_pattern_length - 1) / 2
+    batch_size = int(length / max(mean_step, 1) * 1.1) + 16
+    starts = []
+    lengths = []
+    position = 0
+    while position < length:
+        gaps = rng.integers(0, avg_pattern_length, size=batch_size)
+        batch_lengths = np.maximum(
+            1,
+            np.ceil(
+                rng.normal(avg_pattern_length, variance_pattern_length, batch_size)
+            ).astype(np.int64),
+        )
+        batch_starts = (
+            position + np.cumsum(gaps) + np.cumsum(batch_lengths) - batch_lengths
+        )
+        position = int(batch_starts[-1] + batch_lengths[-1])
+        starts.append(batch_starts)
+        lengths.append(batch_lengths)
+
+    all_starts = np.concatenate(starts)
+    all_lengths = np.concatenate(lengths)
+    # the pattern ends are strictly increasing: keep all patterns that end before the end of the time series
+    n_patterns = int(np.searchsorted(all_starts + all_lengths, length, side="left"))
+    return all_starts[:n_patterns], all_lengths[:n_patterns]
+
+
+# Taken from https://github.com/KDD-OpenSource/data-generation/blob/master/generation/cbf.py
+def _cylinder_bell_funnel_legacy(
+    rng: np.random.Generator,
+    length: int,
+    avg_pattern_length: int,
+    avg_amplitude: float,
+    default_variance: float,
+    variance_pattern_length: float,
+    variance_amplitude: float,
+    include_negatives: bool,
+) -> np.ndarray:
+    """Original implementation generating one pattern after the other (kept to reproduce seeded time series)."""
+
     def generate_bell(n: int, a: float, v: float) -> np.ndarray:
         bell = rng.normal(0, v, n) + a * np.arange(n) / n
         return bell
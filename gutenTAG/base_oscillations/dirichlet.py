@@ -2,7 +2,6 @@ from functools import partial
 from typing import Optional
 
 import numpy as np
-import scipy.special
 
 from . import BaseOscillation
 from .interface import BaseOscillationInterface
@@ -22,6 +21,7 @@ from ..utils.types import BOGenerationContext
 
 class Dirichlet(BaseOscillationInterface):
     KIND = BASE_OSCILLATION_NAMES.DIRICHLET
+    DETERMINISTIC = True
 
     def get_base_oscillation_kind(self) -> str:
         return self.KIND
@@ -56,6 +56,8 @@ def dirichlet(
     amplitude: float = default_values[BASE_OSCILLATIONS][PARAMETERS.AMPLITUDE],
     periodicity: float = default_values[BASE_OSCILLATIONS][PARAMETERS.PERIODICITY],
 ) -> np.ndarray:
+    import scipy.special
+
     assert (
         periodicity > 1
     ), "periodicity must be > 1, otherwise the dirichlet wave collapses"
@@ -1,6 +1,7 @@
-from typing import Optional
+import warnings
+from functools import lru_cache
+from typing import Optional, Tuple
 
-import neurokit2 as nk
 import numpy as np
 
 from . import BaseOscillation
@@ -17,6 +18,15 @@ from ..utils.types import BOGenerationContext
 # we fix the sampling rate to 100 points = 1s
 sampling_rate = 100
 
+ECG_ENGINES = ("neurokit", "template")
+# sampling rate (in Hz) and minimum duration (in s) of the neurokit2 simulation a beat template is extracted from
+TEMPLATE_SAMPLING_RATE = 500
+TEMPLATE_MIN_DURATION = 10
+# number of points per beat template
+TEMPLATE_POINTS = 512
+# standard deviation of the heart rate (in bpm) used for the beat-to-beat jitter; same as in neurokit2's simulation
+HEART_RATE_STD = {"simple": 0.0, "daubechies": 0.0, "ecgsyn": 1.0}
+
 
 class ECG(BaseOscillationInterface):
     KIND = BASE_OSCILLATION_NAMES.ECG
@@ -35,6 +45,7 @@ class ECG(BaseOscillationInterface):
         length: Optional[int] = None,
         frequency: Optional[float] = None,
         amplitude: Optional[float] = None,
+        window: Optional[Tuple[int, int]] = None,
         *args,
         **kwargs,
     ) -> np.ndarray:
@@ -42,7 +53,20 @@ class ECG(BaseOscillationInterface):
         frequency = frequency or self.frequency
         amplitude = amplitude or self.amplitude
 
-        return ecg(ctx.rng, length, frequency, amplitude, self.ecg_sim_method)
+        return ecg(
+            ctx.rng,
+            length,
+            frequency,
+            amplitude,
+            self.ecg_sim_method,
+            window=window,
+            engine=self.ecg_engine,
+        )
+
+    def generate_window(
+        self, ctx: BOGenerationContext, start: int, end: int, **kwargs
+    ) -> np.ndarray:
+        return self.generate_only_base(ctx, window=(start, end), **kwargs)
 
 
 def ecg(
@@ -51,20 +75,190 @@ def ecg(
     frequency: float = default_values[BASE_OSCILLATIONS][PARAMETERS.FREQUENCY],
     amplitude: float = default_values[BASE_OSCILLATIONS][PARAMETERS.AMPLITUDE],
     ecg_sim_method: str = default_values[BASE_OSCILLATIONS][PARAMETERS.ECG_SIM_METHOD],
+    window: Optional[Tuple[int, int]] = None,
+    engine: str = default_values[BASE_OSCILLATIONS][PARAMETERS.ECG_ENGINE],
 ) -> np.ndarray:
-    duration = length // sampling_rate
+    if engine not in ECG_ENGINES:
+        raise ValueError(
+            f"Unknown ECG engine '{engine}'! Use one of {', '.join(ECG_ENGINES)}."
+        )
     # frequency = beats per 100 points = beats per second
     heart_rate = int(frequency / 100 * sampling_rate * 60)
-    ecg = nk.ecg_simulate(
-        duration=duration,
+    random_state = int(rng.integers(0, int(1e9)))
+    if engine == "template":
+        start, end = window if window is not None else (0, length)
+        return (
+            _assemble_from_template(
+                random_state, start, end, heart_rate, ecg_sim_method
+            )
+            * amplitude
+        )
+
+    if window is not None:
+        return (
+            _ecg_window(random_state, length, heart_rate, ecg_sim_method, *window)
+            * amplitude
+        )
+
+    return _simulate(random_state, length, heart_rate, ecg_sim_method) * amplitude
+
+
+def _simulate(
+    random_state: int, length: int, heart_rate: int, ecg_sim_method: str
+) -> np.ndarray:
+    import neurokit2 as nk
+
+    return nk.ecg_simulate(
+        duration=length // sampling_rate,
         sampling_rate=sampling_rate,
         heart_rate=heart_rate,
         length=length,
-        random_state=rng.integers(0, int(1e9)),
+        random_state=random_state,
+        noise=0,
+        method=ecg_sim_method,
+    )
+
+
+def _ecg_window(
+    random_state: int,
+    length: int,
+    heart_rate: int,
+    ecg_sim_method: str,
+    start: int,
+    end: int,
+) -> np.ndarray:
+    """Computes ``_simulate(...)[start:end]`` with costs that scale with the window size.
+
+    neurokit2's simple method tiles a single cardiac cycle and resamples the result to the desired length with a
+    cubic spline (``scipy.ndimage.zoom``). Because the tiled signal is periodic, its spline coefficients are periodic as
+    well (apart from the first and last few beats), and we can evaluate the spline at the window's coordinates only.
+    Other simulation methods are stochastic, and we have to simulate the full signal.
+    """
+    n_beats = int((length // sampling_rate) * heart_rate / 60)
+    cycle_length = _cardiac_cycle().shape[0]
+    n = n_beats * cycle_length
+    if (
+        ecg_sim_method.lower() not in ["simple", "daubechies"]
+        or n_beats < 2 * _EDGE_BEATS
+    ):
+        return _simulate(random_state, length, heart_rate, ecg_sim_method)[start:end]
+
+    if n == length:
+        # neurokit2 does not resample the signal
+        return _cardiac_cycle()[np.arange(start, end) % cycle_length]
+
+    # coordinates of the output points in the tiled input signal (same as scipy.ndimage.zoom)
+    x = np.arange(start, end) * ((n - 1) / (length - 1))
+    i0 = int(np.floor(x[0])) - 2
+    i1 = int(np.floor(x[-1])) + 4
+    if i0 < 0 or i1 > n:
+        return _simulate(random_state, length, heart_rate, ecg_sim_method)[start:end]
+
+    edge, periodic = _cardiac_spline_coefficients()
+    idx = np.arange(i0, i1)
+    edge_length = _EDGE_BEATS * cycle_length
+    coefficients = periodic[idx % cycle_length]
+    left = idx < edge_length
+    coefficients[left] = edge[idx[left]]
+    right = idx >= n - edge_length
+    coefficients[right] = edge[idx[right] - (n - edge.shape[0])]
+
+    from scipy import ndimage
+
+    return ndimage.map_coordinates(
+        coefficients, [x - i0], order=3, mode="constant", prefilter=False
+    )
+
+
+# number of beats after which the boundary effects of the spline prefilter are below floating point precision
+_EDGE_BEATS = 6
+
+
+@lru_cache(maxsize=1)
+def _cardiac_cycle() -> np.ndarray:
+    """Single cardiac cycle of neurokit2's simple method (Daubechies wavelet followed by a resting phase)."""
+    import scipy.signal
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", DeprecationWarning)
+        cardiac = scipy.signal.wavelets.daub(10)
+    return np.concatenate([cardiac, np.zeros(10)]) * 10
+
+
+@lru_cache(maxsize=1)
+def _cardiac_spline_coefficients() -> Tuple[np.ndarray, np.ndarray]:
+    """Cubic spline coefficients of the tiled cardiac cycle: for the edges of the signal and for a single period."""
+    from scipy import ndimage
+
+    cycle = _cardiac_cycle()
+    edge = ndimage.spline_filter(
+        np.tile(cycle, 2 * _EDGE_BEATS), 3, output=np.float64, mode="constant"
+    )
+    periodic = edge[_EDGE_BEATS * cycle.shape[0] : (_EDGE_BEATS + 1) * cycle.shape[0]]
+    edge.setflags(write=False)
+    periodic.setflags(write=False)
+    return edge, periodic
+
+
+def _assemble_from_template(
+    random_state: int, start: int, end: int, heart_rate: int, ecg_sim_method: str
+) -> np.ndarray:
+    """Assembles the points ``[start, end)`` of an ECG signal from copies of the beat template.
+
+    The beat durations vary randomly around the period of the heart rate (seeded by ``random_state``). Each point is
+    mapped to its beat and its phase within the beat, and the template is interpolated at this phase.
+    """
+    template = _beat_template(heart_rate, ecg_sim_method.lower())
+    period = 60 * sampling_rate / heart_rate
+    jitter = HEART_RATE_STD.get(ecg_sim_method.lower(), 0.0) / heart_rate
+    rng = np.random.default_rng(random_state)
+
+    n_beats = int(np.ceil(end / period * 1.1)) + 2
+    durations = period * np.clip(rng.normal(1.0, jitter, n_beats), 0.5, 1.5)
+    beat_starts = np.concatenate([[0.0], np.cumsum(durations)])
+    while beat_starts[-1] < end:
+        more = period * np.clip(rng.normal(1.0, jitter, n_beats), 0.5, 1.5)
+        durations = np.concatenate([durations, more])
+        beat_starts = np.concatenate([beat_starts, beat_starts[-1] + np.cumsum(more)])
+
+    t = np.arange(start, end, dtype=np.float64)
+    beat = np.searchsorted(beat_starts, t, side="right") - 1
+    phase = (t - beat_starts[beat]) / durations[beat]
+    return np.interp(phase * TEMPLATE_POINTS, np.arange(TEMPLATE_POINTS + 1), template)
+
+
+@lru_cache(maxsize=64)
+def _beat_template(heart_rate: int, ecg_sim_method: str) -> np.ndarray:
+    """A single beat simulated by neurokit2 (without heart rate variability), sampled at ``TEMPLATE_POINTS`` + 1
+    equidistant phases (the last point closes the cycle).
+
+    The template is the average over the inner beats of a simulation that contains an integer number of beats.
+    """
+    import neurokit2 as nk
+
+    # the simulation must contain an integer number of beats: duration * heart_rate / 60 must be an integer
+    min_duration = 60 // np.gcd(heart_rate, 60)
+    duration = int(min_duration * np.ceil(TEMPLATE_MIN_DURATION / min_duration))
+    n_beats = duration * heart_rate // 60
+    signal = nk.ecg_simulate(
+        duration=duration,
+        sampling_rate=TEMPLATE_SAMPLING_RATE,
+        heart_rate=heart_rate,
+        heart_rate_std=0,
+        random_state=0,
         noise=0,
         method=ecg_sim_method,
     )
-    return ecg * amplitude
+    period = signal.shape[0] / n_beats
+    # skip the first and last beat (transients of the dynamical model)
+    beats = np.arange(1, n_beats - 1)[:, np.newaxis]
+    phases = np.arange(TEMPLATE_POINTS)[np.newaxis, :] / TEMPLATE_POINTS
+    x = (beats + phases) * period
+    template = np.interp(x.ravel(), np.arange(signal.shape[0]), signal)
+    template = template.reshape(x.shape).mean(axis=0)
+    template = np.append(template, template[0])
+    template.setflags(write=False)
+    return template
 
 
 BaseOscillation.register(ECG.KIND, ECG)
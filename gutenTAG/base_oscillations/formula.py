@@ -2,7 +2,8 @@
 from __future__ import annotations
 
 from enum import Enum
-from typing import Optional, List, Dict, Any, NamedTuple, Union
+from functools import cached_property
+from typing import Optional, List, Dict, Any, NamedTuple, Sequence, Tuple
 
 import numpy as np
 
@@ -23,10 +24,13 @@ OPERAND = "operand"
 AGGREGATION = "aggregation"
 KIND = "kind"
 AXIS = "axis"
+# number of values per channel that are processed at once by the formula plan (fits into the L2 cache)
+CHUNK_SIZE = 2**14
 
 
 class Formula(BaseOscillationInterface):
     KIND = BASE_OSCILLATION_NAMES.FORMULA
+    USES_PREVIOUS_CHANNELS = True
 
     def get_base_oscillation_kind(self) -> str:
         return self.KIND
@@ -38,7 +42,12 @@ class Formula(BaseOscillationInterface):
         self, ctx: BOGenerationContext, *args, **kwargs
     ) -> np.ndarray:
         c = ctx.previous_channels if ctx.previous_channels else []
-        return formula(c, self.formula)
+        return self.plan.execute(c)
+
+    @cached_property
+    def plan(self) -> FormulaPlan:
+        """The formula compiled once and reused for all variants of the dataset."""
+        return FormulaPlan.compile(self.formula)
 
 
 def formula(
@@ -47,7 +56,7 @@ def formula(
         PARAMETERS.FORMULA
     ],
 ) -> np.ndarray:
-    return FormulaParser(formula_dict).parse(previous_channels).execute()
+    return FormulaPlan.compile(formula_dict).execute(previous_channels)
 
 
 BaseOscillation.register(Formula.KIND, Formula)
@@ -60,8 +69,22 @@ class OperationType(Enum):
     Divide = "/"
     Power = "**"
 
-    def __call__(self, operand_a: np.ndarray, operand_b: np.ndarray) -> np.ndarray:
-        return eval(f"operand_a {self.value} operand_b")
+    def __call__(
+        self,
+        operand_a: np.ndarray,
+        operand_b: np.ndarray,
+        out: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        if (
+            self == OperationType.Power
+            and np.ndim(operand_b) == 0
+            and np.issubdtype(np.result_type(operand_a), np.inexact)
+        ):
+            # same shortcuts as NumPy's ``**`` operator (they differ in the last bits from ``np.power``)
+            shortcut = _POWER_SHORTCUTS.get(float(operand_b))
+            if shortcut is not None:
+                return shortcut(operand_a, out=out)
+        return _OPERATION_UFUNCS[self](operand_a, operand_b, out=out)
 
 
 class AggregationType(Enum):
@@ -73,74 +96,85 @@ class AggregationType(Enum):
     Var = "var"
 
     def __call__(self, base: np.ndarray, axis: Optional[int] = None) -> np.ndarray:
-        return eval(f"base.{self.value}(axis=axis)")
-
-
-class Operation(NamedTuple):
-    kind: OperationType
-    operand: Union[float, FormulaObj]
-
-    def _get_operand(self) -> np.ndarray:
-        if isinstance(self.operand, (float, np.floating)):
-            return np.array(self.operand)
-        return self.operand.execute()
+        return _AGGREGATION_FUNCS[self](base, axis=axis)
+
+
+_OPERATION_UFUNCS = {
+    OperationType.Plus: np.add,
+    OperationType.Minus: np.subtract,
+    OperationType.Multiply: np.multiply,
+    OperationType.Divide: np.true_divide,
+    OperationType.Power: np.power,
+}
+_POWER_SHORTCUTS = {2.0: np.square, 0.5: np.sqrt, -1.0: np.reciprocal}
+_AGGREGATION_FUNCS = {
+    AggregationType.Sum: np.sum,
+    AggregationType.Min: np.min,
+    AggregationType.Max: np.max,
+    AggregationType.Median: np.median,
+    AggregationType.Std: np.std,
+    AggregationType.Var: np.var,
+}
+
+
+class PlanStep(NamedTuple):
+    # "channel", "constant", "operation", or "aggregation"
+    kind: str
+    # channel id, constant value, (OperationType, operand a, operand b), or (AggregationType, base, axis); operands
+    # refer to previous steps
+    args: Tuple
+    # whether the step produces a series (instead of a scalar)
+    vector: bool
+    # number of aggregations the step depends on (transitively); steps of one stage are evaluated together
+    stage: int
+
+
+class FormulaPlan:
+    """Execution plan of a formula that is compiled once from its configuration and can be executed for different
+    channels.
+
+    The formula tree is flattened into a list of steps in evaluation order. Identical sub-expressions (e.g., the same
+    channel aggregation used twice) are shared. Operations dispatch directly to NumPy ufuncs and write into reused
+    buffers. The element-wise operations are evaluated in chunks of ``CHUNK_SIZE`` values, so that the intermediate
+    results stay in the cache; only the inputs of aggregations and the result are materialized.
+    """
 
-    def execute(self, base: np.ndarray) -> np.ndarray:
-        return self.kind(base, self._get_operand())
+    def __init__(self, formula: Dict[str, Any]):
+        self.formula = formula
+        self.steps: List[PlanStep] = []
+        self._step_ids: Dict[Tuple, int] = {}
+        self.root = self._compile(formula)
+        # steps, whose full series must be kept: inputs of aggregations, inputs of later stages, and the result
+        self.materialized = {self.root}
+        for step in self.steps:
+            if step.kind == "aggregation":
+                self.materialized.add(step.args[1])
+            elif step.kind == "operation":
+                for operand in step.args[1:]:
+                    if self.steps[operand].stage != step.stage:
+                        self.materialized.add(operand)
 
     @staticmethod
-    def from_dict(d: Dict, prev_channels: List[np.ndarray]) -> Operation:
-        kind = OperationType(d.get(KIND))
-        operand = d.get(OPERAND)
+    def compile(formula: Dict[str, Any]) -> FormulaPlan:
+        return FormulaPlan(formula)
 
+    def _add_step(self, kind: str, args: Tuple, vector: bool, stage: int) -> int:
+        key = (kind, args)
+        if key not in self._step_ids:
+            self._step_ids[key] = len(self.steps)
+            self.steps.append(PlanStep(kind, args, vector, stage))
+        return self._step_ids[key]
+
+    def _compile_operand(self, operand: Any) -> int:
         if isinstance(operand, (float, np.floating)):
-            operand = operand
+            return self._add_step("constant", (float(operand),), False, 0)
         elif isinstance(operand, dict):
-            operand = FormulaObj.from_dict(operand, prev_channels)
-        else:
-            raise ValueError(
-                "The Operand in Operation has to be either `float` or an `object`"
-            )
-        return Operation(kind=kind, operand=operand)
-
-
-class Aggregation(NamedTuple):
-    kind: AggregationType
-    axis: Optional[int] = None
-
-    def execute(self, base: np.ndarray) -> np.ndarray:
-        return self.kind(base, self.axis)
-
-    @staticmethod
-    def from_dict(d: Dict) -> Aggregation:
-        kind = AggregationType(d.get(KIND))
-        axis = d.get(AXIS, None)
-        return Aggregation(kind=kind, axis=axis)
-
-
-class FormulaObj(NamedTuple):
-    base: Union[int, FormulaObj]
-    prev_channels: List[np.ndarray]
-    operation: Optional[Operation] = None
-    aggregation: Optional[Aggregation] = None
+            return self._compile(operand)
+        raise ValueError(
+            "The Operand in Operation has to be either `float` or an `object`"
+        )
 
-    def _get_base(self) -> np.ndarray:
-        if isinstance(self.base, (int, np.integer)):
-            return self.prev_channels[self.base]
-        else:
-            return self.base.execute()
-
-    def execute(self) -> np.ndarray:
-        base = self._get_base()
-        if self.operation is not None:
-            return self.operation.execute(base)
-        elif self.aggregation is not None:
-            return self.aggregation.execute(base)
-        else:
-            return base
-
-    @staticmethod
-    def from_dict(d: Dict, prev_channels: List[np.ndarray]) -> FormulaObj:
+    def _compile(self, d: Dict) -> int:
         base = d.get(BASE)
         operation = d.get(OPERATION, None)
         aggregation = d.get(AGGREGATION, None)
@@ -149,35 +183,97 @@ class FormulaObj(NamedTuple):
         ), "Only one `operation` or `aggregation` can be set, not both!"
 
         if isinstance(base, dict):
-            base = FormulaObj.from_dict(base, prev_channels=prev_channels)
-        elif not isinstance(base, (float, np.floating, int, np.integer)):
+            base_id = self._compile(base)
+        elif isinstance(base, (int, np.integer)):
+            base_id = self._add_step("channel", (int(base),), True, 0)
+        elif isinstance(base, (float, np.floating)):
+            base_id = self._add_step("constant", (float(base),), False, 0)
+        else:
             raise ValueError("Base must be `float` or `object`.")
+        base_step = self.steps[base_id]
 
         if operation is not None:
-            if isinstance(operation, dict):
-                return FormulaObj(
-                    base=base,
-                    prev_channels=prev_channels,
-                    operation=Operation.from_dict(operation, prev_channels),
-                )
-            else:
+            if not isinstance(operation, dict):
                 raise ValueError("The Operation has to be an `object`.")
+            kind = OperationType(operation.get(KIND))
+            operand_id = self._compile_operand(operation.get(OPERAND))
+            operand_step = self.steps[operand_id]
+            return self._add_step(
+                "operation",
+                (kind, base_id, operand_id),
+                base_step.vector or operand_step.vector,
+                max(base_step.stage, operand_step.stage),
+            )
         elif aggregation is not None:
-            if isinstance(aggregation, dict):
-                return FormulaObj(
-                    base=base,
-                    prev_channels=prev_channels,
-                    aggregation=Aggregation.from_dict(aggregation),
-                )
-            else:
+            if not isinstance(aggregation, dict):
                 raise ValueError("The Aggregation has to be an `object`.")
-        else:
-            return FormulaObj(base=base, prev_channels=prev_channels)
-
-
-class FormulaParser:
-    def __init__(self, formula: Dict[str, Any]):
-        self.formula = formula
+            kind = AggregationType(aggregation.get(KIND))
+            axis = aggregation.get(AXIS, None)
+            # all channels are one-dimensional: every aggregation results in a scalar
+            return self._add_step(
+                "aggregation", (kind, base_id, axis), False, base_step.stage + 1
+            )
+        return base_id
 
-    def parse(self, prev_channels: List[np.ndarray]) -> FormulaObj:
-        return FormulaObj.from_dict(self.formula, prev_channels)
+    def execute(
+        self, channels: Sequence[np.ndarray], chunk_size: int = CHUNK_SIZE
+    ) -> np.ndarray:
+        values: List[Any] = [None] * len(self.steps)
+        for i, step in enumerate(self.steps):
+            if step.kind == "channel":
+                values[i] = channels[step.args[0]]
+            elif step.kind == "constant":
+                values[i] = np.float64(step.args[0])
+
+        n_stages = max(step.stage for step in self.steps) + 1
+        for stage in range(n_stages):
+            vector_steps = []
+            for i, step in enumerate(self.steps):
+                if step.stage != stage or step.kind in ("channel", "constant"):
+                    continue
+                if step.vector:
+                    vector_steps.append(i)
+                elif step.kind == "aggregation":
+                    kind, base, axis = step.args
+                    values[i] = kind(values[base], axis)
+                else:
+                    kind, a, b = step.args
+                    values[i] = kind(values[a], values[b])
+            if len(vector_steps) > 0:
+                self._execute_chunked(vector_steps, values, chunk_size)
+        return values[self.root]
+
+    def _execute_chunked(
+        self, step_ids: List[int], values: List[Any], chunk_size: int
+    ) -> None:
+        length = max(
+            len(values[operand])
+            for i in step_ids
+            for operand in self.steps[i].args[1:]
+            if self.steps[operand].vector and values[operand] is not None
+        )
+        buffers: Dict[int, np.ndarray] = {}
+        for i in step_ids:
+            if i in self.materialized:
+                values[i] = np.empty(length, dtype=np.float64)
+            else:
+                buffers[i] = np.empty(min(chunk_size, length), dtype=np.float64)
+
+        for start in range(0, length, chunk_size):
+            end = min(start + chunk_size, length)
+            chunk: Dict[int, np.ndarray] = {}
+
+            def operand(j: int) -> Any:
+                if j in chunk:
+                    return chunk[j]
+                elif self.steps[j].vector:
+                    return values[j][start:end]
+                return values[j]
+
+            for i in step_ids:
+                kind, a, b = self.steps[i].args
+                if i in buffers:
+                    out = buffers[i][: end - start]
+                else:
+                    out = values[i][start:end]
+                chunk[i] = kind(operand(a), operand(b), out=out)
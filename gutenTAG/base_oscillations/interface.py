@@ -1,5 +1,8 @@
+from __future__ import annotations
+
+import copy
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Optional, Tuple, Union
 
 import numpy as np
 
@@ -9,6 +12,12 @@ from ..utils.types import BOGenerationContext
 
 
 class BaseOscillationInterface(ABC):
+    # the base signal does not depend on the random number generator and can be shared between the variants of a
+    # dataset (see `GenerationContext.base_cache`)
+    DETERMINISTIC: bool = False
+    # the base signal is computed from the previous channels (`BOGenerationContext.previous_channels`)
+    USES_PREVIOUS_CHANNELS: bool = False
+
     def __init__(self, *args, **kwargs) -> None:
         # parameters
         self.length = kwargs.get(
@@ -51,6 +60,14 @@ class BaseOscillationInterface(ABC):
             PARAMETERS.SMOOTHING,
             default_values[BASE_OSCILLATIONS][PARAMETERS.SMOOTHING],
         )
+        self.convolution_method = kwargs.get(
+            PARAMETERS.CONVOLUTION_METHOD,
+            default_values[BASE_OSCILLATIONS][PARAMETERS.CONVOLUTION_METHOD],
+        )
+        self.cbf_method = kwargs.get(
+            PARAMETERS.CBF_METHOD,
+            default_values[BASE_OSCILLATIONS][PARAMETERS.CBF_METHOD],
+        )
         self.channel_diff = kwargs.get(
             PARAMETERS.CHANNEL_DIFF,
             default_values[BASE_OSCILLATIONS][PARAMETERS.CHANNEL_DIFF],
@@ -67,6 +84,10 @@ class BaseOscillationInterface(ABC):
             PARAMETERS.ECG_SIM_METHOD,
             default_values[BASE_OSCILLATIONS][PARAMETERS.ECG_SIM_METHOD],
         )
+        self.ecg_engine = kwargs.get(
+            PARAMETERS.ECG_ENGINE,
+            default_values[BASE_OSCILLATIONS][PARAMETERS.ECG_ENGINE],
+        )
         self.width = kwargs.get(
             PARAMETERS.WIDTH, default_values[BASE_OSCILLATIONS][PARAMETERS.WIDTH]
         )
@@ -105,29 +126,87 @@ class BaseOscillationInterface(ABC):
         self.offset = kwargs.get(
             PARAMETERS.OFFSET, default_values[BASE_OSCILLATIONS][PARAMETERS.OFFSET]
         )
+        # base oscillation this one was copied from for another channel (see `copy_for_channel`)
+        self.template: Optional[BaseOscillationInterface] = None
+
+    def copy_for_channel(self) -> BaseOscillationInterface:
+        """Returns a base oscillation with the same parameters for another channel (e.g., for the channels of a
+        ``base-oscillation`` template). The copy shares the parameters, but has its own generated components, and
+        shares the deterministic base signal with this base oscillation."""
+        bo = copy.copy(self)
+        bo.trend = copy.deepcopy(self.trend)
+        bo.timeseries = bo.noise = bo.trend_series = None
+        bo.template = self.template or self
+        return bo
 
     def generate_noise(
-        self, ctx: BOGenerationContext, variance: float, length: int
+        self,
+        ctx: BOGenerationContext,
+        variance: float,
+        length: Union[int, Tuple[int, int]],
     ) -> np.ndarray:
-        return ctx.rng.normal(0, variance, length)
+        if ctx.dtype == np.float64:
+            return ctx.rng.normal(0, variance, length)
+        # draw in the target precision instead of converting a float64 vector
+        noise = ctx.rng.standard_normal(length, dtype=ctx.dtype)
+        noise *= variance
+        return noise
 
     def _generate_trend(self, ctx: BOGenerationContext) -> np.ndarray:
-        trend_series = np.zeros(self.length)
+        trend_series = np.zeros(self.length, dtype=ctx.dtype)
         if self.trend:
             self.trend.length = self.length
             self.trend.generate_timeseries_and_variations(ctx)
             if self.trend.timeseries is not None:
                 trend_series = self.trend.timeseries
             if self.trend.trend_series is not None:
-                trend_series += self.trend.trend_series
+                trend_series = trend_series + self.trend.trend_series
         return trend_series
 
-    def generate_timeseries_and_variations(self, ctx: BOGenerationContext, **kwargs):
-        self.timeseries = self.generate_only_base(ctx, **kwargs)
-        self.trend_series = self._generate_trend(ctx.to_trend())
-        self.noise = self.generate_noise(
-            ctx, self.variance * self.amplitude, self.length
-        )
+    def _generate_base(self, ctx: BOGenerationContext, **kwargs) -> np.ndarray:
+        if not self.DETERMINISTIC or ctx.base_cache is None:
+            return self.generate_only_base(ctx, **kwargs)
+
+        key = (id(self.template or self), self.length)
+        if key not in ctx.base_cache:
+            base = self.generate_only_base(ctx, **kwargs)
+            # shared between variants: must not be modified in-place
+            base.setflags(write=False)
+            ctx.base_cache[key] = base
+        return ctx.base_cache[key]
+
+    def generate_timeseries_and_variations(
+        self, ctx: BOGenerationContext, out: Optional[np.ndarray] = None, **kwargs
+    ):
+        """Generates the base oscillation, its trend, and its noise in the precision ``ctx.dtype``. If ``out`` is
+        given (e.g., a column of the consolidated time series), the base oscillation is written into it and
+        ``timeseries`` refers to ``out``.
+        """
+        self._write_base(ctx, out, **kwargs)
+        self._generate_variations(ctx)
+
+    def _write_base(
+        self, ctx: BOGenerationContext, out: Optional[np.ndarray] = None, **kwargs
+    ) -> None:
+        with ctx.timings.measure("base", detail=self.get_base_oscillation_kind()):
+            # the base oscillations are computed in float64 (e.g., the phase of long sine waves would lose precision
+            # in float32) and only stored in the target precision
+            base = self._generate_base(ctx, **kwargs)
+            if out is not None:
+                out[:] = base
+                base = out
+            elif base.dtype != ctx.dtype:
+                base = base.astype(ctx.dtype)
+        self.timeseries = base
+
+    def _generate_variations(self, ctx: BOGenerationContext) -> None:
+        """Generates the trend and the noise (in this order, because both draw from ``ctx.rng``)."""
+        with ctx.timings.measure("trend"):
+            self.trend_series = self._generate_trend(ctx.to_trend())
+        with ctx.timings.measure("noise"):
+            self.noise = self.generate_noise(
+                ctx, self.variance * self.amplitude, self.length
+            )
 
     def is_periodic(self) -> bool:
         periods = self.get_timeseries_periods()
@@ -161,6 +240,18 @@ class BaseOscillationInterface(ABC):
     ) -> np.ndarray:
         raise NotImplementedError()
 
+    def generate_window(
+        self, ctx: BOGenerationContext, start: int, end: int, **kwargs
+    ) -> np.ndarray:
+        """
+        Generates only the index window ``[start, end)`` of the base oscillation (without trend and noise) using the
+        same phase as the full-length signal. The parameters in ``kwargs`` are passed to ``generate_only_base``.
+
+        The default implementation generates the full-length signal and slices it. Base oscillations that can
+        generate a window directly override this method, so that the costs scale with the window size.
+        """
+        return self.generate_only_base(ctx, **kwargs)[start:end]
+
     @classmethod
     def __subclasshook__(cls, C):
         if cls is BaseOscillationInterface:
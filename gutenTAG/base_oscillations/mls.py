@@ -1,13 +1,12 @@
 from typing import Optional
 
 import numpy as np
-from scipy import signal
-from scipy.stats import norm
-from sklearn.preprocessing import MinMaxScaler
 
 from . import BaseOscillation
 from .interface import BaseOscillationInterface
+from .utils.convolution import convolve_valid
 from .utils.math_func_support import SAMPLING_F
+from .utils.rescale import min_max_rescale
 from ..utils.default_values import default_values
 from ..utils.global_variables import (
     BASE_OSCILLATION_NAMES,
@@ -36,6 +35,7 @@ class MLS(BaseOscillationInterface):
         amplitude: Optional[float] = None,
         smoothing: Optional[float] = None,
         complexity: Optional[int] = None,
+        convolution_method: Optional[str] = None,
         *args,
         **kwargs,
     ) -> np.ndarray:
@@ -43,8 +43,9 @@ class MLS(BaseOscillationInterface):
         a: float = amplitude or self.amplitude
         v_smoothing: float = smoothing or self.smoothing
         v_complexity: int = complexity or self.complexity
+        v_convolution_method: str = convolution_method or self.convolution_method
 
-        return mls(ctx.rng, n, a, v_smoothing, v_complexity)
+        return mls(ctx.rng, n, a, v_smoothing, v_complexity, v_convolution_method)
 
 
 def mls(
@@ -53,7 +54,13 @@ def mls(
     amplitude: float = default_values[BASE_OSCILLATIONS][PARAMETERS.AMPLITUDE],
     smoothing: float = default_values[BASE_OSCILLATIONS][PARAMETERS.SMOOTHING],
     complexity: int = default_values[BASE_OSCILLATIONS][PARAMETERS.COMPLEXITY],
+    convolution_method: str = default_values[BASE_OSCILLATIONS][
+        PARAMETERS.CONVOLUTION_METHOD
+    ],
 ) -> np.ndarray:
+    from scipy import signal
+    from scipy.stats import norm
+
     assert 1 < complexity < 16, "Complexity should be between 1 and 16 inclusive!"
 
     taps = rng.integers(1, complexity, endpoint=True, size=rng.integers(1, 3))
@@ -68,18 +75,13 @@ def mls(
         data = signal.max_len_seq(nbits=complexity, state=state, taps=taps)[0] * 2 - 1
         data = data.cumsum()
         data = np.tile(data, (new_n // data.shape[0]) + 1)[:new_n]
-        data = np.convolve(data, gaussian, "valid")
+        data = convolve_valid(data, gaussian, convolution_method)
     else:
         data = signal.max_len_seq(nbits=complexity, state=state, taps=taps)[0] * 2 - 1
         data = data.cumsum()
         data = np.tile(data, (length // data.shape[0]) + 1)[:length]
 
-    data = (
-        MinMaxScaler((-amplitude, amplitude))
-        .fit_transform(data.reshape(-1, 1))
-        .reshape(-1)
-    )
-    return data
+    return min_max_rescale(data, (-amplitude, amplitude))
 
 
 BaseOscillation.register(MLS.KIND, MLS)
@@ -15,6 +15,7 @@ from ..utils.types import BOGenerationContext
 
 class Polynomial(BaseOscillationInterface):
     KIND = BASE_OSCILLATION_NAMES.POLYNOMIAL
+    DETERMINISTIC = True
 
     def get_base_oscillation_kind(self) -> str:
         return self.KIND
@@ -1,11 +1,11 @@
 from typing import Optional
 
 import numpy as np
-from scipy.stats import norm
-from sklearn.preprocessing import MinMaxScaler
 
 from . import BaseOscillation
 from .interface import BaseOscillationInterface
+from .utils.convolution import convolve_valid
+from .utils.rescale import min_max_rescale
 from ..utils.default_values import default_values
 from ..utils.global_variables import (
     BASE_OSCILLATION_NAMES,
@@ -30,14 +30,16 @@ class RandomWalk(BaseOscillationInterface):
         length: Optional[int] = None,
         amplitude: Optional[float] = None,
         smoothing: Optional[float] = None,
+        convolution_method: Optional[str] = None,
         *args,
         **kwargs,
     ) -> np.ndarray:
         length = length or self.length
         amplitude = amplitude or self.amplitude
         smoothing = smoothing or self.smoothing
+        convolution_method = convolution_method or self.convolution_method
 
-        return random_walk(ctx.rng, length, amplitude, smoothing)
+        return random_walk(ctx.rng, length, amplitude, smoothing, convolution_method)
 
 
 def _gen_steps(rng: np.random.Generator, length: int) -> np.ndarray:
@@ -50,21 +52,22 @@ def random_walk(
     length: int = default_values[BASE_OSCILLATIONS][PARAMETERS.LENGTH],
     amplitude: float = default_values[BASE_OSCILLATIONS][PARAMETERS.AMPLITUDE],
     smoothing: float = default_values[BASE_OSCILLATIONS][PARAMETERS.SMOOTHING],
+    convolution_method: str = default_values[BASE_OSCILLATIONS][
+        PARAMETERS.CONVOLUTION_METHOD
+    ],
 ) -> np.ndarray:
+    from scipy.stats import norm
+
     if smoothing:
         filter_size = int(smoothing * length)
         ts = _gen_steps(rng, length + filter_size - 1)
         gaussian = norm.pdf(np.linspace(-1.5, 1.5, filter_size))
         ts_filter = gaussian / gaussian.sum()
-        ts = np.convolve(ts, ts_filter, "valid")
+        ts = convolve_valid(ts, ts_filter, convolution_method)
     else:
         ts = _gen_steps(rng, length)
 
-    return (
-        MinMaxScaler(feature_range=(-amplitude, amplitude))
-        .fit_transform(ts.reshape(-1, 1))
-        .reshape(-1)
-    )
+    return min_max_rescale(ts, (-amplitude, amplitude), out=ts)
 
 
 BaseOscillation.register(RandomWalk.KIND, RandomWalk)
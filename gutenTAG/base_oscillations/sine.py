@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Optional, Tuple
 
 import numpy as np
 
@@ -20,6 +20,7 @@ from ..utils.types import BOGenerationContext
 
 class Sine(BaseOscillationInterface):
     KIND = BASE_OSCILLATION_NAMES.SINE
+    DETERMINISTIC = True
 
     def get_base_oscillation_kind(self) -> str:
         return self.KIND
@@ -34,6 +35,7 @@ class Sine(BaseOscillationInterface):
         frequency: Optional[float] = None,
         amplitude: Optional[float] = None,
         freq_mod: Optional[float] = None,
+        window: Optional[Tuple[int, int]] = None,
         *args,
         **kwargs,
     ) -> np.ndarray:
@@ -42,7 +44,12 @@ class Sine(BaseOscillationInterface):
         a: float = amplitude or self.amplitude
         v_freq_mod: float = freq_mod or self.freq_mod  # factor of f
 
-        return sine(n, f, a, v_freq_mod)
+        return sine(n, f, a, v_freq_mod, window=window)
+
+    def generate_window(
+        self, ctx: BOGenerationContext, start: int, end: int, **kwargs
+    ) -> np.ndarray:
+        return self.generate_only_base(ctx, window=(start, end), **kwargs)
 
 
 def sine(
@@ -50,8 +57,9 @@ def sine(
     frequency: float = default_values[BASE_OSCILLATIONS][PARAMETERS.FREQUENCY],
     amplitude: float = default_values[BASE_OSCILLATIONS][PARAMETERS.AMPLITUDE],
     freq_mod: float = default_values[BASE_OSCILLATIONS][PARAMETERS.FREQ_MOD],
+    window: Optional[Tuple[int, int]] = None,
 ) -> np.ndarray:
-    base_ts = prepare_base_signal(length, frequency)
+    base_ts = prepare_base_signal(length, frequency, window)
     return generate_periodic_signal(base_ts, np.sin, amplitude, freq_mod)
 
 
@@ -1,8 +1,7 @@
 from functools import partial
-from typing import Optional
+from typing import Optional, Tuple
 
 import numpy as np
-from scipy import signal
 
 from . import BaseOscillation
 from .interface import BaseOscillationInterface
@@ -22,6 +21,7 @@ from ..utils.types import BOGenerationContext
 
 class Square(BaseOscillationInterface):
     KIND = BASE_OSCILLATION_NAMES.SQUARE
+    DETERMINISTIC = True
 
     def get_base_oscillation_kind(self) -> str:
         return self.KIND
@@ -37,6 +37,7 @@ class Square(BaseOscillationInterface):
         amplitude: Optional[float] = None,
         freq_mod: Optional[float] = None,
         duty: Optional[float] = None,
+        window: Optional[Tuple[int, int]] = None,
         *args,
         **kwargs,
     ) -> np.ndarray:
@@ -46,7 +47,12 @@ class Square(BaseOscillationInterface):
         v_freq_mod: float = freq_mod or self.freq_mod  # factor of f
         v_duty: float = duty or self.duty
 
-        return square(n, f, a, v_freq_mod, v_duty)
+        return square(n, f, a, v_freq_mod, v_duty, window=window)
+
+    def generate_window(
+        self, ctx: BOGenerationContext, start: int, end: int, **kwargs
+    ) -> np.ndarray:
+        return self.generate_only_base(ctx, window=(start, end), **kwargs)
 
 
 def square(
@@ -55,8 +61,11 @@ def square(
     amplitude: float = default_values[BASE_OSCILLATIONS][PARAMETERS.AMPLITUDE],
     freq_mod: float = default_values[BASE_OSCILLATIONS][PARAMETERS.FREQ_MOD],
     duty: float = default_values[BASE_OSCILLATIONS][PARAMETERS.DUTY],
+    window: Optional[Tuple[int, int]] = None,
 ) -> np.ndarray:
-    base_ts = prepare_base_signal(length, frequency)
+    from scipy import signal
+
+    base_ts = prepare_base_signal(length, frequency, window)
     func = partial(signal.square, duty=duty)
     return generate_periodic_signal(base_ts, func, amplitude, freq_mod)
 
@@ -0,0 +1,61 @@
+import numpy as np
+
+
+CONVOLUTION_METHODS = ("auto", "direct", "fft")
+# Filter size (in taps) starting from which the FFT-based convolution outperforms the direct convolution (see
+# benchmarks/convolution.py). The opt-in method "auto" uses the FFT-based convolution starting from this size, which
+# changes the last bits of the smoothed values; the default method "direct" keeps all results bit-identical.
+FFT_FILTER_SIZE_THRESHOLD = 512
+
+
+def choose_convolution_method(filter_size: int, method: str = "auto") -> str:
+    """Resolves the convolution method ``"auto"`` to either ``"direct"`` or ``"fft"`` based on the filter size.
+
+    Parameters
+    ----------
+    filter_size : int
+        number of taps of the convolution filter
+    method : str
+        one of ``"auto"``, ``"direct"``, or ``"fft"``
+    Returns
+    -------
+    method : str
+        the concrete convolution method: ``"direct"`` or ``"fft"``
+    """
+    if method not in CONVOLUTION_METHODS:
+        raise ValueError(
+            f"Unknown convolution method '{method}'! Use one of {', '.join(CONVOLUTION_METHODS)}."
+        )
+    if method == "auto":
+        return "fft" if filter_size >= FFT_FILTER_SIZE_THRESHOLD else "direct"
+    return method
+
+
+def convolve_valid(
+    data: np.ndarray, kernel: np.ndarray, method: str = "direct"
+) -> np.ndarray:
+    """Convolves the signal with the filter and returns only the parts that are computed without zero-padding (mode
+    ``"valid"``).
+
+    The direct method is equivalent to ``np.convolve(data, kernel, "valid")`` and costs O(n*m). The FFT method uses
+    overlap-add (``scipy.signal.oaconvolve``), costs O(n log m), and produces the same result up to floating point
+    precision.
+
+    Parameters
+    ----------
+    data : np.ndarray
+        signal (1-dimensional)
+    kernel : np.ndarray
+        convolution filter (1-dimensional)
+    method : str
+        one of ``"auto"``, ``"direct"``, or ``"fft"``
+    Returns
+    -------
+    result : np.ndarray
+        convolved signal of length ``len(data) - len(kernel) + 1``
+    """
+    if choose_convolution_method(kernel.shape[0], method) == "fft":
+        from scipy import signal
+
+        return signal.oaconvolve(data, kernel, mode="valid")
+    return np.convolve(data, kernel, "valid")
@@ -1,4 +1,4 @@
-from typing import Optional, Callable
+from typing import Optional, Callable, Tuple
 
 import numpy as np
 
@@ -16,15 +16,22 @@ def calc_n_periods(n: int, f: float) -> int:
     return int(n / SAMPLING_F * f)
 
 
-def prepare_base_signal(n: int, f: float) -> np.ndarray:
+def prepare_base_signal(
+    n: int, f: float, window: Optional[Tuple[int, int]] = None
+) -> np.ndarray:
     """Creates the index base signal for mathematical functions using np.linspace and the factor 2*PI.
 
+    If ``window`` is given, only the part ``[start, end)`` of the base signal is computed. The result is the same as
+    slicing the full base signal, but the costs scale with the window size instead of the signal length.
+
     Parameters
     ----------
     n : int
         length in number of points
     f : float
         base frequency in Hz (cycles/periods per second (per default: per 100 points))
+    window : Optional[Tuple[int, int]]
+        optional index window ``(start, end)`` of the base signal to compute
     Returns
     -------
     base : np.ndarray
@@ -39,11 +46,30 @@ def prepare_base_signal(n: int, f: float) -> np.ndarray:
     # print(f"period length={calc_period_length(f)} points")
     # print(f"length={n} points")
 
-    t = np.linspace(0, duration, n)  # in seconds
+    if window is None:
+        t = np.linspace(0, duration, n)  # in seconds
+    else:
+        t = linspace_window(duration, n, *window)
     base = 2 * np.pi * f * t
     return base
 
 
+def linspace_window(stop: float, num: int, start: int, end: int) -> np.ndarray:
+    """Computes ``np.linspace(0, stop, num)[start:end]`` without materializing the other values.
+
+    The values are bit-identical to the ones of the full ``np.linspace`` call.
+    """
+    start, end, _ = slice(start, end).indices(num)
+    if num <= 1:
+        return np.linspace(0, stop, num)[start:end]
+    step = np.float64(stop) / (num - 1)
+    t = np.arange(start, max(start, end), dtype=np.float64)
+    t *= step
+    if end == num and end > start:
+        t[-1] = stop
+    return t
+
+
 def generate_periodic_signal(
     base: np.ndarray,
     func: Callable[[np.ndarray], np.ndarray],
@@ -0,0 +1,47 @@
+from typing import Optional, Tuple
+
+import numpy as np
+
+
+def min_max_rescale(
+    x: np.ndarray,
+    feature_range: Tuple[float, float] = (0.0, 1.0),
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """Linearly rescales the values of ``x`` to the interval ``feature_range``.
+
+    Produces the same results as ``sklearn.preprocessing.MinMaxScaler(feature_range).fit_transform(x.reshape(-1, 1))``
+    (including its handling of constant signals), but without the 2-dimensional reshaping, the input validation, and
+    the intermediate copies. Pass ``out=x`` to rescale a floating point array in-place.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        signal to rescale (the minimum and maximum are computed over all values)
+    feature_range : Tuple[float, float]
+        desired minimum and maximum of the rescaled signal
+    out : Optional[np.ndarray]
+        preallocated output buffer of the same shape as ``x`` (may be ``x`` itself)
+    Returns
+    -------
+    rescaled : np.ndarray
+        rescaled signal (``out`` if it was given)
+    """
+    if feature_range[0] >= feature_range[1]:
+        raise ValueError(
+            f"Minimum of desired feature range must be smaller than maximum. Got {feature_range}."
+        )
+    if not np.issubdtype(x.dtype, np.floating):
+        x = x.astype(np.float64)
+    a_min, a_max = np.asarray(feature_range, dtype=x.dtype)
+    data_min = x.min()
+    data_range = x.max() - data_min
+    # avoid division by (almost) zero for constant signals
+    if data_range < 10 * np.finfo(data_range.dtype).eps:
+        data_range = np.ones_like(data_range)
+    scale = (a_max - a_min) / data_range
+    offset = a_min - data_min * scale
+
+    rescaled = np.multiply(x, scale, out=out)
+    rescaled += offset
+    return rescaled
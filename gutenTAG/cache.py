@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Sequence
+
+import numpy as np
+
+from ._version import __version__
+from .generator import TimeSeries
+from .generator.timeseries import NPY_LABELS_SUFFIX
+from .timeseries import OutputFormat
+from .utils.atomic import atomic_path
+from .utils.global_variables import (
+    UNSUPERVISED_FILENAME,
+    SUPERVISED_FILENAME,
+    SEMI_SUPERVISED_FILENAME,
+)
+
+
+@dataclass
+class CacheEntry:
+    key: str
+    config: Dict
+    data: Dict[str, Any]
+    files: List[str]
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self), default=_to_json)
+
+    @staticmethod
+    def from_json(serialized: str) -> Optional[CacheEntry]:
+        """Returns the entry or ``None`` if ``serialized`` is not a valid cache entry."""
+        try:
+            entry = json.loads(serialized)
+            return CacheEntry(
+                key=str(entry["key"]),
+                config=dict(entry["config"]),
+                data=dict(entry["data"]),
+                files=[str(f) for f in entry["files"]],
+            )
+        except (ValueError, TypeError, KeyError):
+            return None
+
+
+def _to_json(value: Any) -> Any:
+    # the add-on data may contain NumPy scalars and arrays
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class GenerationCache:
+    """Content-addressed cache for generated datasets.
+
+    A dataset is identified by a key that is derived from its (normalized) raw configuration, its effective seed,
+    the output format, the used add-ons, and the GutenTAG version. Next to the files of a generated dataset, a marker
+    file stores the key, the final configuration, and the add-on data (as JSON), so that cached datasets contribute to
+    the overview and the add-on results (e.g., the TimeEval metadata) without being generated again.
+
+    The key includes the dataset name, because the effective seed and the add-on data (e.g., the file paths in the
+    TimeEval metadata) depend on it. Thus, only datasets with the same name are reused: in re-runs and across output
+    folders sharing a ``cache_dir``. Datasets with different names are never deduplicated, even if their
+    configurations are otherwise identical.
+
+    Cached datasets are looked up in the output folder itself and, if given, in the additional cache directory
+    ``cache_dir`` (one sub-folder per key), which can be shared between different output folders.
+    """
+
+    MARKER_FILENAME = ".gutentag-cache.json"
+    # added to the configurations in the overview file and, thus, not part of the content
+    IGNORED_CONFIG_KEYS = ("generation-id",)
+
+    def __init__(self, cache_dir: Optional[os.PathLike] = None):
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+
+    @staticmethod
+    def compute_key(
+        ts: TimeSeries,
+        config: Dict,
+        seed: int,
+        output_format: OutputFormat,
+        addon_names: Sequence[str] = (),
+    ) -> str:
+        normalized_config = {
+            k: v
+            for k, v in config.items()
+            if k not in GenerationCache.IGNORED_CONFIG_KEYS
+        }
+        content = {
+            "config": normalized_config,
+            "name": ts.dataset_name,
+            "seed": ts.next_seed(seed).entropy,
+            "format": output_format.value,
+            "dtype": ts.dtype.name,
+            "addons": list(addon_names),
+            "version": __version__,
+        }
+        serialized = json.dumps(content, sort_keys=True, default=str)
+        return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def dataset_files(ts: TimeSeries, output_format: OutputFormat) -> List[str]:
+        filenames = [UNSUPERVISED_FILENAME]
+        if ts.supervised:
+            filenames.append(SUPERVISED_FILENAME)
+        if ts.semi_supervised:
+            filenames.append(SEMI_SUPERVISED_FILENAME)
+        files = [output_format.filename(f) for f in filenames]
+        if output_format == OutputFormat.NPY:
+            files += [f"{Path(f).stem}{NPY_LABELS_SUFFIX}" for f in files]
+        return files
+
+    def lookup(self, key: str, dataset_folder: Path) -> Optional[CacheEntry]:
+        """Returns the cache entry for ``key`` if the dataset is already present in ``dataset_folder`` or, after
+        copying it to ``dataset_folder``, if it is present in the cache directory."""
+        entry = self._read_entry(dataset_folder, key)
+        if entry is not None:
+            return entry
+
+        if self.cache_dir is None:
+            return None
+        cache_folder = self.cache_dir / key
+        entry = self._read_entry(cache_folder, key)
+        if entry is not None:
+            dataset_folder.mkdir(parents=True, exist_ok=True)
+            for f in entry.files:
+                shutil.copy2(cache_folder / f, dataset_folder / f)
+            self._write_marker(dataset_folder, entry)
+        return entry
+
+    def store(self, entry: CacheEntry, dataset_folder: Path) -> None:
+        """Registers the freshly generated dataset in ``dataset_folder`` (and copies it to the cache directory)."""
+        self._write_marker(dataset_folder, entry)
+        if self.cache_dir is not None:
+            cache_folder = self.cache_dir / entry.key
+            cache_folder.mkdir(parents=True, exist_ok=True)
+            for f in entry.files:
+                shutil.copy2(dataset_folder / f, cache_folder / f)
+            # the marker is written last, so that incomplete entries are never used
+            self._write_marker(cache_folder, entry)
+
+    @staticmethod
+    def _read_entry(folder: Path, key: str) -> Optional[CacheEntry]:
+        marker = folder / GenerationCache.MARKER_FILENAME
+        if not marker.is_file():
+            return None
+        try:
+            entry = CacheEntry.from_json(marker.read_text())
+        except (OSError, UnicodeDecodeError):
+            return None
+        if entry is None or entry.key != key:
+            return None
+        if not all((folder / f).is_file() for f in entry.files):
+            return None
+        return entry
+
+    @staticmethod
+    def _write_marker(folder: Path, entry: CacheEntry) -> None:
+        with atomic_path(folder / GenerationCache.MARKER_FILENAME) as tmp:
+            tmp.write_text(entry.to_json())
+
+
+class RunJournal(GenerationCache):
+    """Journal of the datasets completed by a (resumable) run in the output folder.
+
+    After all files of a dataset have been written (atomically), its entry (the same as the one of a cache marker) is
+    appended as a line of JSON to the journal file in the output folder. A resumed run with the same configuration and
+    seed skips the datasets that have a journal entry with the same key and whose files are present, and takes their
+    final configuration and add-on data from the journal. A line that was cut off by a crash is ignored.
+    """
+
+    FILENAME = ".gutentag-journal.jsonl"
+
+    def __init__(self, output_folder: os.PathLike):
+        super().__init__()
+        self.path = Path(output_folder) / self.FILENAME
+        self.entries: Dict[str, CacheEntry] = {}
+        # a crash while appending may leave a partial line without the line break
+        self._complete_line = True
+        if self.path.is_file():
+            content = self.path.read_text()
+            for line in content.splitlines():
+                entry = CacheEntry.from_json(line)
+                if entry is not None:
+                    self.entries[entry.key] = entry
+            self._complete_line = content.endswith("\n") or not content
+
+    def lookup(self, key: str, dataset_folder: Path) -> Optional[CacheEntry]:
+        entry = self.entries.get(key)
+        if entry is None or not all(
+            (dataset_folder / f).is_file() for f in entry.files
+        ):
+            return None
+        return entry
+
+    def store(self, entry: CacheEntry, dataset_folder: Path) -> None:
+        self.entries[entry.key] = entry
+        with self.path.open("a") as f:
+            f.write(("" if self._complete_line else "\n") + entry.to_json() + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        self._complete_line = True
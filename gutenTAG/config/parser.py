@@ -3,12 +3,14 @@ from __future__ import annotations
 import logging
 from copy import deepcopy
 from dataclasses import dataclass, asdict
-from typing import Dict, Optional, Tuple, List
+from itertools import product
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple, List
 
 from ..anomalies import Anomaly, Position, AnomalyKind, BaseAnomaly
 from ..base_oscillations import BaseOscillationInterface, BaseOscillation
 from ..utils.compatibility import Compatibility
 from ..utils.default_values import default_values
+from .validator import ConfigValidator
 from ..utils.global_variables import (
     BASE_OSCILLATION,
     BASE_OSCILLATIONS,
@@ -23,15 +25,21 @@ class GenerationOptions:
     semi_supervised: bool = False
     supervised: bool = False
     dataset_name: Optional[str] = None
+    # name and seed of the original time series of a replica (see `TimeSeries.replicate`)
+    replica_of: Optional[str] = None
+    replica_seed: Optional[int] = None
 
     def to_dict(self):
         return asdict(self)
 
     @staticmethod
     def from_dict(d: Dict) -> GenerationOptions:
+        replica = d.get(PARAMETERS.REPLICA, {})
         return GenerationOptions(
             semi_supervised=d.get("semi-supervised", False),
             supervised=d.get("supervised", False),
+            replica_of=replica.get("of"),
+            replica_seed=replica.get("seed"),
         )
 
 
@@ -40,6 +48,46 @@ ResultType = List[
 ]
 
 
+def expand_grid(template: Dict, name: str) -> Iterator[Tuple[str, Dict]]:
+    """Lazily expands a time series configuration with a parameter ``grid`` into one configuration per combination
+    of the grid values (Cartesian product in the order of the grid keys).
+
+    The grid maps parameter paths (keys and list indices separated by dots, e.g. ``base-oscillations.0.frequency``)
+    to lists of values. The expanded configurations are named deterministically: placeholders ``{<path>}`` in the
+    name are replaced by the values; unless the name contains a placeholder for every grid path, the index of the
+    combination is appended (``<name>-<index>``), so that the names are unique.
+    """
+    grid: Dict[str, List] = template[PARAMETERS.GRID]
+    base = {k: v for k, v in template.items() if k != PARAMETERS.GRID}
+    all_placeholders = all(f"{{{path}}}" in name for path in grid)
+    for index, values in enumerate(product(*grid.values())):
+        ts = deepcopy(base)
+        expanded_name = name
+        for path, value in zip(grid, values):
+            _set_path(ts, path, deepcopy(value), name)
+            expanded_name = expanded_name.replace(f"{{{path}}}", str(value))
+        if not all_placeholders:
+            expanded_name = f"{expanded_name}-{index}"
+        ts[PARAMETERS.NAME] = expanded_name
+        yield expanded_name, ts
+
+
+def _set_path(config: Dict, path: str, value: Any, name: str) -> None:
+    *parents, last = path.split(".")
+    node: Any = config
+    try:
+        for key in parents:
+            node = node[int(key)] if isinstance(node, list) else node[key]
+        if isinstance(node, list):
+            node[int(last)] = value
+        else:
+            node[last] = value
+    except (KeyError, IndexError, ValueError, TypeError):
+        raise ValueError(
+            f"Time series {name}: Invalid grid parameter '{path}'."
+        ) from None
+
+
 def decode_trend_obj(
     trend: Dict, length_overwrite: int
 ) -> Optional[BaseOscillationInterface]:
@@ -60,30 +108,74 @@ class ConfigParser:
         self.skip_errors = skip_errors
 
     def parse(self, config: Dict) -> ResultType:
-        for i, ts in enumerate(config.get(TIMESERIES, [])):
-            name = ts.get(PARAMETERS.NAME, f"ts_{i}")
-
-            bos, n_channel = self._extract_bos(ts, name)
-
-            if self._skip_name(name) or not self._check_compatibility(
-                ts, name, bos, n_channel
-            ):
-                continue
-
-            raw_ts_config = deepcopy(ts)
-            self.raw_ts_configs.append(raw_ts_config)
-
-            generation_options = GenerationOptions.from_dict(ts)
-            generation_options.dataset_name = name
-
-            base_oscillations = self._build_base_oscillations(ts, bos)
-            anomalies = self._build_anomalies(ts, name)
+        for result in self.iter_parse(config):
+            self.raw_ts_configs.append(result[3])
+            self.result.append(result)
+        return self.result
 
-            self.result.append(
-                (base_oscillations, anomalies, generation_options, raw_ts_config)
+    def iter_parse(
+        self, config: Dict
+    ) -> Iterator[
+        Tuple[List[BaseOscillationInterface], List[Anomaly], GenerationOptions, Dict]
+    ]:
+        """Parses the time series configurations one after another. In contrast to :meth:`parse`, the results are
+        not collected, and parameter grids are expanded lazily (see :func:`expand_grid`). The expanded configurations
+        are validated against the schema one by one, because the substituted grid values are not part of the
+        validated template.
+        """
+        for name, ts, bos in self._iter_configs(config):
+            base_oscillations, anomalies, generation_options = self._build_timeseries(
+                ts, name, bos
             )
-
-        return self.result
+            yield base_oscillations, anomalies, generation_options, ts
+
+    def iter_configs(self, config: Dict) -> Iterator[Tuple[str, Dict]]:
+        """Yields the names and the (expanded and validated) configurations of the time series like
+        :meth:`iter_parse`, but without building the generator objects (see :meth:`parse_timeseries`).
+        """
+        for name, ts, _ in self._iter_configs(config):
+            yield name, ts
+
+    def _iter_configs(self, config: Dict) -> Iterator[Tuple[str, Dict, List[Dict]]]:
+        for i, template in enumerate(config.get(TIMESERIES, [])):
+            grid = PARAMETERS.GRID in template
+            if grid:
+                # the expanded configurations are fresh copies already
+                timeseries: Iterable[Tuple[str, Dict]] = expand_grid(
+                    template, template.get(PARAMETERS.NAME, f"ts_{i}")
+                )
+            else:
+                timeseries = [
+                    (template.get(PARAMETERS.NAME, f"ts_{i}"), deepcopy(template))
+                ]
+            for name, ts in timeseries:
+                if self._skip_name(name):
+                    continue
+                if grid:
+                    ConfigValidator().validate_timeseries(ts, i)
+
+                bos, n_channel = self._extract_bos(ts, name)
+                if not self._check_compatibility(ts, name, bos, n_channel):
+                    continue
+                yield name, ts, bos
+
+    def parse_timeseries(
+        self, ts: Dict, name: str
+    ) -> Tuple[List[BaseOscillationInterface], List[Anomaly], GenerationOptions]:
+        """Builds the generator objects of a single, already validated time series configuration (e.g. the raw
+        configuration returned by :meth:`parse` in :attr:`raw_ts_configs`)."""
+        bos, _ = self._extract_bos(ts, name)
+        return self._build_timeseries(ts, name, bos)
+
+    def _build_timeseries(
+        self, ts: Dict, name: str, bos: List[Dict]
+    ) -> Tuple[List[BaseOscillationInterface], List[Anomaly], GenerationOptions]:
+        generation_options = GenerationOptions.from_dict(ts)
+        generation_options.dataset_name = name
+
+        base_oscillations = self._build_base_oscillations(ts, bos)
+        anomalies = self._build_anomalies(ts, name)
+        return base_oscillations, anomalies, generation_options
 
     def _check_compatibility(
         self, ts: Dict, name: str, bos: list[dict], n_channels: int
@@ -118,7 +210,16 @@ class ConfigParser:
         length = d.get(
             PARAMETERS.LENGTH, default_values[BASE_OSCILLATIONS][PARAMETERS.LENGTH]
         )
-        return [self._build_single_base_oscillation(bo, length) for bo in bos]
+        # the channels of a `base-oscillation` template are built once and copied (instead of parsed per channel)
+        templates: Dict[int, BaseOscillationInterface] = {}
+        base_oscillations = []
+        for bo in bos:
+            if id(bo) in templates:
+                base_oscillations.append(templates[id(bo)].copy_for_channel())
+            else:
+                templates[id(bo)] = self._build_single_base_oscillation(bo, length)
+                base_oscillations.append(templates[id(bo)])
+        return base_oscillations
 
     def _extract_bos(self, d: Dict, name: str) -> Tuple[List[Dict], int]:
         if BASE_OSCILLATIONS in d:
@@ -1,7 +1,5 @@
-from typing import Any, Dict, Optional
-
-import jsonschema
-from jsonschema import RefResolver
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
 
 from ..anomalies import AnomalyKind
 from ..base_oscillations import BaseOscillation
@@ -28,64 +26,110 @@ class GutenTAGParseError(BaseException):
         )
 
 
+@lru_cache(maxsize=1)
+def _compiled_schema() -> Tuple[Any, Any, Any]:
+    """Loads the schema parts and compiles the validators for the whole configuration and for a single time series.
+
+    The schema is loaded, checked, and compiled only once per process; all :class:`ConfigValidator` instances share
+    the result.
+    """
+    from jsonschema import RefResolver
+    from jsonschema.validators import validator_for
+
+    loader: ConfigSchemaLoader = FileSystemConfigSchemaLoader.from_packaged_schema()
+    # load base schema
+    base_schema_name = CONFIG_SCHEMA.schema_name(CONFIG_SCHEMA.BASE_ID)
+    base_schema = loader.load_schema_file(CONFIG_SCHEMA.BASE_ID)
+
+    # load schema parts
+    schema_parts: dict[str, str] = {}
+    for schema_part_id in CONFIG_SCHEMA.SCHEMA_PART_IDS:
+        name = CONFIG_SCHEMA.schema_name(schema_part_id)
+        schema_parts[name] = loader.load_schema_file(schema_part_id)  # type: ignore
+
+    # create resolver containing all schema parts
+    resolver = RefResolver(
+        base_uri=base_schema_name, referrer=base_schema, store=schema_parts
+    )
+    cls = validator_for(base_schema)
+    cls.check_schema(base_schema)
+    validator = cls(base_schema, resolver=resolver)
+    ts_validator = cls(
+        {"$ref": f"{base_schema_name}#/properties/{TIMESERIES}/items"},
+        resolver=resolver,
+    )
+    return base_schema, validator, ts_validator
+
+
 class ConfigValidator:
     def __init__(self) -> None:
-        loader: ConfigSchemaLoader = FileSystemConfigSchemaLoader.from_packaged_schema()
-        # load base schema
-        base_schema_name = CONFIG_SCHEMA.schema_name(CONFIG_SCHEMA.BASE_ID)
-        base_schema = loader.load_schema_file(CONFIG_SCHEMA.BASE_ID)
-
-        # load schema parts
-        schema_parts: dict[str, str] = {}
-        for schema_part_id in CONFIG_SCHEMA.SCHEMA_PART_IDS:
-            name = CONFIG_SCHEMA.schema_name(schema_part_id)
-            schema_parts[name] = loader.load_schema_file(schema_part_id)  # type: ignore
-
-        # create resolver containing all schema parts
-        self.base_schema = base_schema
-        self.resolver = RefResolver(
-            base_uri=base_schema_name, referrer=base_schema, store=schema_parts
-        )
+        self.base_schema, self._validator, self._ts_validator = _compiled_schema()
+        self.resolver = self._validator.resolver
+
+    def validate(self, config: Dict, only: Optional[str] = None) -> None:
+        """Validates the configuration. If ``only`` is set, only the time series with this name is validated."""
+        self.gutentag_validate(config, only)
+        if only is None:
+            self._raise_best_error(self._validator, config)
+        else:
+            for t, ts in enumerate(config.get(TIMESERIES, [])):
+                if ts.get(PARAMETERS.NAME, f"ts_{t}") == only:
+                    self._raise_best_error(self._ts_validator, ts)
+
+    def validate_timeseries(self, ts: Dict, index: int = 0) -> None:
+        """Validates the configuration of a single time series (the ``index``-th entry of the configuration)."""
+        self._gutentag_validate_timeseries(index, ts)
+        self._raise_best_error(self._ts_validator, ts)
 
-    def validate(self, config: Dict) -> None:
-        self.gutentag_validate(config)
-        jsonschema.validate(config, self.base_schema, resolver=self.resolver)
+    @staticmethod
+    def _raise_best_error(validator: Any, instance: Dict) -> None:
+        # same as jsonschema.validate(), but without re-checking the schema itself
+        from jsonschema.exceptions import best_match
+
+        error = best_match(validator.iter_errors(instance))
+        if error is not None:
+            raise error
 
     @staticmethod
-    def gutentag_validate(config: Dict) -> None:
+    def gutentag_validate(config: Dict, only: Optional[str] = None) -> None:
         if TIMESERIES not in config:
             raise GutenTAGParseError(f"Key '{TIMESERIES}' not found in root object.")
 
         for t, ts in enumerate(config.get(TIMESERIES, [])):
-            name = ts.get(PARAMETERS.NAME, f"ts_{t}")
-            log_prefix = f"TS {name}"
+            if only is None or ts.get(PARAMETERS.NAME, f"ts_{t}") == only:
+                ConfigValidator._gutentag_validate_timeseries(t, ts)
 
-            if ANOMALIES not in ts:
-                raise GutenTAGParseError(log_prefix, f"Missing '{ANOMALIES}' property.")
+    @staticmethod
+    def _gutentag_validate_timeseries(t: int, ts: Dict) -> None:
+        name = ts.get(PARAMETERS.NAME, f"ts_{t}")
+        log_prefix = f"TS {name}"
 
-            if BASE_OSCILLATION not in ts and BASE_OSCILLATIONS not in ts:
-                raise GutenTAGParseError(
-                    log_prefix, f"Missing '{BASE_OSCILLATIONS}' property."
-                )
+        if ANOMALIES not in ts:
+            raise GutenTAGParseError(log_prefix, f"Missing '{ANOMALIES}' property.")
 
-            if BASE_OSCILLATION in ts and PARAMETERS.CHANNELS not in ts:
-                raise GutenTAGParseError(
-                    log_prefix,
-                    f"If a single '{BASE_OSCILLATION}' is defined, the property '{PARAMETERS.CHANNELS}' is required.",
-                )
+        if BASE_OSCILLATION not in ts and BASE_OSCILLATIONS not in ts:
+            raise GutenTAGParseError(
+                log_prefix, f"Missing '{BASE_OSCILLATIONS}' property."
+            )
 
-            # check base oscillations
-            bos = ts.get(
-                BASE_OSCILLATIONS,
-                [ts.get(BASE_OSCILLATION)] * ts.get(PARAMETERS.CHANNELS, 0),
+        if BASE_OSCILLATION in ts and PARAMETERS.CHANNELS not in ts:
+            raise GutenTAGParseError(
+                log_prefix,
+                f"If a single '{BASE_OSCILLATION}' is defined, the property '{PARAMETERS.CHANNELS}' is required.",
             )
-            for i, bo in enumerate(bos):
-                ConfigValidator._validate_bo(i, bo, log_prefix)
 
-            # check anomaly definitions
-            anoms = ts.get(ANOMALIES, [])
-            for i, anom in enumerate(anoms):
-                ConfigValidator._validate_anomaly(i, anom, log_prefix)
+        # check base oscillations
+        bos = ts.get(
+            BASE_OSCILLATIONS,
+            [ts.get(BASE_OSCILLATION)] * ts.get(PARAMETERS.CHANNELS, 0),
+        )
+        for i, bo in enumerate(bos):
+            ConfigValidator._validate_bo(i, bo, log_prefix)
+
+        # check anomaly definitions
+        anoms = ts.get(ANOMALIES, [])
+        for i, anom in enumerate(anoms):
+            ConfigValidator._validate_anomaly(i, anom, log_prefix)
 
     @staticmethod
     def _validate_bo(i: int, bo: Dict[str, Any], log_prefix: str) -> None:
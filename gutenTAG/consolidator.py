@@ -1,13 +1,27 @@
-from typing import List, Optional, Tuple
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from contextlib import nullcontext
+from functools import partial
+from typing import Callable, Iterator, List, Optional, Tuple, Literal
 
 import numpy as np
 
-from gutenTAG.anomalies import Anomaly, AnomalyProtocol, LabelRange
+from gutenTAG.anomalies import (
+    Anomaly,
+    AnomalyProtocol,
+    LabelRange,
+    AnomalyPositionIndex,
+)
 from gutenTAG.base_oscillations import BaseOscillationInterface
-from gutenTAG.utils.types import GenerationContext
+from gutenTAG.utils.types import GenerationContext, BOGenerationContext
+
+# minimum number of values (length x channels) of a time series to generate its channels with multiple threads
+THREADING_THRESHOLD = 2**20
 
 
 class Consolidator:
+    # memory layout of the consolidated time series: column-major ("F") keeps the channels contiguous
+    MEMORY_ORDERS = ("F", "C")
+
     def __init__(
         self,
         base_oscillations: List[BaseOscillationInterface],
@@ -15,7 +29,12 @@ class Consolidator:
         random_seed: Optional[int] = None,
         semi_supervised: Optional[bool] = None,
         supervised: Optional[bool] = None,
+        order: Literal["F", "C"] = "F",
     ) -> None:
+        if order not in self.MEMORY_ORDERS:
+            raise ValueError(
+                f"Unknown memory order '{order}'! Use one of {', '.join(self.MEMORY_ORDERS)}."
+            )
         self.consolidated_channels: List[BaseOscillationInterface] = base_oscillations
         self.anomalies: List[Anomaly] = anomalies
         self.generated_anomalies: List[Tuple[AnomalyProtocol, int]] = []
@@ -24,6 +43,7 @@ class Consolidator:
         self.random_seed: Optional[int] = random_seed
         self.semi_supervised: Optional[bool] = semi_supervised
         self.supervised: Optional[bool] = supervised
+        self.order = order
 
     def add_channel(self, channel: BaseOscillationInterface) -> None:
         self.consolidated_channels.append(channel)
@@ -32,30 +52,169 @@ class Consolidator:
         return self.consolidated_channels[channel]
 
     def generate(self, ctx: GenerationContext) -> Tuple[np.ndarray, np.ndarray]:
-        channels: List[np.ndarray] = []
-        for c, bo in enumerate(self.consolidated_channels):
-            bo.generate_timeseries_and_variations(
-                ctx.to_bo(c, channels),
-                semi_supervised=self.semi_supervised,
-                supervised=self.supervised,
-            )  # type: ignore  # timeseries gets set in generate_timeseries_and_variations()
-            if bo.timeseries is not None:
-                channels.append(bo.timeseries)
-        self.timeseries = self._stack_channels(channels)
-        labels = np.zeros(self.timeseries.shape[0], dtype=np.int8)
-        self.labels = labels
-        self.generate_anomalies(ctx)
-
-        self.apply_anomalies()
-        self.apply_variations()
+        # the base oscillations write directly into their column of the preallocated output
+        self.timeseries = self._allocate_timeseries(ctx.dtype)
+        threads = ctx.threads if self.timeseries.size >= THREADING_THRESHOLD else 1
+        with ThreadPoolExecutor(threads) if threads > 1 else nullcontext() as pool:
+            self._generate_channels(ctx, pool)
+            labels = np.zeros(self.timeseries.shape[0], dtype=np.int8)
+            self.labels = labels
+            self.generate_anomalies(ctx)
+
+            with ctx.timings.measure("apply-anomalies"):
+                self.apply_anomalies()
+            with ctx.timings.measure("apply-variations"):
+                self.apply_variations(pool, threads)
         return self.timeseries, labels
 
-    def apply_variations(self) -> None:
+    def _generate_channels(
+        self, ctx: GenerationContext, pool: Optional[Executor]
+    ) -> None:
+        """Generates the channels in order. With a thread ``pool``, the base signals of deterministic base
+        oscillations are computed in parallel, while everything that draws from the random number generator is
+        still drawn in the main thread in the serial order, so that the result is identical to serial generation.
+        """
+        assert self.timeseries is not None
+        channels: List[np.ndarray] = []
+        pending: List[Future] = []
+        for start, end in self._channel_blocks():
+            bo = self.consolidated_channels[start]
+            if bo.USES_PREVIOUS_CHANNELS:
+                # the base signals of all previous channels are the inputs of this channel
+                self._wait(pending)
+            bo_ctx = ctx.to_bo(start, channels if bo.USES_PREVIOUS_CHANNELS else ())
+            if end - start == 1 and not self._is_deferrable(bo):
+                bo.generate_timeseries_and_variations(
+                    bo_ctx,
+                    out=self.timeseries[:, start],
+                    semi_supervised=self.semi_supervised,
+                    supervised=self.supervised,
+                )
+            else:
+                write_base, generate_variations = self._split_generation(
+                    bo_ctx, start, end
+                )
+                if pool is not None:
+                    pending.append(pool.submit(write_base))
+                else:
+                    write_base()
+                generate_variations()
+            channels.extend(self.timeseries[:, c] for c in range(start, end))
+        self._wait(pending)
+
+    def _split_generation(
+        self, ctx: BOGenerationContext, start: int, end: int
+    ) -> Tuple[Callable[[], None], Callable[[], None]]:
+        """Splits the generation of the channels ``[start, end)`` into writing their (deterministic) base signal and
+        generating their variations (which draws from the random number generator)."""
+        assert self.timeseries is not None
+        kwargs = {
+            "semi_supervised": self.semi_supervised,
+            "supervised": self.supervised,
+        }
+        if end - start > 1:
+            return (
+                partial(self._write_block_base, ctx, start, end, **kwargs),
+                partial(self._generate_block_variations, ctx, start, end),
+            )
+        bo = self.consolidated_channels[start]
+        return (
+            partial(bo._write_base, ctx, self.timeseries[:, start], **kwargs),
+            partial(bo._generate_variations, ctx),
+        )
+
+    @staticmethod
+    def _wait(futures: List[Future]) -> None:
+        for future in futures:
+            future.result()
+        futures.clear()
+
+    def _channel_blocks(self) -> Iterator[Tuple[int, int]]:
+        """Splits the channels into ranges ``[start, end)``. Consecutive copies of the same deterministic base
+        oscillation without a trend (e.g., the channels of a ``base-oscillation`` template) form one range, all other
+        channels are generated on their own."""
+        start = 0
+        channels = self.consolidated_channels
+        for c in range(1, len(channels) + 1):
+            if (
+                c == len(channels)
+                or not self._is_block_channel(channels[c])
+                or (channels[c].template or channels[c])
+                is not (channels[start].template or channels[start])
+            ):
+                yield start, c
+                start = c
+
+    @staticmethod
+    def _is_deferrable(bo: BaseOscillationInterface) -> bool:
+        # the base signal does not draw from the random number generator and can be computed at any time
+        return (
+            bo.DETERMINISTIC
+            and type(bo).generate_timeseries_and_variations
+            is BaseOscillationInterface.generate_timeseries_and_variations
+        )
+
+    @staticmethod
+    def _is_block_channel(bo: BaseOscillationInterface) -> bool:
+        return Consolidator._is_deferrable(bo) and bo.trend is None
+
+    def _write_block_base(
+        self, ctx: BOGenerationContext, start: int, end: int, **kwargs
+    ) -> None:
+        """Computes the base signal of the channels ``[start, end)`` that share the same deterministic base
+        oscillation once and writes it into all their columns."""
+        assert self.timeseries is not None
+        bos = self.consolidated_channels[start:end]
+        with ctx.timings.measure("base", detail=bos[0].get_base_oscillation_kind()):
+            base = bos[0]._generate_base(ctx, **kwargs)
+            self.timeseries[:, start:end] = base[:, None]
+        for i, bo in enumerate(bos):
+            bo.timeseries = self.timeseries[:, start + i]
+
+    def _generate_block_variations(
+        self, bo_ctx: BOGenerationContext, start: int, end: int
+    ) -> None:
+        """Draws the noise of all channels ``[start, end)`` in one call (which yields the same values as drawing it
+        channel by channel)."""
+        assert self.timeseries is not None
+        bos = self.consolidated_channels[start:end]
+        length = self.timeseries.shape[0]
+        with bo_ctx.timings.measure("noise"):
+            noise = bos[0].generate_noise(
+                bo_ctx, bos[0].variance * bos[0].amplitude, (end - start, length)
+            )
+        # anomalies (e.g., trend anomalies) modify the trend of their channel in-place
+        trends = np.zeros((end - start, length), dtype=bo_ctx.dtype)
+        for i, bo in enumerate(bos):
+            bo.trend_series = trends[i]
+            bo.noise = noise[i]
+
+    def apply_variations(
+        self, pool: Optional[Executor] = None, threads: int = 1
+    ) -> None:
         if self.timeseries is None:
             raise AssertionError(
                 "You need to call `generate` before applying variations!"
             )
-        for c, bo in enumerate(self.consolidated_channels):
+        channels = len(self.consolidated_channels)
+        if pool is None:
+            self._apply_variations(0, channels)
+            return
+        # the channels are independent: apply the variations to chunks of channels in parallel
+        chunk = -(-channels // threads)
+        starts = range(0, channels, chunk)
+        list(
+            pool.map(
+                self._apply_variations,
+                starts,
+                [min(s + chunk, channels) for s in starts],
+            )
+        )
+
+    def _apply_variations(self, start: int, end: int) -> None:
+        assert self.timeseries is not None
+        for c in range(start, end):
+            bo = self.consolidated_channels[c]
             if bo.noise is not None:
                 self.timeseries[:, c] += bo.noise
             if bo.trend_series is not None:
@@ -78,20 +237,25 @@ class Consolidator:
         self._add_label_ranges_to_labels(label_ranges)
 
     def generate_anomalies(self, ctx: GenerationContext) -> None:
-        positions: List[Tuple[int, int]] = []
+        positions = AnomalyPositionIndex()
         for anomaly in self.anomalies:
             current_base_oscillation = self.consolidated_channels[anomaly.channel]
             anomaly_protocol = anomaly.generate(
                 ctx.to_anomaly(current_base_oscillation, positions)
             )
-            positions.append((anomaly_protocol.start, anomaly_protocol.end))
+            positions.add(anomaly_protocol.start, anomaly_protocol.end)
             self.generated_anomalies.append((anomaly_protocol, anomaly.channel))
 
-    def _stack_channels(self, channels: List[np.ndarray]) -> np.ndarray:
-        assert all(
-            [len(x.shape) == 1 for x in channels]
-        ), "The resulting channels have the wrong shape. Correct shape: `(l, d)`."
-        return np.vstack(channels).transpose()
+    def _allocate_timeseries(self, dtype: np.dtype) -> np.ndarray:
+        lengths = {bo.length for bo in self.consolidated_channels}
+        assert (
+            len(lengths) == 1
+        ), "All channels must have the same length. Correct shape: `(l, d)`."
+        return np.empty(
+            (lengths.pop(), len(self.consolidated_channels)),
+            dtype=dtype,
+            order=self.order,
+        )
 
     def _add_label_ranges_to_labels(self, label_ranges: List[LabelRange]) -> None:
         if self.labels is None:
@@ -1,10 +1,12 @@
 import os
-from typing import List, Dict, Optional, Any, Callable, Union
+from contextlib import contextmanager
+from typing import List, Dict, Optional, Any, Callable, Iterator, Union
 
-import git
 import numpy as np
 import yaml
 
+from ..utils.atomic import atomic_path
+
 
 class DictSanitizer:
     NUMPY_TYPES = tuple(list(np._core._type_aliases.allTypes.values()) + [np.ndarray])  # type: ignore # mypy does not find allTypes
@@ -71,14 +73,32 @@ class Overview:
     def __init__(self) -> None:
         self.datasets: List[Dict] = []
         self.seed: Optional[int] = None
-        self.git_commit_sha: Optional[str] = None
-
-        try:
-            self.git_commit_sha = git.Repo(
-                search_parent_directories=True
-            ).head.object.hexsha
-        except git.InvalidGitRepositoryError:
-            pass
+        # aggregated warnings of the generation (only written if set)
+        self.diagnostics: Optional[List[Dict]] = None
+        # index, count, and the original positions of the datasets of a sharded run (only written if set)
+        self.shard: Optional[Dict[str, Any]] = None
+        self._git_commit_sha: Optional[str] = None
+        self._git_commit_sha_resolved = False
+
+    @property
+    def git_commit_sha(self) -> Optional[str]:
+        # resolved lazily, because importing GitPython and searching for the repository is slow
+        if not self._git_commit_sha_resolved:
+            import git
+
+            try:
+                self._git_commit_sha = git.Repo(
+                    search_parent_directories=True
+                ).head.object.hexsha
+            except git.InvalidGitRepositoryError:
+                pass
+            self._git_commit_sha_resolved = True
+        return self._git_commit_sha
+
+    @git_commit_sha.setter
+    def git_commit_sha(self, sha: Optional[str]) -> None:
+        self._git_commit_sha = sha
+        self._git_commit_sha_resolved = True
 
     def add_seed(self, seed: Optional[int]) -> None:
         self.seed = seed
@@ -96,20 +116,48 @@ class Overview:
             self.datasets = [d for d in self.datasets if not name(d["name"])]
 
     def save_to_output_dir(self, path: os.PathLike) -> None:
-        overview: Dict[str, Any] = dict()
-        overview["generated-timeseries"] = []
-        for i, dataset in enumerate(self.datasets):
-            dataset["generation-id"] = dataset.get("base_oscillation", {}).get(
-                "title", i
-            )
-            overview["generated-timeseries"].append(dataset)
-
-        overview["meta"] = {}
-        overview["meta"]["seed"] = self.seed
-        overview["meta"]["git_commit_sha"] = self.git_commit_sha
-        overview["meta"]["download_link"] = self.GUTENTAG_LINK
-
-        overview = DictSanitizer().sanitize(overview)
-
-        with open(os.path.join(path, self.FILENAME), "w") as f:
-            yaml.dump(overview, f)
+        with self.stream_to_output_dir(path) as add_dataset:
+            for dataset in self.datasets:
+                add_dataset(dataset)
+
+    @contextmanager
+    def stream_to_output_dir(
+        self, path: os.PathLike
+    ) -> Iterator[Callable[[Dict], None]]:
+        """Writes the overview file incrementally, e.g. for streamed configurations, whose datasets are not kept in
+        :attr:`datasets`. The yielded function appends a dataset configuration to the file; the meta information is
+        written when the context is left. The file is only put in place if the context completes (see
+        :func:`~gutenTAG.utils.atomic.atomic_path`) and has the same content as :meth:`save_to_output_dir`.
+        """
+        sanitizer = DictSanitizer()
+        count = 0
+        with atomic_path(os.path.join(path, self.FILENAME)) as tmp:
+            with open(tmp, "w") as f:
+
+                def add_dataset(dataset: Dict) -> None:
+                    nonlocal count
+                    dataset["generation-id"] = dataset.get("base_oscillation", {}).get(
+                        "title", count
+                    )
+                    # the keys are sorted, so the datasets come before the meta information
+                    if count == 0:
+                        f.write("generated-timeseries:\n")
+                    yaml.dump([sanitizer.sanitize(dataset)], f)
+                    count += 1
+
+                yield add_dataset
+                if count == 0:
+                    f.write("generated-timeseries: []\n")
+                yaml.dump({"meta": sanitizer.sanitize(self._meta())}, f)
+
+    def _meta(self) -> Dict[str, Any]:
+        meta: Dict[str, Any] = {
+            "seed": self.seed,
+            "git_commit_sha": self.git_commit_sha,
+            "download_link": self.GUTENTAG_LINK,
+        }
+        if self.diagnostics is not None:
+            meta["diagnostics"] = self.diagnostics
+        if self.shard is not None:
+            meta["shard"] = self.shard
+        return meta
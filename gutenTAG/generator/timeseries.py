@@ -2,9 +2,9 @@ from __future__ import annotations
 
 from hashlib import md5
 from pathlib import Path
-from typing import Optional, List, Union
+from time import perf_counter
+from typing import Optional, List, Union, Tuple, Any, Dict, Sequence, TYPE_CHECKING
 
-import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 from numpy.random import SeedSequence
@@ -14,11 +14,18 @@ from ..base_oscillations import BaseOscillationInterface
 from ..consolidator import Consolidator
 from ..timeseries import (
     TrainingType,
+    OutputFormat,
     INDEX_COLUMN_NAME,
     LABEL_COLUMN_NAME,
     TimeSeries as ExtTimeSeries,
 )
-from ..utils.types import GenerationContext
+from ..utils.atomic import atomic_path
+from ..utils.diagnostics import Diagnostics
+from ..utils.timings import Timings
+from ..utils.types import GenerationContext, resolve_dtype
+
+if TYPE_CHECKING:
+    import matplotlib.pyplot as plt
 
 
 class TimeSeries:
@@ -29,6 +36,10 @@ class TimeSeries:
         dataset_name: str,
         semi_supervised: bool = False,
         supervised: bool = False,
+        share_deterministic_bases: bool = True,
+        dtype: Union[str, np.dtype, type] = np.float64,
+        replica_of: Optional[str] = None,
+        replica_seed: Optional[int] = None,
     ):
         self.dataset_name = dataset_name
         self.base_oscillations = base_oscillations
@@ -41,15 +52,59 @@ class TimeSeries:
         self.semi_train_labels: Optional[np.ndarray] = None
         self.semi_supervised = semi_supervised
         self.supervised = supervised
+        self.share_deterministic_bases = share_deterministic_bases
+        # floating point precision of the generated time series (float64 or float32)
+        self.dtype: np.dtype = resolve_dtype(dtype)
+        # wall-clock generation time (in seconds) of the variants
+        self.variant_timings: Dict[TrainingType, float] = {}
+        # a replica is generated like the time series `replica_of` with the seed `replica_seed`
+        self.replica_of = replica_of
+        self.replica_seed = replica_seed
+        # deterministic base oscillations shared with the other replicas (instead of only between the variants)
+        self.shared_base_cache: Optional[Dict[Any, np.ndarray]] = None
         self._rng_counter = 0
 
-    def generate(self, random_seed: Optional[int] = None) -> TimeSeries:
+    def generate(
+        self,
+        random_seed: Optional[int] = None,
+        timings: Optional[Timings] = None,
+        diagnostics: Optional[Diagnostics] = None,
+        threads: int = 1,
+    ) -> TimeSeries:
+        """Generates the test time series and the requested training variants. If given, the durations of the
+        generation stages are recorded in ``timings`` and the warnings are collected in ``diagnostics``. The
+        channels of large time series are generated with up to ``threads`` threads (the result does not depend on
+        the number of threads).
+        """
+        if timings is None:
+            timings = Timings.disabled()
+        if diagnostics is None:
+            diagnostics = Diagnostics(dataset=self.dataset_name)
+        # deterministic base oscillations are generated once and shared by all variants; only the stochastic parts
+        # (noise, random base oscillations, anomalies) are drawn for each variant
+        base_cache: Optional[Dict[Any, np.ndarray]] = (
+            {} if self.share_deterministic_bases else None
+        )
+        if self.share_deterministic_bases and self.shared_base_cache is not None:
+            base_cache = self.shared_base_cache
+        self.variant_timings = {}
+
+        start = perf_counter()
         consolidator = Consolidator(self.base_oscillations, self.anomalies)
         self.timeseries, self.labels = consolidator.generate(
-            GenerationContext(seed=self._create_new_seed(random_seed))
+            GenerationContext(
+                seed=self._create_new_seed(random_seed),
+                base_cache=base_cache,
+                timings=timings.bind(variant=TrainingType.TEST.value),
+                diagnostics=diagnostics,
+                dtype=self.dtype,
+                threads=threads,
+            )
         )
+        self.variant_timings[TrainingType.TEST] = perf_counter() - start
 
         if self.semi_supervised:
+            start = perf_counter()
             semi_supervised_consolidator = Consolidator(
                 self.base_oscillations, [], semi_supervised=self.semi_supervised
             )
@@ -57,10 +112,21 @@ class TimeSeries:
                 self.semi_supervised_timeseries,
                 self.semi_train_labels,
             ) = semi_supervised_consolidator.generate(
-                GenerationContext(seed=self._create_new_seed(random_seed))
+                GenerationContext(
+                    seed=self._create_new_seed(random_seed),
+                    base_cache=base_cache,
+                    timings=timings.bind(variant=TrainingType.TRAIN_NO_ANOMALIES.value),
+                    diagnostics=diagnostics,
+                    dtype=self.dtype,
+                    threads=threads,
+                )
+            )
+            self.variant_timings[TrainingType.TRAIN_NO_ANOMALIES] = (
+                perf_counter() - start
             )
 
         if self.supervised:
+            start = perf_counter()
             supervised_consolidator = Consolidator(
                 self.base_oscillations, self.anomalies, supervised=self.supervised
             )
@@ -68,8 +134,16 @@ class TimeSeries:
                 self.supervised_timeseries,
                 self.train_labels,
             ) = supervised_consolidator.generate(
-                GenerationContext(seed=self._create_new_seed(random_seed))
+                GenerationContext(
+                    seed=self._create_new_seed(random_seed),
+                    base_cache=base_cache,
+                    timings=timings.bind(variant=TrainingType.TRAIN_ANOMALIES.value),
+                    diagnostics=diagnostics,
+                    dtype=self.dtype,
+                    threads=threads,
+                )
             )
+            self.variant_timings[TrainingType.TRAIN_ANOMALIES] = perf_counter() - start
 
         return self
 
@@ -80,6 +154,8 @@ class TimeSeries:
         return self.to_dataframe()
 
     def plot(self) -> None:
+        import matplotlib.pyplot as plt
+
         n_series = 1 + np.sum([self.semi_supervised, self.supervised])
         fig, axs = plt.subplots(
             2, n_series, sharex="col", sharey="row", figsize=(6 * n_series, 5)
@@ -140,6 +216,8 @@ class TimeSeries:
             else "time series"
         )
 
+        import matplotlib.pyplot as plt
+
         fig, ax = plt.subplots()
         ax.plot(self.timeseries, label=name)
         return fig
@@ -162,9 +240,9 @@ class TimeSeries:
             )
         return results
 
-    def to_dataframe(
-        self, training_type: TrainingType = TrainingType.TEST
-    ) -> pd.DataFrame:
+    def _get_timeseries_and_labels(
+        self, training_type: TrainingType
+    ) -> Tuple[np.ndarray, Optional[np.ndarray]]:
         if training_type == TrainingType.TEST:
             ts, labels = self.timeseries, self.labels
         elif training_type == TrainingType.TRAIN_NO_ANOMALIES:
@@ -175,6 +253,12 @@ class TimeSeries:
         assert (
             ts is not None
         ), f"The timeseries for {training_type.value} must be generated before creating a DataFrame"
+        return ts, labels
+
+    def to_dataframe(
+        self, training_type: TrainingType = TrainingType.TEST
+    ) -> pd.DataFrame:
+        ts, labels = self._get_timeseries_and_labels(training_type)
         if labels is None:
             labels = np.zeros(ts.shape[0])
         channel_names = list(map(lambda i: f"value-{i}", range(ts.shape[1])))
@@ -183,23 +267,135 @@ class TimeSeries:
         df[LABEL_COLUMN_NAME] = labels
         return df
 
+    def save(
+        self,
+        path: Path,
+        training_type: TrainingType = TrainingType.TEST,
+        output_format: OutputFormat = OutputFormat.CSV,
+    ) -> None:
+        """Writes the time series atomically, so that an interrupted run never leaves a truncated file behind."""
+        if output_format == OutputFormat.NPY:
+            # writes two files, each of them atomically
+            self.to_npy(path, training_type)
+            return
+
+        with atomic_path(path) as tmp:
+            if output_format == OutputFormat.CSV:
+                self.to_csv(tmp, training_type)
+            elif output_format == OutputFormat.PARQUET:
+                self.to_parquet(tmp, training_type)
+            else:  # if output_format == OutputFormat.FEATHER:
+                self.to_feather(tmp, training_type)
+
     def to_csv(
         self, output_dir: Path, training_type: TrainingType = TrainingType.TEST
     ) -> None:
         df = self.to_dataframe(training_type)
         df.to_csv(output_dir, sep=",", index=True)
 
+    def to_npy(
+        self, path: Path, training_type: TrainingType = TrainingType.TEST
+    ) -> None:
+        """Writes the values (shape: length x channels) to ``path`` and the labels to ``<stem>.labels.npy``."""
+        ts, labels = self._get_timeseries_and_labels(training_type)
+        if labels is None:
+            labels = np.zeros(ts.shape[0], dtype=np.int8)
+        path = Path(path)
+        with atomic_path(path) as tmp:
+            np.save(tmp, ts)
+        with atomic_path(path.parent / f"{path.stem}{NPY_LABELS_SUFFIX}") as tmp:
+            np.save(tmp, labels)
+
+    def to_parquet(
+        self, path: Path, training_type: TrainingType = TrainingType.TEST
+    ) -> None:
+        _import_pyarrow("parquet")
+        import pyarrow.parquet as pq
+
+        pq.write_table(self._to_arrow_table(training_type), path)
+
+    def to_feather(
+        self, path: Path, training_type: TrainingType = TrainingType.TEST
+    ) -> None:
+        _import_pyarrow("feather")
+        import pyarrow.feather as feather
+
+        feather.write_feather(self._to_arrow_table(training_type), path)
+
+    def _to_arrow_table(self, training_type: TrainingType) -> Any:
+        import pyarrow as pa
+
+        ts, labels = self._get_timeseries_and_labels(training_type)
+        if labels is None:
+            labels = np.zeros(ts.shape[0], dtype=np.int8)
+        columns = {INDEX_COLUMN_NAME: pa.array(np.arange(ts.shape[0]))}
+        for i in range(ts.shape[1]):
+            columns[f"value-{i}"] = pa.array(ts[:, i])
+        columns[LABEL_COLUMN_NAME] = pa.array(labels)
+        return pa.table(columns)
+
+    def replicate(self, seeds: Sequence[Optional[int]]) -> List[TimeSeries]:
+        """Creates one replica ``<name>/replica-<k>`` of this time series per seed. Replica ``k`` is generated
+        exactly like this time series with the seed ``seeds[k]`` (or the seed of the run if it is ``None``).
+
+        The replicas share the generator objects, so that deterministic base oscillations are generated only once
+        for all replicas (if they are generated in the same process). Replicas must thus be generated one after
+        another.
+        """
+        base_cache: Dict[Any, np.ndarray] = {}
+        replicas = []
+        for k, seed in enumerate(seeds):
+            replica = TimeSeries(
+                self.base_oscillations,
+                self.anomalies,
+                f"{self.dataset_name}/replica-{k}",
+                semi_supervised=self.semi_supervised,
+                supervised=self.supervised,
+                share_deterministic_bases=self.share_deterministic_bases,
+                dtype=self.dtype,
+                replica_of=self.dataset_name,
+                replica_seed=seed,
+            )
+            replica.shared_base_cache = base_cache
+            replicas.append(replica)
+        return replicas
+
+    def next_seed(self, base_seed: Optional[int]) -> SeedSequence:
+        """Returns the seed sequence that the next call to :meth:`generate` starts with (without consuming it)."""
+        return self._derive_seed(base_seed, self._rng_counter)
+
     def _create_new_seed(self, base_seed: Optional[int]) -> SeedSequence:
+        seed = self._derive_seed(base_seed, self._rng_counter)
+        self._rng_counter += 1
+        return seed
+
+    def _derive_seed(self, base_seed: Optional[int], counter: int) -> SeedSequence:
+        if self.replica_seed is not None:
+            base_seed = self.replica_seed
         if base_seed is None:
             base_seed1: Union[int, SeedSequence] = SeedSequence()
         else:
             base_seed1 = base_seed
         seeds = [
             int.from_bytes(
-                md5(self.dataset_name.encode("utf-8")).digest(), byteorder="big"
+                md5((self.replica_of or self.dataset_name).encode("utf-8")).digest(),
+                byteorder="big",
             )
         ]
-        if self._rng_counter > 0:
-            seeds.append(self._rng_counter)
-        self._rng_counter += 1
+        if counter > 0:
+            seeds.append(counter)
         return GenerationContext.re_seed(seeds, base_seed1)
+
+
+# suffix of the label file written next to the values by the NPY output format
+NPY_LABELS_SUFFIX = ".labels.npy"
+
+
+def _import_pyarrow(output_format: str) -> None:
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError as ex:
+        raise ImportError(
+            f"The {output_format} output format requires the optional dependency 'pyarrow'! Please install it, e.g., "
+            "using `pip install timeeval-GutenTAG[formats]`."
+        ) from ex
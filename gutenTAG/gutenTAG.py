@@ -1,26 +1,61 @@
 from __future__ import annotations
 
 import json
+import logging
 import os
 import warnings
-from dataclasses import dataclass
+from contextlib import nullcontext
+from copy import deepcopy
+from dataclasses import dataclass, replace
+from itertools import chain
 from pathlib import Path
-from typing import List, Dict, Optional, Union, Callable, Sequence, Tuple, Any
+from typing import (
+    ContextManager,
+    List,
+    Dict,
+    Optional,
+    Union,
+    Callable,
+    Sequence,
+    Tuple,
+    Any,
+    Iterator,
+    NamedTuple,
+)
 
+import numpy as np
 import yaml
-from joblib import Parallel, delayed
 from tqdm import tqdm
 
 from .addons import import_addons, AddOnProcessContext, AddOnFinalizeContext, BaseAddOn
+from .anomalies import Anomaly
+from .base_oscillations import BaseOscillationInterface
+from .cache import GenerationCache, CacheEntry, RunJournal
 from .config import ConfigParser, ConfigValidator
+from .config.parser import GenerationOptions
 from .generator import Overview, TimeSeries
-from .timeseries import TrainingType, TimeSeries as ExtTimeSeries
+from .timeseries import TrainingType, OutputFormat, TimeSeries as ExtTimeSeries
 from .utils.global_variables import (
+    PARAMETERS,
     UNSUPERVISED_FILENAME,
     SUPERVISED_FILENAME,
     SEMI_SUPERVISED_FILENAME,
 )
-from .utils.tqdm_joblib import tqdm_joblib
+from .sharding import assign_shards
+from .utils.diagnostics import Diagnostics, LOGGER_NAME
+from .utils.timings import Timings
+from .utils.types import resolve_dtype
+
+
+class _GenerationResult(NamedTuple):
+    # overview configuration
+    config: Dict
+    # add-on data
+    data: Dict[str, Any]
+    # generated datasets (if requested)
+    datasets: Optional[List[ExtTimeSeries]]
+    timings: List[Dict[str, Any]]
+    diagnostics: List[Dict[str, Any]]
 
 
 @dataclass
@@ -30,6 +65,14 @@ class _GenerationContext:
     output_folder: Optional[os.PathLike] = None
     seed: Optional[int] = None
     addons: Sequence[BaseAddOn] = ()
+    # add-ons to instantiate in the worker processes (parallel generation)
+    addon_names: Sequence[str] = ()
+    output_format: OutputFormat = OutputFormat.CSV
+    profile: bool = False
+    # floating point precision of the time series built in the worker processes
+    dtype: str = "float64"
+    # threads per time series to generate the channels of large time series with
+    threads: int = 1
 
     def to_addon_process_ctx(
         self, timeseries: TimeSeries, config: Dict
@@ -39,54 +82,127 @@ class _GenerationContext:
             config=config,
             plot=self.plot,
             output_folder=self.output_folder,
+            output_format=self.output_format,
         )
 
 
 class GutenTAG:
     def __init__(
-        self, n_jobs: int = 1, seed: Optional[int] = None, addons: Sequence[str] = ()
+        self,
+        n_jobs: int = 1,
+        seed: Optional[int] = None,
+        addons: Sequence[str] = (),
+        dtype: Union[str, np.dtype, type] = np.float64,
+        n_threads: int = 1,
     ):
         self._overview = Overview()
         self._timeseries: List[TimeSeries] = []
+        # configurations (and their `only` filter) that are parsed lazily during the generation
+        self._streamed: List[Tuple[Dict, Optional[str]]] = []
         self._n_jobs = n_jobs
+        self._n_threads = n_threads
         # remove duplicate addons
         self._registered_addons: List[str] = []
         for addon in addons:
             self.use_addon(addon)
         self._overview.add_seed(seed)
         self.seed = seed
+        # floating point precision of all generated time series
+        self.dtype = resolve_dtype(dtype)
         self.addons: Dict[str, BaseAddOn] = {}
+        # warnings of the last generation run
+        self.diagnostics = Diagnostics()
 
     def load_config_json(
-        self, json_config_path: os.PathLike, only: Optional[str] = None
+        self,
+        json_config_path: os.PathLike,
+        only: Optional[str] = None,
+        stream: bool = False,
     ) -> GutenTAG:
         with open(json_config_path, "r") as f:
             config = json.load(f)
-        return self.load_config_dict(config, only)
+        return self.load_config_dict(config, only, stream)
 
     def load_config_yaml(
-        self, yaml_config_path: os.PathLike, only: Optional[str] = None
+        self,
+        yaml_config_path: os.PathLike,
+        only: Optional[str] = None,
+        stream: bool = False,
     ) -> GutenTAG:
         with open(yaml_config_path, "r") as f:
             config = yaml.load(f, Loader=yaml.FullLoader)
-        return self.load_config_dict(config, only)
+        return self.load_config_dict(config, only, stream)
+
+    def load_config_dict(
+        self, config: Dict, only: Optional[str] = None, stream: bool = False
+    ) -> GutenTAG:
+        """Loads the time series of the configuration.
+
+        If ``stream`` is enabled, the configuration is only validated now. Its time series (e.g., the combinations of
+        large parameter grids) are parsed, generated, and written one by one during the generation, so that neither
+        their configurations nor their generator objects are kept in memory. Streamed time series are generated after
+        the other loaded time series and cannot be sharded, replicated (with :meth:`replicate`), removed, or cached.
+        """
+        if stream:
+            ConfigValidator().validate(config, only=only)
+            self._streamed.append((config, only))
+            return self
 
-    def load_config_dict(self, config: Dict, only: Optional[str] = None) -> GutenTAG:
         # First parse, then validate config, because our own error messages are more precise than
         # the validator's ones.
         config_parser = ConfigParser(only=only)
         timeseries = []
-        for base_oscillations, anomalies, options, ts_config in config_parser.parse(
-            config
-        ):
-            ts = TimeSeries(base_oscillations, anomalies, **options.to_dict())
-            timeseries.append(ts)
-        ConfigValidator().validate(config)
+        ts_configs = []
+        for result in config_parser.iter_parse(config):
+            replicas, replica_configs = self._build_timeseries(*result)
+            timeseries.extend(replicas)
+            ts_configs.extend(replica_configs)
+        ConfigValidator().validate(config, only=only)
 
         self._timeseries.extend(timeseries)
-        self._overview.add_datasets(config_parser.raw_ts_configs)
+        self._overview.add_datasets(ts_configs)
         return self
 
+    def _build_timeseries(
+        self,
+        base_oscillations: List[BaseOscillationInterface],
+        anomalies: List[Anomaly],
+        options: GenerationOptions,
+        ts_config: Dict,
+    ) -> Tuple[List[TimeSeries], List[Dict]]:
+        ts = TimeSeries(
+            base_oscillations, anomalies, **options.to_dict(), dtype=self.dtype
+        )
+        if PARAMETERS.REPLICAS in ts_config:
+            return self._replicate(ts, ts_config, self._replica_seeds(ts_config))
+        return [ts], [ts_config]
+
+    def _replica_seeds(self, ts_config: Dict) -> List[Optional[int]]:
+        # replica k is generated with the seed `seed + k`
+        return [
+            None if self.seed is None else self.seed + k
+            for k in range(ts_config[PARAMETERS.REPLICAS])
+        ]
+
+    def _iter_streamed(self) -> Iterator[Tuple[TimeSeries, Dict]]:
+        for config, only in self._streamed:
+            for result in ConfigParser(only=only).iter_parse(config):
+                yield from zip(*self._build_timeseries(*result))
+
+    def _iter_streamed_configs(self) -> Iterator[Tuple[str, Dict]]:
+        """Yields the names and configurations of the streamed time series without building the generator objects
+        (the workers of the parallel generation build them from the configurations)."""
+        for config, only in self._streamed:
+            for name, ts_config in ConfigParser(only=only).iter_configs(config):
+                if PARAMETERS.REPLICAS not in ts_config:
+                    yield name, ts_config
+                    continue
+                for k, seed in enumerate(self._replica_seeds(ts_config)):
+                    replica_config = self._replica_config(
+                        ts_config, name, f"{name}/replica-{k}", k, seed
+                    )
+                    yield replica_config[PARAMETERS.NAME], replica_config
+
     def remove_by_name(self, name: Union[str, Callable[[str], bool]]) -> GutenTAG:
         if isinstance(name, str):
             self._timeseries = [
@@ -99,6 +215,81 @@ class GutenTAG:
         self._overview.remove_dataset_by_name(name)
         return self
 
+    def shard(self, index: int, count: int, strategy: str = "hash") -> GutenTAG:
+        """Keeps only the time series of shard ``index`` (numbered from 1) of ``count`` shards.
+
+        The time series keep their seeds. Generate all shards with the same configuration and seed (e.g., on
+        different hosts) and combine their outputs with :func:`gutenTAG.sharding.merge_shards` (``gutenTAG merge``).
+        See :func:`gutenTAG.sharding.assign_shards` for the strategies.
+        """
+        self._check_not_streamed("Sharding")
+        if not 1 <= index <= count:
+            raise ValueError(
+                f"The shard index must be between 1 and {count} (was {index})!"
+            )
+        shards = assign_shards(self._timeseries, count, strategy)
+        positions = [i for i, shard in enumerate(shards) if shard == index]
+        self._overview.shard = {
+            "index": index,
+            "count": count,
+            "strategy": strategy,
+            "total": len(shards),
+            "positions": positions,
+        }
+        self._timeseries = [self._timeseries[i] for i in positions]
+        self._overview.datasets = [self._overview.datasets[i] for i in positions]
+        return self
+
+    def replicate(self, name: str, seeds: Sequence[Optional[int]]) -> GutenTAG:
+        """Replaces the time series ``name`` by one replica per seed, which are written to ``<name>/replica-<k>``.
+
+        Replica ``k`` is identical to the time series generated with the seed ``seeds[k]``. The deterministic base
+        oscillations are generated only once for all replicas. The configuration key ``replicas: N`` creates ``N``
+        replicas with the seeds ``seed``, ``seed + 1``, ..., ``seed + N - 1`` of the run.
+        """
+        self._check_not_streamed("Replicating")
+        positions = [
+            i for i, ts in enumerate(self._timeseries) if ts.dataset_name == name
+        ]
+        if not positions:
+            raise ValueError(f"No time series with the name '{name}' loaded!")
+        i = positions[0]
+        replicas, configs = self._replicate(
+            self._timeseries[i], self._overview.datasets[i], seeds
+        )
+        self._timeseries[i : i + 1] = replicas
+        self._overview.datasets[i : i + 1] = configs
+        return self
+
+    def _check_not_streamed(self, operation: str) -> None:
+        if self._streamed:
+            raise ValueError(
+                f"{operation} is not supported for streamed configurations!"
+            )
+
+    @staticmethod
+    def _replicate(
+        ts: TimeSeries, config: Dict, seeds: Sequence[Optional[int]]
+    ) -> Tuple[List[TimeSeries], List[Dict]]:
+        replicas = ts.replicate(seeds)
+        configs = [
+            GutenTAG._replica_config(
+                config, ts.dataset_name, replica.dataset_name, k, replica.replica_seed
+            )
+            for k, replica in enumerate(replicas)
+        ]
+        return replicas, configs
+
+    @staticmethod
+    def _replica_config(
+        config: Dict, of: str, name: str, index: int, seed: Optional[int]
+    ) -> Dict:
+        replica_config = deepcopy(config)
+        replica_config.pop(PARAMETERS.REPLICAS, None)
+        replica_config[PARAMETERS.NAME] = name
+        replica_config[PARAMETERS.REPLICA] = {"of": of, "index": index, "seed": seed}
+        return replica_config
+
     def use_addon(
         self, addon: str, insert_location: Union[str, int] = "last"
     ) -> GutenTAG:
@@ -122,7 +313,109 @@ class GutenTAG:
         return_timeseries: bool = False,
         output_folder: Optional[os.PathLike] = None,
         plot: bool = False,
+        output_format: Union[str, OutputFormat] = OutputFormat.CSV,
+        cache: bool = False,
+        cache_dir: Optional[os.PathLike] = None,
+        profile: bool = False,
+        overview_diagnostics: bool = False,
+        resume: bool = False,
+    ) -> Optional[List[ExtTimeSeries]]:
+        """Generates all loaded time series.
+
+        If ``cache`` is enabled (or a ``cache_dir`` is given), datasets that were already generated with the same
+        configuration, seed, output format, add-ons, and GutenTAG version are reused from the output folder or the
+        cache directory instead of being generated again. Identical datasets (with the same name) within a run are
+        generated only once.
+        Caching requires a fixed seed and an output folder and is not used when plotting or returning the time
+        series.
+
+        All files are written atomically, so an interrupted run never leaves partially written files behind. If
+        ``resume`` is enabled, the completed datasets are recorded in a journal in the output folder (see
+        :class:`~gutenTAG.cache.RunJournal`), and an interrupted run with the same configuration and seed is continued:
+        the completed datasets are kept, only the missing ones are generated, and the overview and add-on files are
+        written for all datasets. Resuming requires a fixed seed and an output folder. With ``cache``, the cache
+        markers record the completed datasets instead, so cached runs can be resumed as well.
+
+        If ``profile`` is enabled, the durations of the generation stages of every dataset and channel are recorded,
+        written to ``timings.csv`` and ``timings.json`` next to the overview file, and summarized at the end (logged with level ``INFO``).
+
+        Warnings (e.g., about anomaly kinds that do not fit a base oscillation) are aggregated in :attr:`diagnostics`:
+        every distinct warning is logged only a few times, and a summary with the counts is logged at the end. If
+        ``overview_diagnostics`` is enabled, the summary is also written to the overview file.
+        """
+        if resume and (self.seed is None or output_folder is None):
+            raise ValueError(
+                "Resuming a run requires a fixed seed and an output folder!"
+            )
+        generation_cache: Optional[GenerationCache] = None
+        if cache or cache_dir is not None:
+            generation_cache = GenerationCache(cache_dir)
+        elif resume and output_folder is not None:
+            generation_cache = RunJournal(output_folder)
+        results = self._generate(
+            return_timeseries=return_timeseries,
+            output_folder=output_folder,
+            plot=plot,
+            output_format=OutputFormat(output_format),
+            cache=generation_cache,
+            profile=profile,
+            overview_diagnostics=overview_diagnostics,
+        )
+        if return_timeseries:
+            return [d for datasets in results for d in datasets]
+
+        for _ in results:
+            pass
+        return None
+
+    def generate_replicas(
+        self, name: str, seeds: Sequence[int], **kwargs: Any
     ) -> Optional[List[ExtTimeSeries]]:
+        """Generates only the time series ``name`` once per seed (see :meth:`replicate`); the keyword arguments are
+        passed to :meth:`generate`. The other loaded time series are kept for later generations.
+        """
+        self.replicate(name, seeds)
+        timeseries, datasets = self._timeseries, self._overview.datasets
+        positions = [i for i, ts in enumerate(timeseries) if ts.replica_of == name]
+        self._timeseries = [timeseries[i] for i in positions]
+        self._overview.datasets = [datasets[i] for i in positions]
+        try:
+            return self.generate(**kwargs)
+        finally:
+            for i, config in zip(positions, self._overview.datasets):
+                datasets[i] = config
+            self._timeseries, self._overview.datasets = timeseries, datasets
+
+    def generate_iter(
+        self,
+        output_folder: Optional[os.PathLike] = None,
+        plot: bool = False,
+        output_format: Union[str, OutputFormat] = OutputFormat.CSV,
+    ) -> Iterator[ExtTimeSeries]:
+        """Generates the time series and yields them one by one as soon as they are ready.
+
+        In contrast to :meth:`generate`, the generated time series are not collected in memory.
+        The overview and the add-on results are folded in incrementally; the overview is written and
+        the add-ons are finalized once the iterator is exhausted.
+        """
+        for datasets in self._generate(
+            return_timeseries=True,
+            output_folder=output_folder,
+            plot=plot,
+            output_format=OutputFormat(output_format),
+        ):
+            yield from datasets
+
+    def _generate(
+        self,
+        return_timeseries: bool,
+        output_folder: Optional[os.PathLike],
+        plot: bool,
+        output_format: OutputFormat,
+        cache: Optional[GenerationCache] = None,
+        profile: bool = False,
+        overview_diagnostics: bool = False,
+    ) -> Iterator[List[ExtTimeSeries]]:
         n_jobs = self._n_jobs
         if n_jobs != 1 and plot:
             warnings.warn(
@@ -137,6 +430,9 @@ class GutenTAG:
             folder = Path(output_folder)
             folder.mkdir(exist_ok=True)
 
+        cache = self._prepare_cache(cache, folder, plot, return_timeseries)
+        keys, entries, pending = self._lookup_cached(cache, folder, output_format)
+
         addon_types = import_addons(list(self._registered_addons))
         addons = [
             addon()
@@ -147,78 +443,264 @@ class GutenTAG:
         for name, addon in zip(self._registered_addons, addons):
             self.addons[name] = addon
 
-        # process time series
+        from joblib import Parallel
+        from .utils.tqdm_joblib import tqdm_joblib
+
+        # process time series: results are consumed as soon as they are available
         ctx = _GenerationContext(
             plot=plot,
             output_folder=output_folder,
             seed=self.seed,
             addons=addons,
             return_timeseries=return_timeseries,
+            output_format=output_format,
+            profile=profile,
+            dtype=self.dtype.name,
+            threads=self._n_threads,
         )
-        with tqdm_joblib(tqdm(desc="Generating datasets", total=len(self._timeseries))):
-            results: List[
-                Tuple[Dict, Dict[str, Any], Optional[List[ExtTimeSeries]]]
-            ] = Parallel(n_jobs=n_jobs)(
-                delayed(self.internal_generate)(ctx, ts, config)
-                for ts, config in zip(self._timeseries, self._overview.datasets)
-            )
-        configs, data_dicts, timeseries_datasets = tuple(zip(*results))
-        self._overview.datasets = configs
-
-        # finalize
-        if folder is not None:
-            self._overview.save_to_output_dir(folder)
+        timings = Timings(enabled=profile)
+        self.diagnostics = Diagnostics()
+        self._overview.diagnostics = None
         finalize_ctx = AddOnFinalizeContext(
             overview=self._overview, plot=plot, output_folder=output_folder
         )
-        finalize_ctx.fill_store(data_dicts)
+        # the total is unknown for streamed configurations
+        total = None if self._streamed else len(pending)
+        with tqdm_joblib(tqdm(desc="Generating datasets", total=total)):
+            with self._overview_writer(folder) as add_to_overview:
+                results: Iterator[_GenerationResult] = Parallel(
+                    n_jobs=n_jobs, return_as="generator"
+                )(self._tasks(ctx, n_jobs, pending))
+                # the results of the loaded time series (in order) are followed by the ones of the streamed time series
+                merged = self._merge_cached(
+                    results, keys, entries, cache, folder, output_format
+                )
+                for i, result in enumerate(chain(merged, results)):
+                    if i < len(keys):
+                        self._overview.datasets[i] = result.config
+                    add_to_overview(result.config)
+                    finalize_ctx.add_to_store(result.data)
+                    timings.extend(result.timings)
+                    self.diagnostics.merge(result.diagnostics)
+                    if result.datasets is not None:
+                        yield result.datasets
+
+                if len(self.diagnostics) > 0:
+                    logging.getLogger(LOGGER_NAME).warning(self.diagnostics.summary())
+                    if overview_diagnostics:
+                        self._overview.diagnostics = self.diagnostics.to_records()
+        self._finalize(addons, finalize_ctx, folder, timings)
+
+    def _tasks(
+        self, ctx: _GenerationContext, n_jobs: int, pending: List[int]
+    ) -> Iterator[Any]:
+        """Lazily creates the generation tasks of the ``pending`` loaded time series and of all streamed time
+        series."""
+        from joblib import delayed
+
+        if n_jobs == 1:
+            items = chain(
+                ((self._timeseries[i], self._overview.datasets[i]) for i in pending),
+                self._iter_streamed(),
+            )
+            for ts, config in items:
+                yield delayed(self.internal_generate)(ctx, ts, config)
+        else:
+            # ship only the raw configurations to the workers (instead of the generator objects and add-ons), the
+            # streamed configurations are not parsed in this process at all
+            worker_ctx = replace(
+                ctx, addons=(), addon_names=tuple(self._registered_addons)
+            )
+            configs = chain(
+                (
+                    (self._timeseries[i].dataset_name, self._overview.datasets[i])
+                    for i in pending
+                ),
+                self._iter_streamed_configs(),
+            )
+            for name, config in configs:
+                yield delayed(self.internal_generate_from_config)(
+                    worker_ctx, name, config
+                )
+
+    def _overview_writer(
+        self, folder: Optional[Path]
+    ) -> ContextManager[Callable[[Dict], None]]:
+        if folder is None:
+            return nullcontext(lambda config: None)
+        return self._overview.stream_to_output_dir(folder)
+
+    def _finalize(
+        self,
+        addons: Sequence[BaseAddOn],
+        finalize_ctx: AddOnFinalizeContext,
+        folder: Optional[Path],
+        timings: Timings,
+    ) -> None:
         for addon in tqdm(addons, desc="Finalizing addons", total=len(addons)):
-            addon.finalize(finalize_ctx)
+            with timings.measure("addon-finalize", detail=type(addon).__name__):
+                addon.finalize(finalize_ctx)
+        if timings.enabled:
+            if folder is not None:
+                timings.save(folder)
+            logging.getLogger(LOGGER_NAME).info(timings.summary())
 
-        if return_timeseries and timeseries_datasets is not None:
-            return [d for dataset in timeseries_datasets for d in dataset]
-        return None
+    def _prepare_cache(
+        self,
+        cache: Optional[GenerationCache],
+        folder: Optional[Path],
+        plot: bool,
+        return_timeseries: bool,
+    ) -> Optional[GenerationCache]:
+        supported = not (
+            folder is None
+            or self.seed is None
+            or plot
+            or return_timeseries
+            or self._streamed
+        )
+        if cache is not None and not supported:
+            warnings.warn(
+                "The generation cache requires a fixed seed and an output folder and cannot be used when plotting, "
+                "returning the time series, or streaming configurations! Generating all time series."
+            )
+            return None
+        return cache
+
+    def _lookup_cached(
+        self,
+        cache: Optional[GenerationCache],
+        folder: Optional[Path],
+        output_format: OutputFormat,
+    ) -> Tuple[List[Optional[str]], Dict[str, CacheEntry], List[int]]:
+        """Computes the cache keys of all time series, looks up the cached datasets, and deduplicates identical
+        datasets. Returns the keys (``None`` if caching is disabled), the cache entries found, and the indices of the
+        time series that must be generated."""
+        keys: List[Optional[str]] = [None] * len(self._timeseries)
+        entries: Dict[str, CacheEntry] = {}
+        pending: List[int] = []
+        pending_keys = set()
+        for i, (ts, config) in enumerate(
+            zip(self._timeseries, self._overview.datasets)
+        ):
+            if cache is None or folder is None or self.seed is None:
+                pending.append(i)
+                continue
+            key = GenerationCache.compute_key(
+                ts, config, self.seed, output_format, self._registered_addons
+            )
+            keys[i] = key
+            if key in entries or key in pending_keys:
+                continue
+            entry = cache.lookup(key, folder / ts.dataset_name)
+            if entry is not None:
+                entries[key] = entry
+            else:
+                pending.append(i)
+                pending_keys.add(key)
+        return keys, entries, pending
+
+    def _merge_cached(
+        self,
+        results: Iterator[_GenerationResult],
+        keys: List[Optional[str]],
+        entries: Dict[str, CacheEntry],
+        cache: Optional[GenerationCache],
+        folder: Optional[Path],
+        output_format: OutputFormat,
+    ) -> Iterator[_GenerationResult]:
+        """Yields the results of all time series in order: cached ones from their cache entries and the other ones
+        from the generation ``results`` (registering them in the cache)."""
+        for i, key in enumerate(keys):
+            if key is not None and key in entries:
+                cached = entries[key]
+                yield _GenerationResult(
+                    deepcopy(cached.config), cached.data, None, [], []
+                )
+                continue
+
+            result = next(results)
+            if cache is not None and folder is not None and key is not None:
+                ts = self._timeseries[i]
+                entries[key] = CacheEntry(
+                    key=key,
+                    config=deepcopy(result.config),
+                    data=result.data,
+                    files=cache.dataset_files(ts, output_format),
+                )
+                cache.store(entries[key], folder / ts.dataset_name)
+            yield result
 
     @staticmethod
     def internal_generate(
         ctx: _GenerationContext, ts: TimeSeries, config: Dict
-    ) -> Tuple[Dict, Dict[str, Any], Optional[List[ExtTimeSeries]]]:
-        ts.generate(ctx.seed)
+    ) -> _GenerationResult:
+        timings = Timings(enabled=ctx.profile, dataset=ts.dataset_name)
+        # the warnings are reported by the main process after merging the diagnostics of all datasets
+        diagnostics = Diagnostics(emit=False, dataset=ts.dataset_name)
+        ts.generate(ctx.seed, timings, diagnostics, threads=ctx.threads)
         addon_ctx = ctx.to_addon_process_ctx(ts, config)
         for addon in ctx.addons:
-            addon_ctx = addon.process(addon_ctx)
+            with timings.measure("addon-process", detail=type(addon).__name__):
+                addon_ctx = addon.process(addon_ctx)
         ts = addon_ctx.timeseries
         config = addon_ctx.config
         data = addon_ctx._data_store
 
         if ctx.plot:
-            ts.plot()
+            with timings.measure("plot"):
+                ts.plot()
 
         if ctx.output_folder is not None:
-            GutenTAG.save_timeseries(ts, ctx.output_folder)
+            GutenTAG.save_timeseries(ts, ctx.output_folder, ctx.output_format, timings)
 
-        if ctx.return_timeseries:
-            return config, data, ts.to_datasets()
-        return config, data, None
+        datasets = ts.to_datasets() if ctx.return_timeseries else None
+        return _GenerationResult(
+            config, data, datasets, timings.records, diagnostics.to_records()
+        )
 
     @staticmethod
-    def save_timeseries(ts: TimeSeries, output_dir: os.PathLike) -> None:
+    def internal_generate_from_config(
+        ctx: _GenerationContext, name: str, config: Dict
+    ) -> _GenerationResult:
+        """Worker entry point for the parallel generation.
+
+        The worker receives only the raw time series configuration and builds the generator objects and add-ons
+        locally. If an output folder is given, it writes the files itself, so that only the overview configuration
+        and the add-on data are sent back (unless the time series should be returned).
+        """
+        base_oscillations, anomalies, options = ConfigParser().parse_timeseries(
+            config, name
+        )
+        ts = TimeSeries(
+            base_oscillations, anomalies, **options.to_dict(), dtype=ctx.dtype
+        )
+        addons = [addon() for addon in import_addons(list(ctx.addon_names))]
+        return GutenTAG.internal_generate(replace(ctx, addons=addons), ts, config)
+
+    @staticmethod
+    def save_timeseries(
+        ts: TimeSeries,
+        output_dir: os.PathLike,
+        output_format: OutputFormat = OutputFormat.CSV,
+        timings: Optional[Timings] = None,
+    ) -> None:
         name = ts.dataset_name
         dataset_folder = Path(output_dir) / name
-        dataset_folder.mkdir(exist_ok=True)
-
-        ts.to_csv(dataset_folder / UNSUPERVISED_FILENAME, TrainingType.TEST)
+        dataset_folder.mkdir(parents=True, exist_ok=True)
+        if timings is None:
+            timings = Timings.disabled()
 
+        files = [(UNSUPERVISED_FILENAME, TrainingType.TEST)]
         if ts.supervised:
-            ts.to_csv(
-                dataset_folder / SUPERVISED_FILENAME, TrainingType.TRAIN_ANOMALIES
-            )
-
+            files.append((SUPERVISED_FILENAME, TrainingType.TRAIN_ANOMALIES))
         if ts.semi_supervised:
-            ts.to_csv(
-                dataset_folder / SEMI_SUPERVISED_FILENAME,
-                TrainingType.TRAIN_NO_ANOMALIES,
-            )
+            files.append((SEMI_SUPERVISED_FILENAME, TrainingType.TRAIN_NO_ANOMALIES))
+
+        for filename, training_type in files:
+            filename = output_format.filename(filename)
+            with timings.measure("save", variant=training_type.value, detail=filename):
+                ts.save(dataset_folder / filename, training_type, output_format)
 
     @staticmethod
     def from_json(
@@ -227,9 +709,14 @@ class GutenTAG:
         seed: Optional[int] = None,
         addons: Sequence[str] = (),
         only: Optional[str] = None,
+        dtype: Union[str, np.dtype, type] = np.float64,
+        n_threads: int = 1,
+        stream: bool = False,
     ) -> GutenTAG:
-        gt = GutenTAG(n_jobs=n_jobs, seed=seed, addons=addons)
-        return gt.load_config_json(path, only=only)
+        gt = GutenTAG(
+            n_jobs=n_jobs, seed=seed, addons=addons, dtype=dtype, n_threads=n_threads
+        )
+        return gt.load_config_json(path, only=only, stream=stream)
 
     @staticmethod
     def from_yaml(
@@ -238,9 +725,14 @@ class GutenTAG:
         seed: Optional[int] = None,
         addons: Sequence[str] = (),
         only: Optional[str] = None,
+        dtype: Union[str, np.dtype, type] = np.float64,
+        n_threads: int = 1,
+        stream: bool = False,
     ) -> GutenTAG:
-        gt = GutenTAG(n_jobs=n_jobs, seed=seed, addons=addons)
-        return gt.load_config_yaml(path, only=only)
+        gt = GutenTAG(
+            n_jobs=n_jobs, seed=seed, addons=addons, dtype=dtype, n_threads=n_threads
+        )
+        return gt.load_config_yaml(path, only=only, stream=stream)
 
     @staticmethod
     def from_dict(
@@ -249,6 +741,11 @@ class GutenTAG:
         seed: Optional[int] = None,
         addons: Sequence[str] = (),
         only: Optional[str] = None,
+        dtype: Union[str, np.dtype, type] = np.float64,
+        n_threads: int = 1,
+        stream: bool = False,
     ) -> GutenTAG:
-        gt = GutenTAG(n_jobs=n_jobs, seed=seed, addons=addons)
-        return gt.load_config_dict(config, only=only)
+        gt = GutenTAG(
+            n_jobs=n_jobs, seed=seed, addons=addons, dtype=dtype, n_threads=n_threads
+        )
+        return gt.load_config_dict(config, only=only, stream=stream)
@@ -0,0 +1,189 @@
+import csv
+import os
+import shutil
+from hashlib import md5
+from pathlib import Path
+from typing import Any, Dict, List, Sequence, Tuple
+
+import yaml
+
+from .generator import Overview, TimeSeries
+from .utils.atomic import atomic_path
+from .utils.diagnostics import Diagnostics
+
+SHARD_STRATEGIES = ("hash", "cost")
+TIMEEVAL_FILENAME = "datasets.csv"
+
+
+def parse_shard(spec: str) -> Tuple[int, int]:
+    """Parses a shard specification ``i/N`` (with ``1 <= i <= N``) into the tuple ``(i, N)``."""
+    try:
+        index, count = (int(part) for part in spec.split("/"))
+    except ValueError:
+        raise ValueError(
+            f"Invalid shard '{spec}'! Use the format i/N, e.g. 1/4."
+        ) from None
+    if not 1 <= index <= count:
+        raise ValueError(
+            f"Invalid shard '{spec}'! The shard index must be between 1 and {count}."
+        )
+    return index, count
+
+
+def assign_shards(
+    timeseries: Sequence[TimeSeries], count: int, strategy: str = "hash"
+) -> List[int]:
+    """Assigns each time series to one of ``count`` shards (numbered from 1).
+
+    The ``hash`` strategy uses the hash of the time series name, so that a time series always ends up in the same
+    shard, even if other time series are added to or removed from the configuration. The ``cost`` strategy balances
+    the estimated generation cost (number of generated points) greedily over the shards.
+    """
+    if strategy not in SHARD_STRATEGIES:
+        raise ValueError(
+            f"Unknown shard strategy '{strategy}'! Use one of {', '.join(SHARD_STRATEGIES)}."
+        )
+    if strategy == "hash":
+        return [
+            int.from_bytes(md5(ts.dataset_name.encode("utf-8")).digest()[:8], "big")
+            % count
+            + 1
+            for ts in timeseries
+        ]
+
+    costs = [_estimate_cost(ts) for ts in timeseries]
+    loads = [0] * count
+    shards = [0] * len(timeseries)
+    # longest processing time first: the most expensive time series go to the least loaded shard
+    for i in sorted(range(len(timeseries)), key=lambda i: (-costs[i], i)):
+        shard = loads.index(min(loads))
+        shards[i] = shard + 1
+        loads[shard] += costs[i]
+    return shards
+
+
+def _estimate_cost(ts: TimeSeries) -> int:
+    length = ts.base_oscillations[0].length if ts.base_oscillations else 0
+    variants = 1 + int(ts.supervised) + int(ts.semi_supervised)
+    return length * len(ts.base_oscillations) * variants
+
+
+def merge_shards(
+    shard_dirs: Sequence[os.PathLike], output_dir: os.PathLike, move: bool = False
+) -> None:
+    """Combines the outputs of all shards of a sharded run into ``output_dir``.
+
+    The overview of each shard records the original positions of its time series. The overview files and the
+    TimeEval ``datasets.csv`` files are merged in this original order, so that the result is identical to a
+    single-host run, and the dataset folders are copied (or moved) to ``output_dir``.
+    """
+    output = Path(output_dir)
+    shards = [_load_shard(Path(d)) for d in shard_dirs]
+    _check_shards([overview for _, overview in shards])
+
+    datasets: List[Tuple[int, Dict[str, Any], Path]] = []
+    for folder, overview in shards:
+        positions = overview["meta"]["shard"]["positions"]
+        for position, config in zip(positions, overview["generated-timeseries"]):
+            datasets.append((position, config, folder))
+    datasets.sort(key=lambda d: d[0])
+
+    output.mkdir(parents=True, exist_ok=True)
+    for _, config, folder in datasets:
+        _transfer_dataset(folder / config["name"], output / config["name"], move)
+
+    _merge_overviews(
+        [overview for _, overview in shards],
+        [config for _, config, _ in datasets],
+        output,
+    )
+    _merge_timeeval_datasets(
+        [folder for folder, _ in shards],
+        [config["name"] for _, config, _ in datasets],
+        output,
+    )
+
+
+def _load_shard(folder: Path) -> Tuple[Path, Dict[str, Any]]:
+    path = folder / Overview.FILENAME
+    if not path.is_file():
+        raise ValueError(f"Shard {folder} does not contain an {Overview.FILENAME}!")
+    with open(path, "r") as f:
+        overview = yaml.load(f, Loader=yaml.FullLoader)
+    if "shard" not in overview.get("meta", {}):
+        raise ValueError(f"{path} was not generated with the --shard option!")
+    return folder, overview
+
+
+def _check_shards(overviews: List[Dict[str, Any]]) -> None:
+    metas = [overview["meta"] for overview in overviews]
+    count = metas[0]["shard"]["count"]
+    if any(m["shard"]["count"] != count for m in metas):
+        raise ValueError("The shards were generated with different shard counts!")
+    if any(m["seed"] != metas[0]["seed"] for m in metas):
+        raise ValueError("The shards were generated with different seeds!")
+    indices = sorted(m["shard"]["index"] for m in metas)
+    if indices != list(range(1, count + 1)):
+        raise ValueError(
+            f"Expected the shards 1 to {count} exactly once, but got {', '.join(map(str, indices))}!"
+        )
+    positions = sorted(p for m in metas for p in m["shard"]["positions"])
+    if positions != list(range(metas[0]["shard"]["total"])):
+        raise ValueError("The shards were not generated from the same configuration!")
+
+
+def _transfer_dataset(source: Path, target: Path, move: bool) -> None:
+    if not source.is_dir() or source.resolve() == target.resolve():
+        return
+    if move:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        shutil.move(str(source), str(target))
+    else:
+        shutil.copytree(source, target, dirs_exist_ok=True)
+
+
+def _merge_overviews(
+    overviews: List[Dict[str, Any]], datasets: List[Dict[str, Any]], output: Path
+) -> None:
+    meta = overviews[0]["meta"]
+    merged = Overview()
+    merged.seed = meta["seed"]
+    merged.git_commit_sha = meta["git_commit_sha"]
+    merged.datasets = datasets
+    diagnostics = [
+        o["meta"]["diagnostics"] for o in overviews if "diagnostics" in o["meta"]
+    ]
+    if diagnostics:
+        collector = Diagnostics(emit=False)
+        for records in diagnostics:
+            collector.merge(records)
+        merged.diagnostics = collector.to_records()
+    merged.save_to_output_dir(output)
+
+
+def _merge_timeeval_datasets(
+    folders: List[Path], names: List[str], output: Path
+) -> None:
+    """Merges the TimeEval metadata files line by line (to keep the formatting of the values) in the order of the
+    dataset ``names``."""
+    header = None
+    rows: Dict[str, List[str]] = {}
+    for folder in folders:
+        path = folder / TIMEEVAL_FILENAME
+        if not path.is_file():
+            continue
+        with open(path, "r", newline="") as f:
+            lines = f.readlines()
+        header = lines[0]
+        test_path = next(csv.reader([header])).index("test_path")
+        for line in lines[1:]:
+            # the dataset folder (replicas are written to sub-folders)
+            name = next(csv.reader([line]))[test_path].rsplit("/", 1)[0]
+            rows.setdefault(name, []).append(line)
+    if header is None:
+        return
+    with atomic_path(output / TIMEEVAL_FILENAME) as tmp:
+        with open(tmp, "w", newline="") as f:
+            f.write(header)
+            for name in dict.fromkeys(names):
+                f.writelines(rows.get(name, []))
@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 from enum import Enum
+from pathlib import PurePosixPath
 
 import pandas as pd
 
@@ -10,6 +11,21 @@ class TrainingType(Enum):
     TRAIN_ANOMALIES = "train-anomaly"
 
 
+class OutputFormat(Enum):
+    CSV = "csv"
+    PARQUET = "parquet"
+    NPY = "npy"
+    FEATHER = "feather"
+
+    @property
+    def extension(self) -> str:
+        return f".{self.value}"
+
+    def filename(self, filename: str) -> str:
+        """Replaces the file extension of ``filename`` (e.g., ``test.csv``) with the one of this output format."""
+        return str(PurePosixPath(filename).with_suffix(self.extension))
+
+
 @dataclass
 class TimeSeries:
     name: str
@@ -0,0 +1,22 @@
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Union
+
+
+@contextmanager
+def atomic_path(path: Union[str, os.PathLike]) -> Iterator[Path]:
+    """Yields a temporary path next to ``path`` to write to and atomically renames it to ``path`` afterwards, so
+    that an interrupted write never leaves a truncated file at ``path``.
+
+    The temporary file keeps the extension of ``path`` (some writers, e.g. ``np.save``, append missing extensions)
+    and is removed if writing fails.
+    """
+    target = Path(path)
+    tmp = target.with_name(f".{target.stem}.tmp{target.suffix}")
+    try:
+        yield tmp
+        os.replace(tmp, target)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
@@ -18,11 +18,14 @@ default_values: Dict[str, Dict[str, Any]] = {
         PARAMETERS.TREND: None,
         PARAMETERS.OFFSET: 0.0,
         PARAMETERS.SMOOTHING: 0.01,
+        PARAMETERS.CONVOLUTION_METHOD: "direct",
+        PARAMETERS.CBF_METHOD: "vectorized",
         PARAMETERS.CHANNEL_DIFF: 0.0,
         PARAMETERS.CHANNEL_OFFSET: 1.0,
         PARAMETERS.RANDOM_SEED: None,
         PARAMETERS.FORMULA: None,
         PARAMETERS.ECG_SIM_METHOD: "simple",
+        PARAMETERS.ECG_ENGINE: "neurokit",
         PARAMETERS.WIDTH: 1.0,
         PARAMETERS.DUTY: 0.5,
         PARAMETERS.PERIODICITY: 6,
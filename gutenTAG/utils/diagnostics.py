@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field, asdict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+LOGGER_NAME = "GutenTAG"
+
+
+@dataclass
+class DiagnosticEvent:
+    code: str
+    message: str
+    count: int = 0
+    datasets: List[str] = field(default_factory=list)
+
+
+class Diagnostics:
+    """Collects warnings of the generation as structured events and counts their occurrences.
+
+    Each distinct event (code and message) is logged at most ``max_reports`` times; further occurrences are only
+    counted and show up in the aggregated :meth:`summary`. A collector with ``emit=False`` does not log anything. The
+    events are plain data (see :meth:`to_records`), so that collectors in worker processes can send them back to the
+    main process, which :meth:`merge`\\ s them into its own collector.
+    """
+
+    FALSE_COMBINATION = "false-combination"
+    INVALID_PARAMETER = "invalid-parameter"
+
+    def __init__(
+        self, emit: bool = True, max_reports: int = 3, dataset: Optional[str] = None
+    ):
+        self.emit = emit
+        self.max_reports = max_reports
+        self.dataset = dataset
+        self.events: Dict[Tuple[str, str], DiagnosticEvent] = {}
+
+    def report(
+        self, code: str, message: str, count: int = 1, datasets: Iterable[str] = ()
+    ) -> None:
+        key = (code, message)
+        if key not in self.events:
+            self.events[key] = DiagnosticEvent(code, message)
+        event = self.events[key]
+        previous = event.count
+        event.count += count
+        datasets = list(datasets) or ([self.dataset] if self.dataset else [])
+        event.datasets.extend(d for d in datasets if d not in event.datasets)
+
+        if self.emit:
+            logger = logging.getLogger(LOGGER_NAME)
+            if previous < self.max_reports:
+                logger.warning(message)
+            if previous <= self.max_reports < event.count:
+                logger.warning(
+                    f"Suppressing further occurrences of the previous warning ({code})."
+                )
+
+    def warn_false_combination(self, anomaly: str, base_oscillation: str) -> None:
+        self.report(
+            self.FALSE_COMBINATION,
+            f"You tried to generate '{anomaly}' on '{base_oscillation}'. That doesn't work! Guten Tag!",
+        )
+
+    def merge(self, records: Iterable[Dict[str, Any]]) -> None:
+        for record in records:
+            self.report(
+                record["code"], record["message"], record["count"], record["datasets"]
+            )
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        """Returns the events ordered by their number of occurrences."""
+        events = sorted(self.events.values(), key=lambda e: e.count, reverse=True)
+        return [asdict(e) for e in events]
+
+    def __len__(self) -> int:
+        return sum(e.count for e in self.events.values())
+
+    def summary(self) -> str:
+        lines = [f"{len(self)} warnings in {len(self.events)} distinct events:"]
+        for record in self.to_records():
+            datasets = ", ".join(record["datasets"][:5])
+            if len(record["datasets"]) > 5:
+                datasets += f", ... ({len(record['datasets'])} datasets)"
+            lines.append(
+                f"  {record['count']:>6}x [{record['code']}] {record['message']}"
+                + (f" (in {datasets})" if datasets else "")
+            )
+        return "\n".join(lines)
@@ -55,6 +55,8 @@ class PARAMETERS:
     TREND = "trend"
     OFFSET = "offset"
     SMOOTHING = "smoothing"
+    CONVOLUTION_METHOD = "convolution-method"
+    CBF_METHOD = "cbf-method"
     CHANNEL_DIFF = "channel-diff"
     CHANNEL_OFFSET = "channel-offset"
     RANDOM_SEED = "random-seed"
@@ -62,12 +64,16 @@ class PARAMETERS:
     KIND = "kind"
     KINDS = "kinds"
     NAME = "name"
+    REPLICAS = "replicas"
+    REPLICA = "replica"
+    GRID = "grid"
     CHANNELS = "channels"
     CHANNEL = "channel"
     POSITION = "position"
     EXACT_POSITION = "exact-position"
     CREEPING_LENGTH = "creeping-length"
     ECG_SIM_METHOD = "ecg-sim-method"
+    ECG_ENGINE = "ecg-engine"
     DUTY = "duty"
     WIDTH = "width"
     PERIODICITY = "periodicity"
@@ -5,7 +5,9 @@ class GutenTagLogger:
     def __init__(self):
         self.logger = logging.getLogger("GutenTAG")
         self.logger.setLevel(logging.DEBUG)
-        self.logger.addHandler(logging.StreamHandler())
+        # the logger is shared by all instances: register the handler only once
+        if not self.logger.handlers:
+            self.logger.addHandler(logging.StreamHandler())
 
     def warn_false_combination(self, anomaly: str, base_oscillation: str):
         self.logger.warning(
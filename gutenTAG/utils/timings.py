@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+import pandas as pd
+
+from .atomic import atomic_path
+
+
+class Timings:
+    """Opt-in recorder of the wall-clock durations of the generation stages.
+
+    Every record contains the labels the recorder was bound to (``dataset``, ``variant``, ``channel``), the
+    ``stage`` (e.g., ``base``, ``noise``, ``anomaly-kind``, ``save``), an optional ``detail`` (e.g., the base
+    oscillation or anomaly kind), and the ``duration`` in seconds. Recorders created with :meth:`bind` share the
+    records of their parent. Recording is thread-safe. Stages measured in a single thread do not overlap. If the
+    channels of a time series are generated with multiple threads (``n_threads``), their stages run concurrently, so
+    the durations can add up to more than the wall-clock time. A disabled recorder does not record anything.
+    """
+
+    CSV_FILENAME = "timings.csv"
+    JSON_FILENAME = "timings.json"
+    COLUMNS = ("dataset", "variant", "channel", "stage", "detail", "duration")
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        records: Optional[List[Dict[str, Any]]] = None,
+        **labels: Any,
+    ):
+        self.enabled = enabled
+        self.records: List[Dict[str, Any]] = records if records is not None else []
+        self.labels = labels
+        # guards the records, which are shared with all bound recorders
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def disabled() -> Timings:
+        return Timings(enabled=False)
+
+    def bind(self, **labels: Any) -> Timings:
+        """Returns a recorder that adds ``labels`` to all records and shares the records with this recorder."""
+        bound = Timings(self.enabled, self.records, **{**self.labels, **labels})
+        bound._lock = self._lock
+        return bound
+
+    @contextmanager
+    def measure(self, stage: str, **labels: Any) -> Iterator[None]:
+        if not self.enabled:
+            yield
+            return
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            record = {
+                **self.labels,
+                **labels,
+                "stage": stage,
+                "duration": perf_counter() - start,
+            }
+            with self._lock:
+                self.records.append(record)
+
+    def extend(self, records: Iterable[Dict[str, Any]]) -> None:
+        if self.enabled:
+            with self._lock:
+                self.records.extend(records)
+
+    def to_dataframe(self) -> pd.DataFrame:
+        return pd.DataFrame(self.records, columns=list(self.COLUMNS))
+
+    def summary(self, top: int = 10) -> str:
+        """Formats the total durations of the slowest ``top`` datasets and stages as tables."""
+        df = self.to_dataframe()
+        datasets = df.groupby("dataset")["duration"].sum().nlargest(top)
+        stages = (
+            df.groupby("stage")["duration"].agg(["sum", "count"]).nlargest(top, "sum")
+        )
+        stages.columns = ["duration", "count"]
+        return (
+            f"Slowest datasets (total: {df['duration'].sum():.3f} s):\n"
+            f"{datasets.to_frame().to_string(float_format='{:.3f}'.format)}\n\n"
+            f"Slowest stages:\n{stages.to_string(float_format='{:.3f}'.format)}"
+        )
+
+    def save(self, output_dir: os.PathLike) -> None:
+        """Writes all records to ``timings.csv`` and the durations aggregated per dataset and stage to
+        ``timings.json``."""
+        path = Path(output_dir)
+        df = self.to_dataframe()
+        with atomic_path(path / self.CSV_FILENAME) as tmp:
+            df.to_csv(tmp, index=False)
+        aggregated = {
+            "total": float(df["duration"].sum()),
+            "datasets": df.groupby("dataset")["duration"].sum().to_dict(),
+            "stages": df.groupby("stage")["duration"].sum().to_dict(),
+        }
+        with atomic_path(path / self.JSON_FILENAME) as tmp:
+            with open(tmp, "w") as f:
+                json.dump(aggregated, f, indent=2)
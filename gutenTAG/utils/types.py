@@ -1,16 +1,49 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import List, Tuple, Optional, Union, Sequence
+from dataclasses import dataclass, field
+from typing import Optional, Union, Sequence, Dict, Any
 
 import numpy as np
 from numpy.random import SeedSequence
 
+from .diagnostics import Diagnostics
+from .timings import Timings
+
+# floating point precisions of the generated time series
+DTYPES = ("float64", "float32")
+
+
+def resolve_dtype(dtype: Union[str, np.dtype, type]) -> np.dtype:
+    resolved = np.dtype(dtype)
+    if resolved.name not in DTYPES:
+        raise ValueError(
+            f"Unsupported dtype '{dtype}'! Use one of {', '.join(DTYPES)}."
+        )
+    return resolved
+
 
 class GenerationContext:
-    def __init__(self, seed: SeedSequence):
+    def __init__(
+        self,
+        seed: SeedSequence,
+        base_cache: Optional[Dict[Any, np.ndarray]] = None,
+        timings: Optional[Timings] = None,
+        diagnostics: Optional[Diagnostics] = None,
+        dtype: np.dtype = np.dtype(np.float64),
+        threads: int = 1,
+    ):
         self.seed: SeedSequence = seed
         self.rng: np.random.Generator = np.random.default_rng(self.seed)
+        # deterministic base oscillations shared between the variants (test, supervised, semi-supervised) of a dataset
+        self.base_cache: Optional[Dict[Any, np.ndarray]] = base_cache
+        self.timings: Timings = timings if timings is not None else Timings.disabled()
+        self.diagnostics: Diagnostics = (
+            diagnostics if diagnostics is not None else Diagnostics()
+        )
+        # precision of the generated time series
+        self.dtype: np.dtype = dtype
+        # number of threads to generate the channels of large time series with
+        self.threads = threads
 
     def to_bo(
         self, channel: int = 0, previous_channels: Sequence[np.ndarray] = ()
@@ -19,19 +52,27 @@ class GenerationContext:
             seed=self.seed,
             rng=self.rng,
             channel=channel,
-            previous_channels=list(previous_channels),
+            # passed by reference: copying the list for every channel is quadratic in the number of channels
+            previous_channels=previous_channels,
+            base_cache=self.base_cache,
+            timings=self.timings.bind(channel=channel),
+            dtype=self.dtype,
         )
 
     def to_anomaly(
         self,
         bo: "BaseOscillationInterface",  # type: ignore # noqa: F821 # to prevent circular import
-        previous_anomaly_positions: Sequence[Tuple[int, int]],
+        previous_anomaly_positions: "AnomalyPositionIndex",  # type: ignore # noqa: F821 # to prevent circular import
     ) -> AnomalyGenerationContext:
         return AnomalyGenerationContext(
             seed=self.seed,
             rng=self.rng,
             base_oscillation=bo,
-            previous_anomaly_positions=list(previous_anomaly_positions),
+            previous_anomaly_positions=previous_anomaly_positions,
+            base_cache=self.base_cache,
+            timings=self.timings,
+            diagnostics=self.diagnostics,
+            dtype=self.dtype,
         )
 
     @staticmethod
@@ -60,16 +101,22 @@ class BOGenerationContext(GenerationContext):
     seed: SeedSequence
     rng: np.random.Generator
     channel: int
-    previous_channels: List[np.ndarray]
+    previous_channels: Sequence[np.ndarray]
     is_trend: bool = False
+    base_cache: Optional[Dict[Any, np.ndarray]] = None
+    timings: Timings = field(default_factory=Timings.disabled)
+    dtype: np.dtype = np.dtype(np.float64)
 
     def to_trend(self) -> BOGenerationContext:
+        # the trend is timed as a whole by its base oscillation
         return BOGenerationContext(
             seed=self.seed,
             rng=self.rng,
             channel=self.channel,
             previous_channels=self.previous_channels,
             is_trend=True,
+            base_cache=self.base_cache,
+            dtype=self.dtype,
         )
 
     @staticmethod
@@ -82,7 +129,11 @@ class AnomalyGenerationContext(GenerationContext):
     seed: SeedSequence
     rng: np.random.Generator
     base_oscillation: "BaseOscillationInterface"  # type: ignore # noqa: F821 # to prevent circular import
-    previous_anomaly_positions: List[Tuple[int, int]]
+    previous_anomaly_positions: "AnomalyPositionIndex"  # type: ignore # noqa: F821 # to prevent circular import
+    base_cache: Optional[Dict[Any, np.ndarray]] = None
+    timings: Timings = field(default_factory=Timings.disabled)
+    diagnostics: Diagnostics = field(default_factory=Diagnostics)
+    dtype: np.dtype = np.dtype(np.float64)
 
     @property
     def timeseries_periods(self) -> Optional[int]:
@@ -109,7 +109,9 @@ if __name__ == "__main__":
         long_description=README,
         long_description_content_type="text/markdown",
         url="https://github.com/TimeEval/gutentag",
-        packages=find_packages(exclude=("tests", "tests.*")),
+        packages=find_packages(
+            exclude=("tests", "tests.*", "benchmarks", "benchmarks.*")
+        ),
         package_data={"gutenTAG": ["py.typed", "config/schema/*"]},
         cmdclass={
             "test": PyTestCommand,
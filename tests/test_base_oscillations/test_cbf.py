@@ -0,0 +1,96 @@
+import unittest
+
+import numpy as np
+from numpy.random import SeedSequence
+from numpy.testing import assert_array_equal
+
+from gutenTAG.base_oscillations import BaseOscillation
+from gutenTAG.base_oscillations.cylinder_bell_funnel import (
+    cylinder_bell_funnel,
+    _draw_pattern_positions,
+)
+from gutenTAG.utils.types import BOGenerationContext
+
+
+class TestCylinderBellFunnel(unittest.TestCase):
+    def _generate(self, method: str, seed: int = 42, **kwargs) -> np.ndarray:
+        return cylinder_bell_funnel(
+            np.random.default_rng(seed), method=method, **kwargs
+        )
+
+    def test_pattern_positions(self):
+        starts, lengths = _draw_pattern_positions(
+            np.random.default_rng(42), 10000, 10, 3.0
+        )
+        ends = starts + lengths
+        self.assertGreater(starts.shape[0], 500)
+        self.assertGreaterEqual(starts[0], 0)
+        self.assertLess(ends[-1], 10000)
+        self.assertTrue(np.all(lengths >= 1))
+        gaps = starts[1:] - ends[:-1]
+        self.assertTrue(np.all((gaps >= 0) & (gaps < 10)))
+
+    def test_vectorized_patterns(self):
+        data = self._generate(
+            "vectorized",
+            length=500,
+            avg_pattern_length=10,
+            default_variance=0,
+            variance_amplitude=0,
+            avg_amplitude=1,
+            include_negatives=False,
+        )
+        # replay the random draws of the pattern positions (after the background noise)
+        rng = np.random.default_rng(42)
+        rng.normal(0, 0, 500)
+        starts, lengths = _draw_pattern_positions(rng, 500, 10, 0)
+        self.assertTrue(np.all(lengths == 10))
+
+        # without noise, every pattern is a ramp (bell or funnel) or a plateau (cylinder)
+        expected_shapes = [np.arange(10) / 10, np.arange(10)[::-1] / 10, np.ones(10)]
+        for start in starts:
+            pattern = data[start : start + 10]
+            self.assertTrue(
+                any(np.allclose(pattern, s) for s in expected_shapes),
+                f"Unexpected pattern at {start}: {pattern}",
+            )
+        mask = np.ones(500, dtype=np.bool_)
+        for start in starts:
+            mask[start : start + 10] = False
+        assert_array_equal(data[mask], 0)
+
+    def test_vectorized_is_seeded(self):
+        assert_array_equal(
+            self._generate("vectorized", length=1000),
+            self._generate("vectorized", length=1000),
+        )
+
+    def test_methods_have_similar_statistics(self):
+        legacy = self._generate("legacy", length=100000, default_variance=0.1)
+        vectorized = self._generate("vectorized", length=100000, default_variance=0.1)
+        self.assertAlmostEqual(legacy.std(), vectorized.std(), delta=0.05)
+        self.assertAlmostEqual(
+            np.abs(legacy).mean(), np.abs(vectorized).mean(), delta=0.05
+        )
+
+    def test_short_series_without_patterns(self):
+        data = self._generate("vectorized", length=3, avg_pattern_length=10)
+        self.assertEqual(data.shape, (3,))
+
+    def test_unknown_method(self):
+        with self.assertRaises(ValueError):
+            self._generate("loop", length=100)
+
+    def test_method_from_config(self):
+        for method in ["legacy", "vectorized"]:
+            bo = BaseOscillation.from_key(
+                "cylinder-bell-funnel", length=200, **{"cbf-method": method}
+            )
+            ctx = BOGenerationContext(
+                seed=SeedSequence(1),
+                rng=np.random.default_rng(1),
+                channel=0,
+                previous_channels=[],
+            )
+            expected = self._generate(method, seed=1, length=200)
+            assert_array_equal(bo.generate_only_base(ctx), expected)
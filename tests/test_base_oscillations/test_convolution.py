@@ -0,0 +1,78 @@
+import unittest
+
+import numpy as np
+from numpy.testing import assert_array_equal, assert_allclose
+
+from gutenTAG.base_oscillations.mls import mls
+from gutenTAG.base_oscillations.random_walk import random_walk
+from gutenTAG.base_oscillations.utils.convolution import (
+    convolve_valid,
+    choose_convolution_method,
+    FFT_FILTER_SIZE_THRESHOLD,
+)
+
+
+class TestConvolution(unittest.TestCase):
+    def setUp(self) -> None:
+        rng = np.random.default_rng(42)
+        self.data = rng.normal(size=5000).cumsum()
+        self.kernel = np.hanning(700)
+        self.kernel /= self.kernel.sum()
+
+    def test_direct_is_numpy_convolve(self):
+        assert_array_equal(
+            convolve_valid(self.data, self.kernel, "direct"),
+            np.convolve(self.data, self.kernel, "valid"),
+        )
+
+    def test_fft_equivalent_to_direct(self):
+        direct = convolve_valid(self.data, self.kernel, "direct")
+        fft = convolve_valid(self.data, self.kernel, "fft")
+        self.assertEqual(direct.shape, fft.shape)
+        assert_allclose(fft, direct, rtol=1e-10, atol=1e-10)
+
+    def test_auto_method(self):
+        self.assertEqual(choose_convolution_method(10), "direct")
+        self.assertEqual(choose_convolution_method(FFT_FILTER_SIZE_THRESHOLD), "fft")
+        self.assertEqual(choose_convolution_method(10_000, "direct"), "direct")
+
+    def test_fft_tolerance_at_threshold(self):
+        data = np.random.default_rng(42).normal(size=100_000).cumsum()
+        kernel = np.ones(FFT_FILTER_SIZE_THRESHOLD) / FFT_FILTER_SIZE_THRESHOLD
+        direct = convolve_valid(data, kernel, "direct")
+        fft = convolve_valid(data, kernel, "fft")
+        assert_array_equal(convolve_valid(data, kernel, "auto"), fft)
+        assert_array_equal(convolve_valid(data, kernel), direct)
+        # the FFT-based convolution differs only in the last bits
+        assert_allclose(fft, direct, rtol=0, atol=1e-14 * np.abs(direct).max())
+
+    def test_default_is_bit_identical(self):
+        # the default smoothing of a long random walk uses a filter above the threshold
+        smoothed = random_walk(np.random.default_rng(1), 100_000)
+        direct = random_walk(
+            np.random.default_rng(1), 100_000, convolution_method="direct"
+        )
+        assert_array_equal(smoothed, direct)
+
+    def test_unknown_method(self):
+        with self.assertRaises(ValueError) as ex:
+            choose_convolution_method(10, "wavelet")
+        self.assertRegex(str(ex.exception), r"Unknown convolution method")
+
+    def test_random_walk_engines_equivalent(self):
+        direct = random_walk(
+            np.random.default_rng(1), 20000, smoothing=0.05, convolution_method="direct"
+        )
+        fft = random_walk(
+            np.random.default_rng(1), 20000, smoothing=0.05, convolution_method="fft"
+        )
+        assert_allclose(fft, direct, rtol=1e-8, atol=1e-8)
+
+    def test_mls_engines_equivalent(self):
+        direct = mls(
+            np.random.default_rng(1), 20000, smoothing=8, convolution_method="direct"
+        )
+        fft = mls(
+            np.random.default_rng(1), 20000, smoothing=8, convolution_method="fft"
+        )
+        assert_allclose(fft, direct, rtol=1e-8, atol=1e-8)
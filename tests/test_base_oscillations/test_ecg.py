@@ -0,0 +1,54 @@
+import unittest
+
+import numpy as np
+from numpy.testing import assert_array_equal
+
+from gutenTAG.base_oscillations.ecg import (
+    ecg,
+    _beat_template,
+    TEMPLATE_POINTS,
+    sampling_rate,
+)
+
+
+class TestECGTemplateEngine(unittest.TestCase):
+    def _generate(self, seed: int = 42, **kwargs) -> np.ndarray:
+        return ecg(np.random.default_rng(seed), engine="template", **kwargs)
+
+    def test_beat_template(self):
+        template = _beat_template(60, "simple")
+        self.assertEqual(template.shape, (TEMPLATE_POINTS + 1,))
+        self.assertEqual(template[0], template[-1])
+        self.assertFalse(template.flags.writeable)
+        self.assertIs(template, _beat_template(60, "simple"))
+
+    def test_simple_is_periodic(self):
+        # 2 beats per 100 points: exact period of 50 points without jitter
+        data = self._generate(length=1000, frequency=2.0, ecg_sim_method="simple")
+        self.assertEqual(data.shape, (1000,))
+        np.testing.assert_allclose(data[50:], data[:-50], atol=1e-12)
+
+    def test_matches_neurokit_simulation(self):
+        template = self._generate(length=1000, frequency=1.0, ecg_sim_method="simple")
+        neurokit = ecg(np.random.default_rng(42), 1000, 1.0, ecg_sim_method="simple")
+        self.assertGreater(np.corrcoef(template, neurokit)[0, 1], 0.95)
+
+    def test_ecgsyn_jitter_is_seeded(self):
+        kwargs = dict(length=2000, frequency=1.0, ecg_sim_method="ecgsyn")
+        assert_array_equal(self._generate(1, **kwargs), self._generate(1, **kwargs))
+        self.assertFalse(
+            np.array_equal(self._generate(1, **kwargs), self._generate(2, **kwargs))
+        )
+        beats = self._generate(1, **kwargs)
+        r_peaks = np.flatnonzero(
+            (beats[1:-1] > beats[:-2])
+            & (beats[1:-1] >= beats[2:])
+            & (beats[1:-1] > 0.5 * beats.max())
+        )
+        # one R peak per second (100 points), but not exactly periodic
+        self.assertAlmostEqual(len(r_peaks), 2000 / sampling_rate, delta=1)
+        self.assertGreater(np.diff(r_peaks).std(), 0)
+
+    def test_unknown_engine(self):
+        with self.assertRaises(ValueError):
+            ecg(np.random.default_rng(42), engine="unknown")
@@ -3,7 +3,7 @@ import unittest
 import numpy as np
 from numpy.testing import assert_array_equal
 
-from gutenTAG.base_oscillations.formula import FormulaParser  # type: ignore
+from gutenTAG.base_oscillations.formula import FormulaPlan  # type: ignore
 
 
 class TestFormula(unittest.TestCase):
@@ -17,6 +17,43 @@ class TestFormula(unittest.TestCase):
             },
         }
         expected = (np.arange(10) + np.arange(10)) * np.ones(10).sum()
-        parsed = FormulaParser(d).parse(prev_channels=prev_channels).execute()
+        parsed = FormulaPlan.compile(d).execute(prev_channels)
 
         assert_array_equal(expected, parsed)
+
+    def test_plan_equals_numpy(self):
+        rng = np.random.default_rng(42)
+        prev_channels = [rng.normal(size=1000), rng.random(1000) + 0.5]
+        centered = {
+            "base": 0,
+            "operation": {
+                "kind": "-",
+                "operand": {"base": 0, "aggregation": {"kind": "median"}},
+            },
+        }
+        d = {
+            "base": {"base": centered, "operation": {"kind": "*", "operand": centered}},
+            "operation": {
+                "kind": "/",
+                "operand": {"base": 1, "operation": {"kind": "**", "operand": 0.5}},
+            },
+        }
+        c0, c1 = prev_channels
+        expected = (c0 - np.median(c0)) * (c0 - np.median(c0)) / c1**0.5
+        plan = FormulaPlan.compile(d)
+        for chunk_size in [7, 100, 1000, 4096]:
+            assert_array_equal(expected, plan.execute(prev_channels, chunk_size))
+
+    def test_plan_shares_common_subexpressions(self):
+        aggregation = {"base": 0, "aggregation": {"kind": "sum"}}
+        d = {"base": aggregation, "operation": {"kind": "+", "operand": aggregation}}
+        plan = FormulaPlan.compile(d)
+        # channel 0, its sum, and the addition
+        self.assertEqual(len(plan.steps), 3)
+        self.assertEqual(plan.execute([np.ones(10)]), 20)
+
+    def test_power_matches_operator(self):
+        base = np.linspace(0.1, 10, 1000)
+        for exponent in [2.0, 0.5, -1.0, 3.0]:
+            d = {"base": 0, "operation": {"kind": "**", "operand": exponent}}
+            assert_array_equal(base**exponent, FormulaPlan.compile(d).execute([base]))
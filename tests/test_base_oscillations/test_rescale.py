@@ -0,0 +1,51 @@
+import unittest
+
+import numpy as np
+from numpy.testing import assert_array_equal, assert_allclose
+
+from gutenTAG.base_oscillations.utils.rescale import min_max_rescale
+
+
+class TestRescale(unittest.TestCase):
+    def setUp(self) -> None:
+        rng = np.random.default_rng(42)
+        self.data = rng.normal(size=1000).cumsum()
+
+    def test_feature_range(self):
+        result = min_max_rescale(self.data, (-2.5, 3.0))
+        self.assertAlmostEqual(result.min(), -2.5)
+        self.assertAlmostEqual(result.max(), 3.0)
+        expected = (self.data - self.data.min()) / np.ptp(self.data) * 5.5 - 2.5
+        assert_allclose(result, expected, atol=1e-12)
+
+    def test_does_not_modify_input(self):
+        data = self.data.copy()
+        result = min_max_rescale(data)
+        assert_array_equal(data, self.data)
+        self.assertIsNot(result, data)
+
+    def test_in_place(self):
+        data = self.data.copy()
+        result = min_max_rescale(data, (0, 1), out=data)
+        self.assertIs(result, data)
+        assert_array_equal(data, min_max_rescale(self.data, (0, 1)))
+
+    def test_preallocated_output(self):
+        out = np.empty_like(self.data)
+        result = min_max_rescale(self.data, (0, 1), out=out)
+        self.assertIs(result, out)
+        assert_array_equal(out, min_max_rescale(self.data, (0, 1)))
+
+    def test_integer_input(self):
+        result = min_max_rescale(np.arange(5), (0, 1))
+        self.assertEqual(result.dtype, np.float64)
+        assert_array_equal(result, [0, 0.25, 0.5, 0.75, 1])
+
+    def test_constant_signal(self):
+        # same as sklearn's MinMaxScaler: constant signals are shifted to the lower bound
+        result = min_max_rescale(np.full(10, 3.0), (1.0, 2.0))
+        assert_array_equal(result, np.full(10, 1.0))
+
+    def test_invalid_feature_range(self):
+        with self.assertRaises(ValueError):
+            min_max_rescale(self.data, (1.0, 1.0))
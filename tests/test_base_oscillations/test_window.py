@@ -0,0 +1,49 @@
+import unittest
+
+import numpy as np
+from numpy.testing import assert_array_equal
+
+from gutenTAG.base_oscillations import BaseOscillation
+from gutenTAG.base_oscillations.utils.math_func_support import linspace_window
+from gutenTAG.utils.types import BOGenerationContext
+
+
+class TestWindow(unittest.TestCase):
+    WINDOWS = [(0, 100), (0, 1000), (250, 330), (997, 1000), (999, 1000), (400, 401)]
+
+    def _assert_window_equals_slice(self, kind: str, **kwargs) -> None:
+        bo = BaseOscillation.from_key(kind, length=1000, **kwargs)
+        full = bo.generate_only_base(BOGenerationContext.default())
+        for start, end in self.WINDOWS:
+            with self.subTest(kind=kind, start=start, end=end):
+                window = bo.generate_window(BOGenerationContext.default(), start, end)
+                assert_array_equal(window, full[start:end])
+
+    def test_linspace_window(self):
+        for n in [0, 1, 2, 3, 10, 999, 1000, 12345]:
+            full = np.linspace(0, n / 100, n)
+            for start, end in [(0, n), (0, n // 2), (n // 3, n), (n // 4, n // 2)]:
+                assert_array_equal(
+                    linspace_window(n / 100, n, start, end), full[start:end]
+                )
+
+    def test_periodic_windows(self):
+        self._assert_window_equals_slice("sine", frequency=3.3, **{"freq-mod": 0.1})
+        self._assert_window_equals_slice("cosine", frequency=2)
+        self._assert_window_equals_slice("square", frequency=4.5, duty=0.3)
+        self._assert_window_equals_slice("sawtooth", frequency=1.5, width=0.7)
+
+    def test_ecg_windows(self):
+        self._assert_window_equals_slice("ecg", frequency=3)
+        self._assert_window_equals_slice("ecg", frequency=10)
+        self._assert_window_equals_slice(
+            "ecg", frequency=3, **{"ecg-engine": "template"}
+        )
+
+    def test_default_window_is_slice(self):
+        self._assert_window_equals_slice("polynomial", polynomial=[1, 0.5, 0.1])
+
+    def test_cbf_window_length(self):
+        bo = BaseOscillation.from_key("cylinder-bell-funnel", length=1000)
+        window = bo.generate_window(BOGenerationContext.default(), 100, 250)
+        self.assertEqual(window.shape, (150,))
@@ -0,0 +1,127 @@
+import json
+import pickle
+import tempfile
+import unittest
+from copy import deepcopy
+from pathlib import Path
+from unittest.mock import patch
+
+from gutenTAG import GutenTAG
+from gutenTAG.cache import GenerationCache
+from gutenTAG.timeseries import OutputFormat
+
+
+def _config(n: int = 3, length: int = 200) -> dict:
+    return {
+        "timeseries": [
+            {
+                "name": f"ts_{i}",
+                "length": length,
+                "semi-supervised": True,
+                "base-oscillations": [{"kind": "random-walk"}],
+                "anomalies": [
+                    {"length": 10, "kinds": [{"kind": "platform", "value": 0}]}
+                ],
+            }
+            for i in range(n)
+        ]
+    }
+
+
+def _generate(config: dict, output_folder: Path, **kwargs) -> int:
+    """Generates the time series and returns the number of freshly generated ones."""
+    with patch.object(
+        GutenTAG, "internal_generate", wraps=GutenTAG.internal_generate
+    ) as internal_generate:
+        GutenTAG.from_dict(config, seed=42, addons=["TimeEvalAddOn"]).generate(
+            output_folder=output_folder, **kwargs
+        )
+    return internal_generate.call_count
+
+
+class TestGenerationCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.folder = Path(self.tmp.name)
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def test_unchanged_datasets_are_reused(self):
+        config = _config()
+        with tempfile.TemporaryDirectory() as reference_dir:
+            _generate(config, Path(reference_dir))
+            reference = (Path(reference_dir) / "datasets.csv").read_text()
+
+        self.assertEqual(_generate(config, self.folder, cache=True), 3)
+        overview = (self.folder / "overview.yaml").read_text()
+        self.assertEqual(_generate(config, self.folder, cache=True), 0)
+        self.assertEqual((self.folder / "datasets.csv").read_text(), reference)
+        self.assertEqual((self.folder / "overview.yaml").read_text(), overview)
+
+    def test_changed_datasets_are_regenerated(self):
+        config = _config()
+        _generate(config, self.folder, cache=True)
+        old = (self.folder / "ts_1" / "test.csv").read_text()
+
+        changed = deepcopy(config)
+        changed["timeseries"][1]["length"] = 300
+        self.assertEqual(_generate(changed, self.folder, cache=True), 1)
+        self.assertNotEqual((self.folder / "ts_1" / "test.csv").read_text(), old)
+
+    def test_cache_dir_is_shared_between_output_folders(self):
+        config = _config()
+        cache_dir = self.folder / "cache"
+        first, second = self.folder / "first", self.folder / "second"
+        self.assertEqual(_generate(config, first, cache_dir=cache_dir), 3)
+        self.assertEqual(_generate(config, second, cache_dir=cache_dir), 0)
+        for i in range(3):
+            for filename in ["test.csv", "train_no_anomaly.csv"]:
+                self.assertEqual(
+                    (first / f"ts_{i}" / filename).read_text(),
+                    (second / f"ts_{i}" / filename).read_text(),
+                )
+        self.assertEqual(
+            (first / "datasets.csv").read_text(), (second / "datasets.csv").read_text()
+        )
+
+    def test_identical_datasets_are_generated_once(self):
+        config = _config(n=1)
+        config["timeseries"] *= 2
+        self.assertEqual(_generate(config, self.folder, cache=True), 1)
+        gt = GutenTAG.from_dict(config, seed=42, addons=["TimeEvalAddOn"])
+        gt.generate(output_folder=self.folder, cache=True)
+        self.assertEqual(len(gt.addons["TimeEvalAddOn"].df), 4)
+
+    def test_key_depends_on_seed_and_format(self):
+        gt = GutenTAG.from_dict(_config(n=1))
+        ts, config = gt._timeseries[0], gt._overview.datasets[0]
+        key = GenerationCache.compute_key(ts, config, 42, OutputFormat.CSV)
+        self.assertEqual(
+            key, GenerationCache.compute_key(ts, config, 42, OutputFormat.CSV)
+        )
+        self.assertNotEqual(
+            key, GenerationCache.compute_key(ts, config, 43, OutputFormat.CSV)
+        )
+        self.assertNotEqual(
+            key, GenerationCache.compute_key(ts, config, 42, OutputFormat.NPY)
+        )
+
+    def test_cache_requires_seed(self):
+        gt = GutenTAG.from_dict(_config(n=1))
+        with self.assertWarns(UserWarning):
+            gt.generate(output_folder=self.folder, cache=True)
+        self.assertFalse(
+            (self.folder / "ts_0" / GenerationCache.MARKER_FILENAME).exists()
+        )
+
+    def test_markers_are_json(self):
+        _generate(_config(n=1), self.folder, cache=True)
+        marker = self.folder / "ts_0" / GenerationCache.MARKER_FILENAME
+        entry = json.loads(marker.read_text())
+        self.assertEqual(entry["config"]["name"], "ts_0")
+        self.assertIn("test.csv", entry["files"])
+
+        # markers that are not valid JSON (e.g., pickled objects) are never loaded
+        marker.write_bytes(pickle.dumps(entry))
+        self.assertEqual(_generate(_config(n=1), self.folder, cache=True), 1)
@@ -0,0 +1,56 @@
+import unittest
+
+from jsonschema import ValidationError
+
+from gutenTAG import GutenTAG
+from gutenTAG.config import ConfigValidator
+from gutenTAG.config.validator import GutenTAGParseError
+
+
+def _ts(name: str, **kwargs) -> dict:
+    return {
+        "name": name,
+        "length": 100,
+        "base-oscillations": [{"kind": "sine"}],
+        "anomalies": [],
+        **kwargs,
+    }
+
+
+class TestConfigValidator(unittest.TestCase):
+    def test_compiled_schema_is_shared(self):
+        a, b = ConfigValidator(), ConfigValidator()
+        self.assertIs(a.base_schema, b.base_schema)
+        self.assertIs(a._validator, b._validator)
+
+    def test_validate(self):
+        ConfigValidator().validate({"timeseries": [_ts("a")]})
+        with self.assertRaises(ValidationError) as ex:
+            ConfigValidator().validate({"timeseries": [_ts("a", length="long")]})
+        self.assertEqual(list(ex.exception.absolute_path), ["timeseries", 0, "length"])
+
+    def test_validate_timeseries(self):
+        validator = ConfigValidator()
+        validator.validate_timeseries(_ts("a"))
+        with self.assertRaises(ValidationError) as ex:
+            validator.validate_timeseries(_ts("a", length=0))
+        self.assertEqual(list(ex.exception.absolute_path), ["length"])
+        with self.assertRaises(GutenTAGParseError):
+            validator.validate_timeseries({"name": "a", "base-oscillations": []})
+
+    def test_validate_only(self):
+        config = {
+            "timeseries": [
+                _ts("invalid", length=-1),
+                {"name": "no-anomalies", "base-oscillations": []},
+                _ts("valid"),
+            ]
+        }
+        ConfigValidator().validate(config, only="valid")
+        with self.assertRaises(ValidationError):
+            ConfigValidator().validate(config, only="invalid")
+        with self.assertRaises(GutenTAGParseError):
+            ConfigValidator().validate(config, only="no-anomalies")
+
+        gt = GutenTAG.from_dict(config, only="valid")
+        self.assertEqual([ts.dataset_name for ts in gt._timeseries], ["valid"])
@@ -0,0 +1,92 @@
+import logging
+import tempfile
+import unittest
+from pathlib import Path
+
+import yaml
+
+from gutenTAG import GutenTAG
+from gutenTAG.utils.diagnostics import Diagnostics, LOGGER_NAME
+from gutenTAG.utils.logger import GutenTagLogger
+
+
+def _config(n: int) -> dict:
+    # extremum anomalies must have a length of 1
+    return {
+        "timeseries": [
+            {
+                "name": f"ts_{i}",
+                "length": 200,
+                "base-oscillations": [{"kind": "sine"}],
+                "anomalies": [
+                    {
+                        "length": 10,
+                        "kinds": [{"kind": "extremum", "min": False, "local": False}],
+                    }
+                ],
+            }
+            for i in range(n)
+        ]
+    }
+
+
+class TestDiagnostics(unittest.TestCase):
+    def test_events_are_counted_and_rate_limited(self):
+        diagnostics = Diagnostics(max_reports=2, dataset="ts")
+        with self.assertLogs(LOGGER_NAME, level="WARNING") as logs:
+            for _ in range(5):
+                diagnostics.warn_false_combination("AnomalyMean", "random-mode-jump")
+        # two reports and one note about the suppressed occurrences
+        self.assertEqual(len(logs.records), 3)
+        (record,) = diagnostics.to_records()
+        self.assertEqual(record["code"], Diagnostics.FALSE_COMBINATION)
+        self.assertEqual(record["count"], 5)
+        self.assertEqual(record["datasets"], ["ts"])
+        self.assertEqual(len(diagnostics), 5)
+
+    def test_merge(self):
+        worker = Diagnostics(emit=False, dataset="ts_1")
+        worker.report("code", "message")
+        worker.report("code", "message")
+        diagnostics = Diagnostics(dataset="ts_0")
+        diagnostics.report("code", "message")
+        with self.assertLogs(LOGGER_NAME, level="WARNING"):
+            diagnostics.merge(worker.to_records())
+        (record,) = diagnostics.to_records()
+        self.assertEqual(record["count"], 3)
+        self.assertEqual(record["datasets"], ["ts_0", "ts_1"])
+        self.assertIn("3x [code] message", diagnostics.summary())
+
+    def test_logger_registers_a_single_handler(self):
+        for _ in range(10):
+            GutenTagLogger()
+        self.assertEqual(len(logging.getLogger(LOGGER_NAME).handlers), 1)
+
+    def test_generation_aggregates_warnings(self):
+        gt = GutenTAG.from_dict(_config(20), seed=42)
+        with self.assertLogs(LOGGER_NAME, level="WARNING") as logs:
+            gt.generate()
+        # three reports, one note about the suppressed occurrences, and the summary
+        self.assertEqual(len(logs.records), 5)
+        (record,) = gt.diagnostics.to_records()
+        self.assertEqual(record["count"], 20)
+        self.assertEqual(len(record["datasets"]), 20)
+
+    def test_parallel_generation_aggregates_warnings(self):
+        gt = GutenTAG.from_dict(_config(4), n_jobs=2, seed=42)
+        with self.assertLogs(LOGGER_NAME, level="WARNING"):
+            gt.generate()
+        (record,) = gt.diagnostics.to_records()
+        self.assertEqual(record["count"], 4)
+
+    def test_overview_diagnostics(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            with self.assertLogs(LOGGER_NAME, level="WARNING"):
+                GutenTAG.from_dict(_config(2), seed=42).generate(
+                    output_folder=tmp, overview_diagnostics=True
+                )
+            with open(Path(tmp) / "overview.yaml") as f:
+                overview = yaml.safe_load(f)
+        (record,) = overview["meta"]["diagnostics"]
+        self.assertEqual(record["code"], Diagnostics.INVALID_PARAMETER)
+        self.assertEqual(record["count"], 2)
@@ -0,0 +1,106 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+from gutenTAG import GutenTAG
+from gutenTAG.cache import GenerationCache
+from gutenTAG.timeseries import OutputFormat
+
+CONFIG = {
+    "timeseries": [
+        {
+            "name": "ts",
+            "length": 500,
+            "semi-supervised": True,
+            "supervised": True,
+            "base-oscillations": [
+                {"kind": "sine", "trend": {"kind": "polynomial", "polynomial": [1, 2]}},
+                {"kind": "cylinder-bell-funnel"},
+                {
+                    "kind": "formula",
+                    "formula": {"base": 0, "aggregation": {"kind": "sum"}},
+                },
+            ],
+            "anomalies": [
+                {
+                    "length": 20,
+                    "kinds": [{"kind": "variance", "variance": 0.3}],
+                },
+                {
+                    "length": 20,
+                    "channel": 1,
+                    "kinds": [{"kind": "platform", "value": 0}],
+                },
+            ],
+        }
+    ]
+}
+
+
+class TestDtype(unittest.TestCase):
+    def _generate(self, dtype: str, **kwargs) -> list:
+        gt = GutenTAG.from_dict(CONFIG, seed=42, dtype=dtype, **kwargs)
+        datasets = gt.generate(return_timeseries=True)
+        assert datasets is not None
+        return [d.timeseries.iloc[:, :-1].to_numpy() for d in datasets]
+
+    def test_float32_generation(self):
+        datasets = self._generate("float32")
+        self.assertEqual(len(datasets), 3)
+        for values in datasets:
+            self.assertEqual(values.dtype, np.float32)
+
+    def test_reproducible_within_precision(self):
+        for dtype in ["float64", "float32"]:
+            first, second = self._generate(dtype), self._generate(dtype)
+            for a, b in zip(first, second):
+                np.testing.assert_array_equal(a, b)
+
+    def test_parallel_generation_uses_dtype(self):
+        for a, b in zip(self._generate("float32"), self._generate("float32", n_jobs=2)):
+            self.assertEqual(b.dtype, np.float32)
+            np.testing.assert_array_equal(a, b)
+
+    def test_float32_is_close_to_float64(self):
+        config = {
+            "timeseries": [
+                {
+                    "name": "sine",
+                    "length": 500,
+                    "base-oscillations": [{"kind": "sine", "variance": 0}],
+                    "anomalies": [],
+                }
+            ]
+        }
+        reference, values = (
+            GutenTAG.from_dict(config, seed=42, dtype=dtype)
+            .generate(return_timeseries=True)[0]
+            .timeseries["value-0"]
+            for dtype in ["float64", "float32"]
+        )
+        self.assertEqual(values.dtype, np.float32)
+        np.testing.assert_allclose(values, reference, atol=1e-6)
+
+    def test_npy_output(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            GutenTAG.from_dict(CONFIG, seed=42, dtype="float32").generate(
+                output_folder=tmp, output_format="npy"
+            )
+            self.assertEqual(np.load(Path(tmp) / "ts" / "test.npy").dtype, np.float32)
+
+    def test_unsupported_dtype(self):
+        with self.assertRaises(ValueError):
+            GutenTAG(dtype="float16")
+
+    def test_cache_key_depends_on_dtype(self):
+        keys = []
+        for dtype in ["float64", "float32"]:
+            gt = GutenTAG.from_dict(CONFIG, dtype=dtype)
+            keys.append(
+                GenerationCache.compute_key(
+                    gt._timeseries[0], gt._overview.datasets[0], 42, OutputFormat.CSV
+                )
+            )
+        self.assertNotEqual(keys[0], keys[1])
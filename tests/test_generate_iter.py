@@ -0,0 +1,70 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+import pandas as pd
+import yaml
+from pandas.testing import assert_frame_equal
+
+from gutenTAG import GutenTAG
+from gutenTAG.generator import Overview
+
+
+class TestGenerateIter(unittest.TestCase):
+    def setUp(self) -> None:
+        self.config = {
+            "timeseries": [
+                {
+                    "name": f"ts-{i}",
+                    "length": 100,
+                    "semi-supervised": i % 2 == 0,
+                    "base-oscillations": [{"kind": "sine"}],
+                    "anomalies": [
+                        {
+                            "length": 5,
+                            "channel": 0,
+                            "kinds": [{"kind": "platform", "value": 0}],
+                        }
+                    ],
+                }
+                for i in range(4)
+            ]
+        }
+
+    def test_same_result_as_generate(self):
+        expected = GutenTAG.from_dict(self.config, seed=42).generate(
+            return_timeseries=True
+        )
+        assert expected is not None
+        streamed = list(GutenTAG.from_dict(self.config, seed=42).generate_iter())
+        self.assertEqual(len(streamed), len(expected))
+        for a, b in zip(expected, streamed):
+            self.assertEqual(a.name, b.name)
+            self.assertEqual(a.training_type, b.training_type)
+            assert_frame_equal(a.timeseries, b.timeseries)
+
+    def test_parallel_keeps_order(self):
+        gutentag = GutenTAG.from_dict(self.config, seed=42, n_jobs=2)
+        names = [d.name for d in gutentag.generate_iter()]
+        self.assertEqual(names, ["ts-0", "ts-0", "ts-1", "ts-2", "ts-2", "ts-3"])
+
+    def test_finalizes_after_exhaustion(self):
+        gutentag = GutenTAG.from_dict(
+            self.config, seed=42, addons=["gutenTAG.addons.timeeval.TimeEvalAddOn"]
+        )
+        with tempfile.TemporaryDirectory() as tmp:
+            folder = Path(tmp)
+            iterator = gutentag.generate_iter(output_folder=folder)
+            next(iterator)
+            self.assertFalse((folder / Overview.FILENAME).exists())
+            for _ in iterator:
+                pass
+
+            with open(folder / Overview.FILENAME, "r") as fh:
+                overview = yaml.safe_load(fh)
+            self.assertEqual(
+                [d["name"] for d in overview["generated-timeseries"]],
+                [f"ts-{i}" for i in range(4)],
+            )
+            df = pd.read_csv(folder / "datasets.csv")
+            self.assertEqual(len(df), 6)
@@ -0,0 +1,79 @@
+import unittest
+from collections import Counter
+
+import numpy as np
+
+from gutenTAG import GutenTAG
+from gutenTAG.anomalies import AnomalyPositionIndex
+
+
+class TestAnomalyPositionIndex(unittest.TestCase):
+    def test_add_merges_overlapping_intervals(self):
+        index = AnomalyPositionIndex([(10, 20), (40, 50), (15, 30), (100, 110)])
+        self.assertEqual(list(index), [(10, 30), (40, 50), (100, 110)])
+        index.add(25, 45)
+        self.assertEqual(list(index), [(10, 50), (100, 110)])
+        self.assertEqual(len(index), 2)
+
+    def test_is_free(self):
+        index = AnomalyPositionIndex([(10, 20)])
+        self.assertTrue(index.is_free(0, 9))
+        self.assertTrue(index.is_free(21, 30))
+        self.assertFalse(index.is_free(0, 10))
+        self.assertFalse(index.is_free(20, 30))
+        self.assertFalse(index.is_free(5, 25))
+        self.assertFalse(index.is_free(12, 18))
+
+    def test_sample_same_as_choice_if_free(self):
+        index = AnomalyPositionIndex()
+        starts = [
+            index.sample(np.random.default_rng(1), 100, 1, 333, 10, 1000)
+            for _ in range(5)
+        ]
+        expected = 100 + np.random.default_rng(1).choice(np.arange(333))
+        self.assertEqual(starts, [expected] * 5)
+
+    def test_sample_only_free_positions(self):
+        index = AnomalyPositionIndex([(15, 20), (40, 60)])
+        rng = np.random.default_rng(42)
+        counts = Counter(index.sample(rng, 0, 5, 20, 4, 90) for _ in range(11000))
+        # candidates: 0, 5, ..., 95; blocked: [11, 20] and [36, 60]; must end before 90
+        self.assertEqual(set(counts), {0, 5, 10, 25, 30, 35, 65, 70, 75, 80, 85})
+        self.assertTrue(all(900 < c < 1100 for c in counts.values()))
+
+    def test_sample_full(self):
+        index = AnomalyPositionIndex([(0, 100)])
+        rng = np.random.default_rng(42)
+        self.assertIsNone(index.sample(rng, 0, 1, 90, 5, 100))
+        self.assertIsNone(AnomalyPositionIndex().sample(rng, 0, 1, 10, 20, 15))
+
+
+class TestDenseAnomalyPositions(unittest.TestCase):
+    def test_dense_anomalies_do_not_overlap(self):
+        n_anomalies = 21
+        config = {
+            "timeseries": [
+                {
+                    "name": "dense",
+                    "length": 900,
+                    "base-oscillations": [{"kind": "sine"}],
+                    "anomalies": [
+                        {
+                            "position": "middle",
+                            "length": 10,
+                            "channel": 0,
+                            "kinds": [{"kind": "platform", "value": 0}],
+                        }
+                    ]
+                    * n_anomalies,
+                }
+            ]
+        }
+        gutentag = GutenTAG(seed=42)
+        gutentag.load_config_dict(config)
+        ts = gutentag.generate(return_timeseries=True)
+        self.assertIsNotNone(ts)
+        labels = ts[0].timeseries["is_anomaly"].values  # type: ignore
+        self.assertEqual(labels.sum(), n_anomalies * 10)
+        self.assertTrue(np.all(labels[:300] == 0))
+        self.assertTrue(np.all(labels[600 + 10 :] == 0))
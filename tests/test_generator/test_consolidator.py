@@ -0,0 +1,195 @@
+import unittest
+from typing import Literal
+from unittest.mock import patch
+
+import numpy as np
+from numpy.testing import assert_array_equal
+
+from gutenTAG import GutenTAG
+from gutenTAG.config import ConfigParser
+from gutenTAG.consolidator import Consolidator
+from gutenTAG.utils.types import GenerationContext
+
+
+class TestConsolidator(unittest.TestCase):
+    def setUp(self) -> None:
+        config = {
+            "timeseries": [
+                {
+                    "name": "consolidator",
+                    "length": 500,
+                    "base-oscillations": [
+                        {"kind": "sine", "variance": 0.1, "offset": 2},
+                        {"kind": "random-walk"},
+                        {
+                            "kind": "formula",
+                            "formula": {
+                                "base": 0,
+                                "operation": {"kind": "+", "operand": 1.0},
+                            },
+                        },
+                    ],
+                    "anomalies": [
+                        {
+                            "length": 20,
+                            "channel": 1,
+                            "kinds": [{"kind": "platform", "value": 0}],
+                        }
+                    ],
+                }
+            ]
+        }
+        ((self.bos, self.anomalies, _, _),) = ConfigParser().parse(config)
+
+    def _generate(self, order: Literal["F", "C"]):
+        consolidator = Consolidator(self.bos, self.anomalies, order=order)
+        return consolidator.generate(GenerationContext(GenerationContext.re_seed(42)))
+
+    def test_channels_are_contiguous(self):
+        timeseries, labels = self._generate("F")
+        self.assertEqual(timeseries.shape, (500, 3))
+        self.assertTrue(timeseries.flags.f_contiguous)
+        for c in range(3):
+            self.assertTrue(timeseries[:, c].flags.c_contiguous)
+            # base oscillations write into their column directly
+            self.assertTrue(np.shares_memory(self.bos[c].timeseries, timeseries))
+        self.assertEqual(labels.sum(), 20)
+
+    def test_memory_orders_are_equivalent(self):
+        f_timeseries, f_labels = self._generate("F")
+        c_timeseries, c_labels = self._generate("C")
+        self.assertTrue(c_timeseries.flags.c_contiguous)
+        assert_array_equal(f_timeseries, c_timeseries)
+        assert_array_equal(f_labels, c_labels)
+
+    def test_unknown_memory_order(self):
+        with self.assertRaises(ValueError):
+            Consolidator(self.bos, self.anomalies, order="K")  # type: ignore
+
+
+class TestTemplateChannels(unittest.TestCase):
+    @staticmethod
+    def _config(template: bool, channels: int = 40) -> dict:
+        bo = {"kind": "sine", "variance": 0.1, "offset": 1}
+        ts = {
+            "name": "wide",
+            "length": 300,
+            "anomalies": [
+                {
+                    "length": 20,
+                    "channel": 3,
+                    "kinds": [{"kind": "platform", "value": 0}],
+                },
+                {
+                    "length": 30,
+                    "channel": 7,
+                    "kinds": [
+                        {
+                            "kind": "trend",
+                            "oscillation": {"kind": "polynomial", "polynomial": [1]},
+                        }
+                    ],
+                },
+            ],
+        }
+        if template:
+            ts.update({"base-oscillation": bo, "channels": channels})
+        else:
+            ts["base-oscillations"] = [dict(bo) for _ in range(channels)]
+        return {"timeseries": [ts]}
+
+    def _generate(self, template: bool, dtype=np.float64):
+        ((bos, anomalies, _, _),) = ConfigParser().parse(self._config(template))
+        consolidator = Consolidator(bos, anomalies)
+        ctx = GenerationContext(
+            GenerationContext.re_seed(42), base_cache={}, dtype=np.dtype(dtype)
+        )
+        return bos, consolidator, consolidator.generate(ctx)
+
+    def test_template_channels_are_copies(self):
+        bos, consolidator, _ = self._generate(template=True)
+        self.assertIsNone(bos[0].template)
+        self.assertTrue(all(bo.template is bos[0] for bo in bos[1:]))
+        self.assertEqual(list(consolidator._channel_blocks()), [(0, 40)])
+
+    def test_block_generation_is_identical(self):
+        for dtype in [np.float64, np.float32]:
+            _, _, (expected, expected_labels) = self._generate(False, dtype)
+            bos, _, (timeseries, labels) = self._generate(True, dtype)
+            assert_array_equal(timeseries, expected)
+            assert_array_equal(labels, expected_labels)
+            self.assertTrue(np.shares_memory(bos[5].timeseries, timeseries))
+
+    def test_previous_channels_are_passed_by_reference(self):
+        ctx = GenerationContext(GenerationContext.re_seed(42))
+        channels = [np.zeros(3)]
+        self.assertIs(ctx.to_bo(1, channels).previous_channels, channels)
+
+
+class TestThreadedGeneration(unittest.TestCase):
+    CONFIG = {
+        "timeseries": [
+            {
+                "name": "threaded",
+                "length": 400,
+                "semi-supervised": True,
+                "base-oscillations": [
+                    *[{"kind": "sine", "variance": 0.1, "offset": 1}] * 5,
+                    {"kind": "random-walk", "variance": 0.1},
+                    {
+                        "kind": "sine",
+                        "frequency": 3,
+                        "trend": {"kind": "polynomial", "polynomial": [1, 0]},
+                    },
+                    {
+                        "kind": "formula",
+                        "formula": {
+                            "base": 5,
+                            "operation": {"kind": "+", "operand": {"base": 6}},
+                        },
+                    },
+                    *[{"kind": "square", "variance": 0.05}] * 4,
+                    {"kind": "cylinder-bell-funnel"},
+                ],
+                "anomalies": [
+                    {
+                        "length": 20,
+                        "channel": 2,
+                        "kinds": [{"kind": "platform", "value": 0}],
+                    },
+                    {
+                        "length": 30,
+                        "channel": 9,
+                        "kinds": [
+                            {
+                                "kind": "trend",
+                                "oscillation": {
+                                    "kind": "polynomial",
+                                    "polynomial": [1],
+                                },
+                            }
+                        ],
+                    },
+                ],
+            }
+        ]
+    }
+
+    def _generate(self, n_threads: int, dtype) -> list:
+        gt = GutenTAG.from_dict(self.CONFIG, seed=42, dtype=dtype, n_threads=n_threads)
+        gt.generate(return_timeseries=True)
+        (ts,) = gt._timeseries
+        return [ts.timeseries, ts.labels, ts.semi_supervised_timeseries]
+
+    def test_threaded_generation_is_identical(self):
+        with patch("gutenTAG.consolidator.THREADING_THRESHOLD", 0):
+            for dtype in [np.float64, np.float32]:
+                expected = self._generate(1, dtype)
+                for n_threads in [2, 4]:
+                    for a, b in zip(self._generate(n_threads, dtype), expected):
+                        assert_array_equal(a, b)
+
+    def test_small_time_series_are_generated_serially(self):
+        with patch("gutenTAG.consolidator.ThreadPoolExecutor") as pool:
+            self._generate(4, np.float64)
+        pool.assert_not_called()
@@ -0,0 +1,89 @@
+import unittest
+from unittest.mock import patch
+
+from numpy.testing import assert_array_equal
+
+from gutenTAG.base_oscillations.sine import Sine
+from gutenTAG.config import ConfigParser
+from gutenTAG.generator import TimeSeries
+from gutenTAG.timeseries import TrainingType
+
+
+class TestSharedVariants(unittest.TestCase):
+    def setUp(self) -> None:
+        self.config = {
+            "timeseries": [
+                {
+                    "name": "variants",
+                    "length": 1000,
+                    "semi-supervised": True,
+                    "supervised": True,
+                    "base-oscillations": [
+                        {
+                            "kind": "sine",
+                            "variance": 0.1,
+                            "trend": {"kind": "polynomial", "polynomial": [1, 1]},
+                        },
+                        {"kind": "random-walk"},
+                    ],
+                    "anomalies": [
+                        {
+                            "length": 50,
+                            "channel": 0,
+                            "kinds": [
+                                {
+                                    "kind": "trend",
+                                    "oscillation": {"kind": "sine", "frequency": 1.0},
+                                }
+                            ],
+                        },
+                        {
+                            "length": 50,
+                            "channel": 0,
+                            "position": "end",
+                            "kinds": [{"kind": "amplitude", "amplitude_factor": 2.0}],
+                        },
+                    ],
+                }
+            ]
+        }
+
+    def _generate(self, share: bool) -> TimeSeries:
+        ((bos, anomalies, options, _),) = ConfigParser().parse(self.config)
+        return TimeSeries(
+            bos, anomalies, **options.to_dict(), share_deterministic_bases=share
+        ).generate(random_seed=42)
+
+    def test_shared_bases_produce_same_variants(self):
+        shared = self._generate(share=True)
+        separate = self._generate(share=False)
+        assert_array_equal(shared.timeseries, separate.timeseries)
+        assert_array_equal(
+            shared.semi_supervised_timeseries, separate.semi_supervised_timeseries
+        )
+        assert_array_equal(shared.supervised_timeseries, separate.supervised_timeseries)
+        assert_array_equal(shared.labels, separate.labels)
+        assert_array_equal(shared.train_labels, separate.train_labels)
+
+    def test_deterministic_base_generated_once(self):
+        with patch.object(
+            Sine,
+            "generate_only_base",
+            autospec=True,
+            side_effect=Sine.generate_only_base,
+        ) as generate_only_base:
+            self._generate(share=True)
+        # the sine channel and the sine trend anomaly are generated once for all three variants
+        self.assertEqual(generate_only_base.call_count, 2)
+
+    def test_variant_timings(self):
+        ts = self._generate(share=True)
+        self.assertEqual(
+            set(ts.variant_timings),
+            {
+                TrainingType.TEST,
+                TrainingType.TRAIN_NO_ANOMALIES,
+                TrainingType.TRAIN_ANOMALIES,
+            },
+        )
+        self.assertTrue(all(t >= 0 for t in ts.variant_timings.values()))
@@ -0,0 +1,154 @@
+import tempfile
+import unittest
+from itertools import islice
+from pathlib import Path
+from unittest.mock import patch
+
+from jsonschema import ValidationError
+
+from gutenTAG import GutenTAG
+from gutenTAG.config import ConfigParser
+from gutenTAG.config.parser import expand_grid
+
+
+def _ts(**kwargs) -> dict:
+    return {
+        "name": "sweep",
+        "length": 200,
+        "base-oscillations": [{"kind": "sine", "frequency": 1}],
+        "anomalies": [{"length": 10, "kinds": [{"kind": "platform", "value": 0}]}],
+        **kwargs,
+    }
+
+
+GRID = {
+    "base-oscillations.0.frequency": [1, 5],
+    "anomalies.0.position": ["beginning", "middle", "end"],
+}
+
+OUTPUTS = [
+    "overview.yaml",
+    "datasets.csv",
+    "sweep-4/test.csv",
+    "plain/replica-1/test.csv",
+]
+
+
+def _generate(output_folder: Path, stream: bool, n_jobs: int = 1) -> GutenTAG:
+    config = {"timeseries": [_ts(grid=GRID), _ts(name="plain", replicas=2)]}
+    gt = GutenTAG.from_dict(
+        config, seed=42, addons=["TimeEvalAddOn"], n_jobs=n_jobs, stream=stream
+    )
+    gt.generate(output_folder=output_folder)
+    return gt
+
+
+class TestGrid(unittest.TestCase):
+    def test_expand_grid(self):
+        template = _ts(grid=GRID)
+        expanded = list(expand_grid(template, "sweep"))
+        self.assertEqual(
+            [name for name, _ in expanded], [f"sweep-{i}" for i in range(6)]
+        )
+        _, ts = expanded[4]
+        self.assertNotIn("grid", ts)
+        self.assertEqual(ts["name"], "sweep-4")
+        self.assertEqual(ts["base-oscillations"][0]["frequency"], 5)
+        self.assertEqual(ts["anomalies"][0]["position"], "middle")
+        # the template is not modified
+        self.assertEqual(template["base-oscillations"][0]["frequency"], 1)
+
+    def test_placeholder_names(self):
+        name = "sine-{base-oscillations.0.frequency}-{anomalies.0.position}"
+        names = [n for n, _ in expand_grid(_ts(name=name, grid=GRID), name)]
+        self.assertEqual(names[:2], ["sine-1-beginning", "sine-1-middle"])
+        self.assertEqual(names[-1], "sine-5-end")
+
+    def test_partial_placeholder_names_are_unique(self):
+        name = "sine-{base-oscillations.0.frequency}"
+        names = [n for n, _ in expand_grid(_ts(name=name, grid=GRID), name)]
+        self.assertEqual(len(set(names)), 6)
+        self.assertEqual(names[:2], ["sine-1-0", "sine-1-1"])
+        self.assertEqual(names[-1], "sine-5-5")
+
+    def test_expansion_is_lazy(self):
+        values = list(range(1, 101))
+        grid = {
+            "base-oscillations.0.frequency": values,
+            "base-oscillations.0.amplitude": values,
+            "length": [200 + v for v in values],
+        }
+        parsed = ConfigParser().iter_parse({"timeseries": [_ts(grid=grid)]})
+        first = list(islice(parsed, 3))
+        self.assertEqual(
+            [options.dataset_name for _, _, options, _ in first],
+            ["sweep-0", "sweep-1", "sweep-2"],
+        )
+        self.assertEqual(
+            [config["length"] for _, _, _, config in first], [201, 202, 203]
+        )
+
+    def test_invalid_path(self):
+        for path in ["anomalies.1.length", "base-oscillations.x.kind", "length.value"]:
+            with self.assertRaises(ValueError):
+                ConfigParser().parse({"timeseries": [_ts(grid={path: [1]})]})
+
+    def test_generate(self):
+        gt = GutenTAG.from_dict({"timeseries": [_ts(grid=GRID)]}, seed=42)
+        datasets = gt.generate(return_timeseries=True)
+        self.assertEqual(len(datasets), 6)
+        self.assertEqual([d.name for d in datasets], [f"sweep-{i}" for i in range(6)])
+        self.assertEqual(
+            [c["anomalies"][0]["position"] for c in gt._overview.datasets],
+            ["beginning", "middle", "end"] * 2,
+        )
+
+    def test_only_expanded_name(self):
+        gt = GutenTAG.from_dict(
+            {"timeseries": [_ts(grid=GRID)]}, seed=42, only="sweep-3"
+        )
+        self.assertEqual([ts.dataset_name for ts in gt._timeseries], ["sweep-3"])
+
+    def test_schema(self):
+        with self.assertRaises(ValidationError):
+            GutenTAG.from_dict({"timeseries": [_ts(grid={"length": []})]}, seed=42)
+
+    def test_expanded_configs_are_validated(self):
+        grid = {"base-oscillations.0.frequency": [1, -5]}
+        with self.assertRaises(ValidationError):
+            GutenTAG.from_dict({"timeseries": [_ts(grid=grid)]}, seed=42)
+
+    def test_stream(self):
+        with tempfile.TemporaryDirectory() as eager_dir:
+            with tempfile.TemporaryDirectory() as streamed_dir:
+                _generate(Path(eager_dir), stream=False)
+                gt = _generate(Path(streamed_dir), stream=True)
+                # the streamed time series are not kept in memory
+                self.assertEqual(gt._timeseries, [])
+                self.assertEqual(gt._overview.datasets, [])
+                for name in OUTPUTS:
+                    self.assertEqual(
+                        (Path(streamed_dir) / name).read_text(),
+                        (Path(eager_dir) / name).read_text(),
+                        name,
+                    )
+
+    def test_stream_parallel(self):
+        with tempfile.TemporaryDirectory() as eager_dir:
+            with tempfile.TemporaryDirectory() as streamed_dir:
+                _generate(Path(eager_dir), stream=False)
+                # the streamed time series are built only in the workers
+                with patch.object(ConfigParser, "iter_parse") as iter_parse:
+                    _generate(Path(streamed_dir), stream=True, n_jobs=2)
+                iter_parse.assert_not_called()
+                for name in OUTPUTS:
+                    self.assertEqual(
+                        (Path(streamed_dir) / name).read_text(),
+                        (Path(eager_dir) / name).read_text(),
+                        name,
+                    )
+
+    def test_stream_cannot_be_sharded(self):
+        gt = GutenTAG.from_dict({"timeseries": [_ts(grid=GRID)]}, seed=42, stream=True)
+        with self.assertRaises(ValueError):
+            gt.shard(1, 2)
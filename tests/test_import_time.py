@@ -0,0 +1,55 @@
+import subprocess
+import sys
+import unittest
+
+# heavy dependencies that must only be imported when the features using them are requested
+DEFERRED_MODULES = [
+    "matplotlib",
+    "neurokit2",
+    "sklearn",
+    "scipy",
+    "git",
+    "jsonschema",
+    "joblib",
+]
+# generous upper bound for the cumulative import time of the gutenTAG package (mostly spent in pandas)
+IMPORT_TIME_BUDGET_US = 3_000_000
+
+
+def _run_python(*args: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *args], capture_output=True, text=True, check=True
+    )
+
+
+class TestImportTime(unittest.TestCase):
+    def test_heavy_modules_are_deferred(self):
+        code = (
+            "import sys, gutenTAG; "
+            f"print(','.join(m for m in {DEFERRED_MODULES!r} if m in sys.modules))"
+        )
+        loaded = _run_python("-c", code).stdout.strip()
+        self.assertEqual(loaded, "", f"Modules loaded at import time: {loaded}")
+
+    def test_import_time_budget(self):
+        stderr = _run_python("-X", "importtime", "-c", "import gutenTAG").stderr
+        # format: "import time: <self [us]> | <cumulative [us]> | <module>"
+        cumulative = {
+            line.split("|")[2].strip(): int(line.split("|")[1])
+            for line in stderr.splitlines()
+            if line.startswith("import time:") and "cumulative" not in line
+        }
+        self.assertIn("gutenTAG", cumulative)
+        self.assertLess(cumulative["gutenTAG"], IMPORT_TIME_BUDGET_US)
+
+    def test_deferred_modules_are_loaded_on_use(self):
+        code = (
+            "import sys\n"
+            "from gutenTAG import GutenTAG\n"
+            "gt = GutenTAG(seed=1)\n"
+            "gt.load_config_dict({'timeseries': [{'name': 'ts', 'length': 100, "
+            "'base-oscillations': [{'kind': 'random-walk'}], 'anomalies': []}]})\n"
+            "gt.generate()\n"
+            "print('jsonschema' in sys.modules, 'scipy' in sys.modules)"
+        )
+        self.assertEqual(_run_python("-c", code).stdout.strip(), "True True")
@@ -51,6 +51,13 @@ class TestIntegrationBaseOscillations(TestIntegration):
             ["value-0", "is_anomaly"],
         )
 
+    def test_cbf_vectorized_from_config(self):
+        self._compare_expected_and_generated(
+            "tests/configs/example-config-cbf-vectorized.yaml",
+            "tests/generated/example-ts-cbf-vectorized.csv",
+            ["value-0", "is_anomaly"],
+        )
+
     def test_rw_from_config(self):
         self._compare_expected_and_generated(
             "tests/configs/example-config-rw.yaml",
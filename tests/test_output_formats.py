@@ -0,0 +1,92 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from numpy.testing import assert_array_equal
+from pandas.testing import assert_frame_equal
+
+from gutenTAG import GutenTAG, OutputFormat, TrainingType
+
+
+class TestOutputFormats(unittest.TestCase):
+    def setUp(self) -> None:
+        self.config = {
+            "timeseries": [
+                {
+                    "name": "ts",
+                    "length": 200,
+                    "semi-supervised": True,
+                    "base-oscillation": {"kind": "sine"},
+                    "channels": 2,
+                    "anomalies": [
+                        {
+                            "length": 10,
+                            "channel": 1,
+                            "kinds": [{"kind": "mean", "offset": 0.5}],
+                        }
+                    ],
+                }
+            ]
+        }
+        self.tmp = tempfile.TemporaryDirectory()
+        self.folder = Path(self.tmp.name)
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def _generate(self, output_format: OutputFormat) -> pd.DataFrame:
+        gutentag = GutenTAG.from_dict(
+            self.config, seed=42, addons=["gutenTAG.addons.timeeval.TimeEvalAddOn"]
+        )
+        datasets = gutentag.generate(
+            return_timeseries=True,
+            output_folder=self.folder,
+            output_format=output_format,
+        )
+        assert datasets is not None
+        return datasets[0].timeseries
+
+    def test_filename(self):
+        self.assertEqual(OutputFormat.CSV.filename("test.csv"), "test.csv")
+        self.assertEqual(OutputFormat.PARQUET.filename("test.csv"), "test.parquet")
+        self.assertEqual(
+            OutputFormat.NPY.filename("train_anomaly.csv"), "train_anomaly.npy"
+        )
+
+    def test_npy(self):
+        expected = self._generate(OutputFormat.NPY)
+        values = np.load(self.folder / "ts" / "test.npy")
+        labels = np.load(self.folder / "ts" / "test.labels.npy")
+        self.assertEqual(values.shape, (200, 2))
+        self.assertEqual(labels.dtype, np.int8)
+        assert_array_equal(values, expected[["value-0", "value-1"]].values)
+        assert_array_equal(labels, expected["is_anomaly"].values)
+        self.assertTrue((self.folder / "ts" / "train_no_anomaly.npy").exists())
+
+        df = pd.read_csv(self.folder / "datasets.csv")
+        self.assertEqual(df["test_path"][0], "ts/test.npy")
+        self.assertEqual(df["train_path"][1], "ts/train_no_anomaly.npy")
+
+    def test_arrow_formats(self):
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            self.skipTest("pyarrow is not installed")
+
+        expected = self._generate(OutputFormat.PARQUET).reset_index()
+        df = pd.read_parquet(self.folder / "ts" / "test.parquet")
+        assert_frame_equal(df, expected, check_dtype=False)
+
+        expected = self._generate(OutputFormat.FEATHER).reset_index()
+        df = pd.read_feather(self.folder / "ts" / "train_no_anomaly.feather")
+        self.assertEqual(list(df.columns), list(expected.columns))
+        self.assertEqual(len(df), 200)
+
+    def test_csv_is_default(self):
+        gutentag = GutenTAG.from_dict(self.config, seed=42)
+        gutentag.generate(output_folder=self.folder)
+        self.assertTrue((self.folder / "ts" / "test.csv").exists())
+        self.assertTrue((self.folder / "ts" / "train_no_anomaly.csv").exists())
+        self.assertEqual(TrainingType.TEST.value, "test")
@@ -1,3 +1,4 @@
+import tempfile
 import unittest
 from pathlib import Path
 
@@ -23,3 +24,36 @@ class TestParallel(unittest.TestCase):
         df = df_generated[0].timeseries
         for column in ["value-0", "value-1", "is_anomaly"]:
             assert_series_equal(df[column], expected_ts[column])
+
+    def test_parallel_workers_write_outputs(self):
+        config = {
+            "timeseries": [
+                {
+                    "length": 200,
+                    "supervised": True,
+                    "base-oscillations": [{"kind": "random-walk"}],
+                    "anomalies": [
+                        {"length": 10, "kinds": [{"kind": "platform", "value": 0}]}
+                    ],
+                }
+                for _ in range(4)
+            ]
+        }
+        with tempfile.TemporaryDirectory() as serial_dir:
+            with tempfile.TemporaryDirectory() as parallel_dir:
+                GutenTAG.from_dict(config, seed=42, addons=["TimeEvalAddOn"]).generate(
+                    output_folder=Path(serial_dir)
+                )
+                GutenTAG.from_dict(
+                    config, seed=42, n_jobs=2, addons=["TimeEvalAddOn"]
+                ).generate(output_folder=Path(parallel_dir))
+
+                for i in range(4):
+                    for filename in ["test.csv", "train_anomaly.csv"]:
+                        serial = Path(serial_dir) / f"ts_{i}" / filename
+                        parallel = Path(parallel_dir) / f"ts_{i}" / filename
+                        self.assertEqual(serial.read_text(), parallel.read_text())
+                self.assertEqual(
+                    (Path(serial_dir) / "datasets.csv").read_text(),
+                    (Path(parallel_dir) / "datasets.csv").read_text(),
+                )
@@ -0,0 +1,141 @@
+import tempfile
+import unittest
+from copy import deepcopy
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+from gutenTAG import GutenTAG
+from gutenTAG.base_oscillations.sine import Sine
+from gutenTAG.sharding import merge_shards
+
+TS_CONFIG = {
+    "name": "ts",
+    "length": 300,
+    "semi-supervised": True,
+    "base-oscillations": [{"kind": "sine"}, {"kind": "random-walk"}],
+    "anomalies": [{"length": 10, "kinds": [{"kind": "platform", "value": 0}]}],
+}
+
+
+def _config(replicas=None) -> dict:
+    ts = deepcopy(TS_CONFIG)
+    if replicas is not None:
+        ts["replicas"] = replicas
+    other = {**deepcopy(TS_CONFIG), "name": "other"}
+    return {"timeseries": [ts, other]}
+
+
+def _values(datasets) -> list:
+    return [d.timeseries.to_numpy() for d in datasets]
+
+
+class TestReplicas(unittest.TestCase):
+    def test_replicas_config(self):
+        gt = GutenTAG.from_dict(_config(replicas=3), seed=42)
+        self.assertEqual(
+            [ts.dataset_name for ts in gt._timeseries],
+            ["ts/replica-0", "ts/replica-1", "ts/replica-2", "other"],
+        )
+        config = gt._overview.datasets[1]
+        self.assertNotIn("replicas", config)
+        self.assertEqual(config["replica"], {"of": "ts", "index": 1, "seed": 43})
+
+    def test_replica_equals_generation_with_seed(self):
+        replicas = _values(
+            GutenTAG.from_dict(_config(replicas=2), seed=42)
+            .remove_by_name("other")
+            .generate(return_timeseries=True)
+        )
+        for k in range(2):
+            expected = _values(
+                GutenTAG.from_dict({"timeseries": [TS_CONFIG]}, seed=42 + k).generate(
+                    return_timeseries=True
+                )
+            )
+            for a, b in zip(replicas[2 * k : 2 * k + 2], expected):
+                np.testing.assert_array_equal(a, b)
+        self.assertFalse(np.array_equal(replicas[0], replicas[2]))
+
+    def test_deterministic_bases_are_shared(self):
+        with patch.object(
+            Sine,
+            "generate_only_base",
+            autospec=True,
+            side_effect=Sine.generate_only_base,
+        ) as generate_only_base:
+            GutenTAG.from_dict(_config(), seed=42).generate_replicas(
+                "ts", seeds=[1, 2, 3, 4], return_timeseries=True
+            )
+        self.assertEqual(generate_only_base.call_count, 1)
+
+    def test_generate_replicas_output(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            folder = Path(tmp)
+            GutenTAG.from_dict(
+                _config(), seed=42, addons=["TimeEvalAddOn"]
+            ).generate_replicas("ts", seeds=[7, 8], output_folder=folder)
+            for k in range(2):
+                self.assertTrue((folder / "ts" / f"replica-{k}" / "test.csv").is_file())
+            self.assertFalse((folder / "other").exists())
+            df = pd.read_csv(folder / "datasets.csv")
+            self.assertEqual(
+                list(df["test_path"].unique()),
+                ["ts/replica-0/test.csv", "ts/replica-1/test.csv"],
+            )
+
+    def test_generate_after_generate_replicas(self):
+        gt = GutenTAG.from_dict(_config(), seed=42)
+        replicas = gt.generate_replicas("ts", seeds=[7, 8], return_timeseries=True)
+        assert replicas is not None
+        self.assertEqual(
+            list(dict.fromkeys(d.name for d in replicas)),
+            ["ts/replica-0", "ts/replica-1"],
+        )
+        datasets = gt.generate(return_timeseries=True)
+        assert datasets is not None
+        self.assertEqual(
+            list(dict.fromkeys(d.name for d in datasets)),
+            ["ts/replica-0", "ts/replica-1", "other"],
+        )
+        self.assertEqual(
+            [c["name"] for c in gt._overview.datasets],
+            ["ts/replica-0", "ts/replica-1", "other"],
+        )
+
+    def test_parallel_generation(self):
+        serial, parallel = (
+            _values(
+                GutenTAG.from_dict(
+                    _config(replicas=2), seed=42, n_jobs=n_jobs
+                ).generate(return_timeseries=True)
+            )
+            for n_jobs in [1, 2]
+        )
+        for a, b in zip(serial, parallel):
+            np.testing.assert_array_equal(a, b)
+
+    def test_merge_sharded_replicas(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            folder = Path(tmp)
+            gt = GutenTAG.from_dict(
+                _config(replicas=3), seed=42, addons=["TimeEvalAddOn"]
+            )
+            gt.generate(output_folder=folder / "single")
+            shard_dirs = [folder / f"shard-{i}" for i in range(1, 3)]
+            for i, shard_dir in enumerate(shard_dirs, start=1):
+                GutenTAG.from_dict(
+                    _config(replicas=3), seed=42, addons=["TimeEvalAddOn"]
+                ).shard(i, 2).generate(output_folder=shard_dir)
+            merge_shards(shard_dirs, folder / "merged", move=True)
+            for filename in ["overview.yaml", "datasets.csv", "ts/replica-2/test.csv"]:
+                self.assertEqual(
+                    (folder / "merged" / filename).read_text(),
+                    (folder / "single" / filename).read_text(),
+                )
+
+    def test_unknown_name(self):
+        with self.assertRaises(ValueError):
+            GutenTAG.from_dict(_config()).replicate("unknown", seeds=[1])
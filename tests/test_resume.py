@@ -0,0 +1,135 @@
+import tempfile
+import unittest
+from pathlib import Path
+from typing import Any, List
+from unittest.mock import patch
+
+import yaml
+
+from gutenTAG import GutenTAG
+from gutenTAG.__main__ import main
+from gutenTAG.cache import GenerationCache, RunJournal
+from gutenTAG.utils.atomic import atomic_path
+
+CONFIG = {
+    "timeseries": [
+        {
+            "name": f"ts_{i}",
+            "length": 200,
+            "semi-supervised": True,
+            "base-oscillations": [{"kind": "random-walk"}],
+            "anomalies": [{"length": 10, "kinds": [{"kind": "platform", "value": 0}]}],
+        }
+        for i in range(4)
+    ]
+}
+
+
+def _gutentag() -> GutenTAG:
+    return GutenTAG.from_dict(CONFIG, seed=42, addons=["TimeEvalAddOn"])
+
+
+class TestResume(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.folder = Path(self.tmp.name)
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def _interrupted_run(self, output: Path, completed: int) -> None:
+        generate = GutenTAG.internal_generate
+        calls: List[Any] = []
+
+        def crash(*args, **kwargs):
+            if len(calls) == completed:
+                raise KeyboardInterrupt()
+            calls.append(args)
+            return generate(*args, **kwargs)
+
+        with patch.object(GutenTAG, "internal_generate", staticmethod(crash)):
+            with self.assertRaises(KeyboardInterrupt):
+                _gutentag().generate(output_folder=output, resume=True)
+
+    def test_resume_generates_missing_datasets(self):
+        _gutentag().generate(output_folder=self.folder / "single")
+        output = self.folder / "resumed"
+        self._interrupted_run(output, completed=2)
+        self.assertFalse((output / "overview.yaml").exists())
+        self.assertFalse((output / "ts_2").exists())
+
+        generate = GutenTAG.internal_generate
+        generated = []
+
+        def record(ctx, ts, config):
+            generated.append(ts.dataset_name)
+            return generate(ctx, ts, config)
+
+        with patch.object(GutenTAG, "internal_generate", staticmethod(record)):
+            _gutentag().generate(output_folder=output, resume=True)
+        self.assertEqual(generated, ["ts_2", "ts_3"])
+
+        for filename in ["overview.yaml", "datasets.csv"]:
+            self.assertEqual(
+                (output / filename).read_text(),
+                (self.folder / "single" / filename).read_text(),
+            )
+        for i in range(4):
+            self.assertEqual(
+                (output / f"ts_{i}" / "test.csv").read_text(),
+                (self.folder / "single" / f"ts_{i}" / "test.csv").read_text(),
+            )
+        self.assertEqual(list(output.rglob(".*.tmp*")), [])
+
+    def test_resume_cli(self):
+        output = self.folder / "resumed"
+        self._interrupted_run(output, completed=1)
+        config = self.folder / "config.yaml"
+        config.write_text(yaml.dump(CONFIG))
+        main(
+            [
+                "--config-yaml",
+                str(config),
+                "--output-dir",
+                str(output),
+                "--seed",
+                "42",
+                "--addons",
+                "TimeEvalAddOn",
+                "--resume",
+            ]
+        )
+        for i in range(4):
+            self.assertTrue((output / f"ts_{i}" / "test.csv").is_file())
+        self.assertTrue((output / "overview.yaml").is_file())
+
+    def test_no_journal_by_default(self):
+        _gutentag().generate(output_folder=self.folder)
+        self.assertFalse((self.folder / RunJournal.FILENAME).exists())
+        self.assertEqual(list(self.folder.rglob(GenerationCache.MARKER_FILENAME)), [])
+
+    def test_resume_requires_seed(self):
+        with self.assertRaises(ValueError):
+            GutenTAG.from_dict(CONFIG).generate(output_folder=self.folder, resume=True)
+
+    def test_truncated_journal_line_is_ignored(self):
+        self._interrupted_run(self.folder, completed=2)
+        journal = self.folder / RunJournal.FILENAME
+        lines = journal.read_text().splitlines()
+        self.assertEqual(len(lines), 2)
+        # simulate a crash while appending the second entry
+        journal.write_text(lines[0] + "\n" + lines[1][:20])
+        self.assertEqual(len(RunJournal(self.folder).entries), 1)
+
+        _gutentag().generate(output_folder=self.folder, resume=True)
+        self.assertEqual(len(RunJournal(self.folder).entries), 4)
+
+    def test_atomic_path_keeps_previous_file_on_failure(self):
+        path = self.folder / "data.csv"
+        path.write_text("complete")
+        with self.assertRaises(RuntimeError):
+            with atomic_path(path) as tmp:
+                tmp.write_text("trunc")
+                raise RuntimeError()
+        self.assertEqual(path.read_text(), "complete")
+        self.assertEqual(list(self.folder.iterdir()), [path])
@@ -0,0 +1,102 @@
+import tempfile
+import unittest
+from pathlib import Path
+from typing import Optional, Tuple
+
+from gutenTAG import GutenTAG
+from gutenTAG.__main__ import main
+from gutenTAG.sharding import assign_shards, merge_shards, parse_shard
+
+
+def _config(n: int = 7) -> dict:
+    return {
+        "timeseries": [
+            {
+                "name": f"ts_{i}",
+                "length": 100 * (i + 1),
+                "semi-supervised": i % 2 == 0,
+                "base-oscillations": [{"kind": "random-walk"}],
+                "anomalies": [
+                    {"length": 10, "kinds": [{"kind": "platform", "value": 0}]}
+                ],
+            }
+            for i in range(n)
+        ]
+    }
+
+
+def _generate(
+    output_folder: Path,
+    shard: Optional[Tuple[int, int]] = None,
+    strategy: str = "hash",
+) -> None:
+    gt = GutenTAG.from_dict(_config(), seed=42, addons=["TimeEvalAddOn"])
+    if shard is not None:
+        gt.shard(*shard, strategy=strategy)
+    gt.generate(output_folder=output_folder)
+
+
+class TestSharding(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.folder = Path(self.tmp.name)
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def test_parse_shard(self):
+        self.assertEqual(parse_shard("2/4"), (2, 4))
+        for spec in ["0/4", "5/4", "1", "a/b"]:
+            with self.assertRaises(ValueError):
+                parse_shard(spec)
+
+    def test_shards_are_disjoint_and_complete(self):
+        timeseries = GutenTAG.from_dict(_config())._timeseries
+        for strategy in ["hash", "cost"]:
+            names = []
+            for index in range(1, 4):
+                gt = GutenTAG.from_dict(_config()).shard(index, 3, strategy=strategy)
+                names += [ts.dataset_name for ts in gt._timeseries]
+            self.assertCountEqual(names, [ts.dataset_name for ts in timeseries])
+
+    def test_cost_strategy_balances_shards(self):
+        timeseries = GutenTAG.from_dict(_config())._timeseries
+        self.assertEqual(
+            assign_shards(timeseries, 3, strategy="cost"), [3, 1, 3, 2, 2, 3, 1]
+        )
+
+    def test_merged_corpus_is_identical_to_single_run(self):
+        _generate(self.folder / "single")
+        for strategy in ["hash", "cost"]:
+            shard_dirs = [self.folder / f"{strategy}-{i}" for i in range(1, 4)]
+            for i, shard_dir in enumerate(shard_dirs, start=1):
+                _generate(shard_dir, (i, 3), strategy)
+            merged = self.folder / f"{strategy}-merged"
+            merge_shards(shard_dirs, merged)
+
+            for filename in ["overview.yaml", "datasets.csv"]:
+                self.assertEqual(
+                    (merged / filename).read_text(),
+                    (self.folder / "single" / filename).read_text(),
+                )
+            for i in range(7):
+                self.assertEqual(
+                    (merged / f"ts_{i}" / "test.csv").read_text(),
+                    (self.folder / "single" / f"ts_{i}" / "test.csv").read_text(),
+                )
+
+    def test_merge_cli(self):
+        shard_dirs = [self.folder / f"shard-{i}" for i in range(1, 3)]
+        for i, shard_dir in enumerate(shard_dirs, start=1):
+            _generate(shard_dir, (i, 2))
+        merged = self.folder / "merged"
+        main(["merge", "--move", "--output-dir", str(merged), *map(str, shard_dirs)])
+        self.assertTrue((merged / "overview.yaml").is_file())
+        for i in range(7):
+            self.assertTrue((merged / f"ts_{i}" / "test.csv").is_file())
+
+    def test_merge_requires_all_shards(self):
+        shard_dir = self.folder / "shard-1"
+        _generate(shard_dir, (1, 2))
+        with self.assertRaises(ValueError):
+            merge_shards([shard_dir], self.folder / "merged")
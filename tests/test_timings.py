@@ -0,0 +1,117 @@
+import json
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+import pandas as pd
+
+from gutenTAG import GutenTAG
+from gutenTAG.utils.diagnostics import LOGGER_NAME
+from gutenTAG.utils.timings import Timings
+
+CONFIG = {
+    "timeseries": [
+        {
+            "name": f"ts_{i}",
+            "length": 200,
+            "semi-supervised": True,
+            "base-oscillations": [
+                {"kind": "sine", "trend": {"kind": "polynomial", "polynomial": [1, 2]}},
+                {"kind": "random-walk"},
+            ],
+            "anomalies": [
+                {
+                    "length": 10,
+                    "channel": 1,
+                    "kinds": [{"kind": "platform", "value": 0}],
+                }
+            ],
+        }
+        for i in range(2)
+    ]
+}
+
+
+class TestTimings(unittest.TestCase):
+    def test_bound_recorders_share_records(self):
+        timings = Timings(dataset="ts")
+        with timings.bind(channel=1).measure("noise"):
+            pass
+        self.assertEqual(len(timings.records), 1)
+        record = timings.records[0]
+        self.assertEqual(record["dataset"], "ts")
+        self.assertEqual(record["channel"], 1)
+        self.assertEqual(record["stage"], "noise")
+        self.assertGreaterEqual(record["duration"], 0)
+
+    def test_concurrent_recording(self):
+        timings = Timings(dataset="ts")
+
+        def measure(channel: int) -> None:
+            bound = timings.bind(channel=channel)
+            for _ in range(1000):
+                with bound.measure("base"):
+                    pass
+
+        threads = [threading.Thread(target=measure, args=(c,)) for c in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(timings.records), 4000)
+
+    def test_disabled_recorder(self):
+        timings = Timings.disabled()
+        with timings.bind(channel=0).measure("base"):
+            pass
+        timings.extend([{"stage": "base", "duration": 1.0}])
+        self.assertEqual(timings.records, [])
+
+    def test_profile_generation(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            with self.assertLogs(LOGGER_NAME, level="INFO") as logs:
+                gt = GutenTAG.from_dict(CONFIG, seed=42, addons=["TimeEvalAddOn"])
+                gt.generate(output_folder=tmp, profile=True)
+                df = pd.read_csv(Path(tmp) / Timings.CSV_FILENAME)
+                aggregated = json.loads((Path(tmp) / Timings.JSON_FILENAME).read_text())
+
+        self.assertEqual(list(df.columns), list(Timings.COLUMNS))
+        self.assertEqual(set(df["dataset"].dropna()), {"ts_0", "ts_1"})
+        self.assertEqual(
+            set(df["stage"]),
+            {
+                "base",
+                "trend",
+                "noise",
+                "anomaly-placement",
+                "anomaly-kind",
+                "apply-anomalies",
+                "apply-variations",
+                "addon-process",
+                "addon-finalize",
+                "save",
+            },
+        )
+        base = df[(df["dataset"] == "ts_0") & (df["stage"] == "base")]
+        self.assertEqual(set(base["channel"]), {0, 1})
+        self.assertEqual(set(base["variant"]), {"test", "train-no-anomaly"})
+        self.assertEqual(set(base["detail"]), {"sine", "random-walk"})
+        self.assertEqual(set(aggregated["datasets"]), {"ts_0", "ts_1"})
+        self.assertAlmostEqual(aggregated["total"], df["duration"].sum())
+        (summary,) = logs.output
+        self.assertIn("Slowest datasets", summary)
+        self.assertIn("Slowest stages", summary)
+
+    def test_profile_parallel_generation(self):
+        with tempfile.TemporaryDirectory() as tmp, self.assertLogs(LOGGER_NAME, "INFO"):
+            GutenTAG.from_dict(CONFIG, n_jobs=2, seed=42).generate(
+                output_folder=tmp, profile=True
+            )
+            df = pd.read_csv(Path(tmp) / Timings.CSV_FILENAME)
+        self.assertEqual(set(df["dataset"]), {"ts_0", "ts_1"})
+
+    def test_no_timings_by_default(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            GutenTAG.from_dict(CONFIG, seed=42).generate(output_folder=tmp)
+            self.assertFalse((Path(tmp) / Timings.CSV_FILENAME).exists())